@@ -0,0 +1,43 @@
+"""Add chat inbox columns (last message and read cursors)
+
+Revision ID: a6d2e8b4c091
+Revises: f3a9c1d7e240
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e8b4c091'
+down_revision: Union[str, None] = 'f3a9c1d7e240'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chats', sa.Column('last_message_id', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('chats', sa.Column('consumer_last_read_id', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('chats', sa.Column('vendor_last_read_id', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill: existing conversations start out fully read
+    op.execute("""
+        UPDATE chats SET last_message_id = COALESCE(
+            (SELECT MAX(m.id) FROM messages m WHERE m.chat_id = chats.id), 0
+        )
+    """)
+    op.execute("UPDATE chats SET consumer_last_read_id = last_message_id, vendor_last_read_id = last_message_id")
+
+    op.create_index('ix_chats_consumer_recent', 'chats', ['consumer_id', 'last_message_id', 'id'], unique=False)
+    op.create_index('ix_chats_vendor_recent', 'chats', ['vendor_id', 'last_message_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chats_vendor_recent', table_name='chats')
+    op.drop_index('ix_chats_consumer_recent', table_name='chats')
+    op.drop_column('chats', 'vendor_last_read_id')
+    op.drop_column('chats', 'consumer_last_read_id')
+    op.drop_column('chats', 'last_message_id')
@@ -0,0 +1,36 @@
+"""Add composite indexes for hot query paths
+
+Revision ID: b7e2c91d4a10
+Revises: f12abcde3456
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c91d4a10'
+down_revision: Union[str, None] = 'f12abcde3456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_vendor_bids_event_status', 'vendor_bids', ['event_id', 'status', 'inactive'], unique=False)
+    op.create_index('ix_vendor_bids_vendor_event', 'vendor_bids', ['vendor_id', 'event_id', 'inactive'], unique=False)
+    op.create_index('ix_vendor_notifications_vendor_read_created', 'vendor_notifications', ['vendor_id', 'is_read', 'created_at'], unique=False)
+    op.create_index('ix_vendor_orders_vendor_status_confirmed', 'vendor_orders', ['vendor_id', 'status', 'confirmed_at'], unique=False)
+    op.create_index('ix_events_bidding_status_inactive', 'events', ['bidding_status', 'inactive'], unique=False)
+    op.create_index('ix_messages_chat_id', 'messages', ['chat_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_chat_id', table_name='messages')
+    op.drop_index('ix_events_bidding_status_inactive', table_name='events')
+    op.drop_index('ix_vendor_orders_vendor_status_confirmed', table_name='vendor_orders')
+    op.drop_index('ix_vendor_notifications_vendor_read_created', table_name='vendor_notifications')
+    op.drop_index('ix_vendor_bids_vendor_event', table_name='vendor_bids')
+    op.drop_index('ix_vendor_bids_event_status', table_name='vendor_bids')
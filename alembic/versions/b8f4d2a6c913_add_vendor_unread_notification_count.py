@@ -0,0 +1,38 @@
+"""Add maintained unread notification counter to vendors
+
+Revision ID: b8f4d2a6c913
+Revises: a6d2e8b4c091
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f4d2a6c913'
+down_revision: Union[str, None] = 'a6d2e8b4c091'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('vendors', sa.Column('unread_notification_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from existing notifications
+    op.execute(
+        """
+        UPDATE vendors SET
+            unread_notification_count = (
+                SELECT COUNT(*) FROM vendor_notifications
+                WHERE vendor_notifications.vendor_id = vendors.id
+                AND vendor_notifications.is_read = 0
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('vendors', 'unread_notification_count')
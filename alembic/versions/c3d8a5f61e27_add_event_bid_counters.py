@@ -0,0 +1,51 @@
+"""Add denormalized bid counters to events
+
+Revision ID: c3d8a5f61e27
+Revises: b7e2c91d4a10
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8a5f61e27'
+down_revision: Union[str, None] = 'b7e2c91d4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('bid_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('events', sa.Column('submitted_bid_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('events', sa.Column('shortlisted_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from existing bids
+    op.execute(
+        """
+        UPDATE events SET
+            bid_count = (
+                SELECT COUNT(*) FROM vendor_bids
+                WHERE vendor_bids.event_id = events.id AND vendor_bids.inactive = 0
+            ),
+            submitted_bid_count = (
+                SELECT COUNT(*) FROM vendor_bids
+                WHERE vendor_bids.event_id = events.id AND vendor_bids.inactive = 0
+                AND vendor_bids.status = 'submitted'
+            ),
+            shortlisted_count = (
+                SELECT COUNT(*) FROM vendor_bids
+                WHERE vendor_bids.event_id = events.id AND vendor_bids.inactive = 0
+                AND vendor_bids.shortlisted = 1
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'shortlisted_count')
+    op.drop_column('events', 'submitted_bid_count')
+    op.drop_column('events', 'bid_count')
@@ -0,0 +1,60 @@
+"""Sum platform analytics from vendor rollups at read time
+
+Revision ID: c7e1f5a3b842
+Revises: b8f4d2a6c913
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1f5a3b842'
+down_revision: Union[str, None] = 'b8f4d2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_vendor_daily_rollups_day', 'vendor_daily_rollups', ['day'], unique=False)
+
+    op.drop_index('ux_platform_daily_rollups_day', table_name='platform_daily_rollups')
+    op.drop_index(op.f('ix_platform_daily_rollups_id'), table_name='platform_daily_rollups')
+    op.drop_table('platform_daily_rollups')
+
+
+def downgrade() -> None:
+    op.create_table('platform_daily_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders_confirmed', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('bids_submitted', sa.Integer(), nullable=False),
+        sa.Column('bids_pending', sa.Integer(), nullable=False),
+        sa.Column('bids_won', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_by', sa.String(length=100), nullable=True),
+        sa.Column('modified_by', sa.String(length=100), nullable=True),
+        sa.Column('inactive', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_platform_daily_rollups_id'), 'platform_daily_rollups', ['id'], unique=False)
+    op.create_index('ux_platform_daily_rollups_day', 'platform_daily_rollups', ['day'], unique=True)
+
+    # Backfill from the vendor rows
+    op.execute(
+        """
+        INSERT INTO platform_daily_rollups
+            (day, orders_confirmed, revenue, bids_submitted, bids_pending, bids_won)
+        SELECT day, SUM(orders_confirmed), SUM(revenue), SUM(bids_submitted), SUM(bids_pending), SUM(bids_won)
+        FROM vendor_daily_rollups
+        GROUP BY day
+        """
+    )
+
+    op.drop_index('ix_vendor_daily_rollups_day', table_name='vendor_daily_rollups')
@@ -0,0 +1,31 @@
+"""Add stored auto_score to vendor_bids
+
+Revision ID: d41f7b2c9e83
+Revises: c3d8a5f61e27
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f7b2c9e83'
+down_revision: Union[str, None] = 'c3d8a5f61e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing bids are left NULL here so the migration does not depend on
+    # application code that may change after it is written. Backfill them
+    # with: python -m app.jobs.rescore_bids
+    op.add_column('vendor_bids', sa.Column('auto_score', sa.Numeric(precision=5, scale=2), nullable=True))
+    op.create_index('ix_vendor_bids_event_auto_score', 'vendor_bids', ['event_id', 'auto_score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vendor_bids_event_auto_score', table_name='vendor_bids')
+    op.drop_column('vendor_bids', 'auto_score')
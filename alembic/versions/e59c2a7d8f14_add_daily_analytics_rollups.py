@@ -0,0 +1,98 @@
+"""Add daily analytics rollup tables
+
+Revision ID: e59c2a7d8f14
+Revises: d41f7b2c9e83
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e59c2a7d8f14'
+down_revision: Union[str, None] = 'd41f7b2c9e83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _audit_columns():
+    return [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_by', sa.String(length=100), nullable=True),
+        sa.Column('modified_by', sa.String(length=100), nullable=True),
+        sa.Column('inactive', sa.Boolean(), nullable=True),
+    ]
+
+
+def _metric_columns():
+    return [
+        sa.Column('orders_confirmed', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('bids_submitted', sa.Integer(), nullable=False),
+        sa.Column('bids_pending', sa.Integer(), nullable=False),
+        sa.Column('bids_won', sa.Integer(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('vendor_daily_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('vendor_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        *_metric_columns(),
+        *_audit_columns(),
+        sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_vendor_daily_rollups_id'), 'vendor_daily_rollups', ['id'], unique=False)
+    op.create_index('ux_vendor_daily_rollups_vendor_day', 'vendor_daily_rollups', ['vendor_id', 'day'], unique=True)
+
+    op.create_table('platform_daily_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        *_metric_columns(),
+        *_audit_columns(),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_platform_daily_rollups_id'), 'platform_daily_rollups', ['id'], unique=False)
+    op.create_index('ux_platform_daily_rollups_day', 'platform_daily_rollups', ['day'], unique=True)
+
+    op.create_table('event_daily_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('events', sa.Integer(), nullable=False),
+        *_audit_columns(),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_daily_rollups_id'), 'event_daily_rollups', ['id'], unique=False)
+    op.create_index('ux_event_daily_rollups_day_category_status', 'event_daily_rollups', ['day', 'category_id', 'status'], unique=True)
+
+    op.create_index('ix_events_event_date', 'events', ['event_date'], unique=False)
+    op.create_index('ix_vendor_orders_status_confirmed', 'vendor_orders', ['status', 'confirmed_at'], unique=False)
+
+    # Populate from existing data with: python -m app.jobs.compact_analytics_rollups
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vendor_orders_status_confirmed', table_name='vendor_orders')
+    op.drop_index('ix_events_event_date', table_name='events')
+
+    op.drop_index('ux_event_daily_rollups_day_category_status', table_name='event_daily_rollups')
+    op.drop_index(op.f('ix_event_daily_rollups_id'), table_name='event_daily_rollups')
+    op.drop_table('event_daily_rollups')
+
+    op.drop_index('ux_platform_daily_rollups_day', table_name='platform_daily_rollups')
+    op.drop_index(op.f('ix_platform_daily_rollups_id'), table_name='platform_daily_rollups')
+    op.drop_table('platform_daily_rollups')
+
+    op.drop_index('ux_vendor_daily_rollups_vendor_day', table_name='vendor_daily_rollups')
+    op.drop_index(op.f('ix_vendor_daily_rollups_id'), table_name='vendor_daily_rollups')
+    op.drop_table('vendor_daily_rollups')
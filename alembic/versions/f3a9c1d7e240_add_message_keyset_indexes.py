@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes for chat messages
+
+Revision ID: f3a9c1d7e240
+Revises: e59c2a7d8f14
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d7e240'
+down_revision: Union[str, None] = 'e59c2a7d8f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (chat_id, id) replaces (chat_id); created first so the chat_id FK keeps an index
+    op.create_index('ix_messages_chat_id_id', 'messages', ['chat_id', 'id'], unique=False)
+    op.create_index('ix_messages_chat_id_timestamp', 'messages', ['chat_id', 'timestamp'], unique=False)
+    op.drop_index('ix_messages_chat_id', table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index('ix_messages_chat_id', 'messages', ['chat_id'], unique=False)
+    op.drop_index('ix_messages_chat_id_timestamp', table_name='messages')
+    op.drop_index('ix_messages_chat_id_id', table_name='messages')
@@ -6,8 +6,25 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     SECRET_KEY: str
 
+    # Optional; derived from DATABASE_URL (aiomysql/aiosqlite) when empty
+    ASYNC_DATABASE_URL: str = ""
+
+    # CONNECTION POOL (applies to the sync and the async engine separately)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30          # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True      # test connections on checkout
+
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Trust identity claims in the JWT instead of loading the user per request
+    AUTH_STATELESS: bool = False
+
+    # PASSWORD HASHING (existing hashes are upgraded on login when rounds change)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64   # queued + running before returning 503
 
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
@@ -22,6 +39,27 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
 
+    # PERMISSION CACHE (per-role permission sets)
+    PERMISSION_CACHE_TTL_SECONDS: int = 300
+
+    # ANALYTICS RESPONSE CACHE (Redis URL shares it between workers; empty = in-process)
+    ANALYTICS_CACHE_TTL_SECONDS: int = 120
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 2048
+    ANALYTICS_CACHE_REDIS_URL: str = ""
+
+    # CHAT WEBSOCKETS (Redis URL fans messages out across workers; empty = in-process)
+    CHAT_WS_QUEUE_SIZE: int = 100            # messages buffered per socket before it is dropped
+    CHAT_WS_SEND_TIMEOUT_SECONDS: int = 10
+    CHAT_BROKER_REDIS_URL: str = ""
+
+    # VENDOR NOTIFICATION STREAM (SSE)
+    NOTIFICATION_SSE_HEARTBEAT_SECONDS: int = 15
+    NOTIFICATION_SSE_QUEUE_SIZE: int = 100      # events buffered per stream before it is closed
+    NOTIFICATION_SSE_RESUME_LIMIT: int = 200    # notifications replayed after Last-Event-ID
+
+    # VENDOR MATCH INDEX (seconds between background rebuilds, 0 = never)
+    VENDOR_INDEX_REFRESH_SECONDS: int = 300
+
     # THIS IS THE CORRECT WAY (Pydantic v2)
     model_config = SettingsConfigDict(
         env_file=".env",
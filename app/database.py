@@ -1,17 +1,133 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from app.config import settings
+from app.utils.metrics_utils import metrics
+
+
+# -------------------------
+# POOL INSTRUMENTATION
+# -------------------------
+class _InstrumentedPoolMixin:
+    """Times every checkout (including time spent waiting for a free slot)"""
+
+    metrics_prefix = "db.pool"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            metrics.counter(f"{self.metrics_prefix}.timeouts").inc()
+            raise
+        finally:
+            metrics.timer(f"{self.metrics_prefix}.checkout_wait").observe(time.perf_counter() - start)
+
+        if self.overflow() > 0:
+            metrics.counter(f"{self.metrics_prefix}.overflow_checkouts").inc()
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics_prefix = "db.pool"
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_prefix = "db.async_pool"
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    # SQLite (tests) keeps SQLAlchemy's default single-connection pools
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def _register_pool_metrics(pool, prefix: str):
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_conn, record):
+        metrics.counter(f"{prefix}.connects").inc()
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        metrics.counter(f"{prefix}.checkouts").inc()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exception):
+        metrics.counter(f"{prefix}.invalidated").inc()
+
+    def _status():
+        if not isinstance(pool, QueuePool):
+            return {"class": type(pool).__name__}
+        return {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        }
+
+    metrics.gauge(prefix, _status)
+
 
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=False
+    echo=False,
+    **_pool_options(settings.DATABASE_URL, InstrumentedQueuePool)
 )
+_register_pool_metrics(engine.pool, "db.pool")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers used when ASYNC_DATABASE_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+_async_url = get_async_database_url()
+async_engine = create_async_engine(
+    _async_url,
+    echo=False,
+    **_pool_options(_async_url, InstrumentedAsyncQueuePool)
+)
+_register_pool_metrics(async_engine.sync_engine.pool, "db.async_pool")
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 def get_db():
@@ -19,4 +135,8 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,15 +1,79 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.config import settings
+from app.database import get_db, get_async_db
 from app.utils.jwt_utils import decode_access_token
-from app.utils.permission_utils import check_permission
+from app.utils.permission_utils import get_role_permission_codes
+from app.utils.token_revocation import token_revocation
 from app.models.user_m import User
 
 security = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
+optional_security = OAuth2PasswordBearer(tokenUrl="/api/auth/token", auto_error=False)
 
-async def get_current_user(
+
+class _RoleRef:
+    """Role id/code from the token; other attributes come from the DB role"""
+
+    def __init__(self, principal: "AuthenticatedUser", role_id: int, code: str):
+        self._principal = principal
+        self.id = role_id
+        self.code = code
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._principal.load().role, name)
+
+
+class AuthenticatedUser:
+    """
+    Identity resolved from token claims alone (AUTH_STATELESS mode).
+
+    Exposes the fields most routes use (id, username, email, role_id,
+    role.code, organization_id, vendor_id) without a query. Any other
+    attribute transparently loads the full User row on first access.
+    """
+
+    inactive = False
+
+    def __init__(self, payload: dict, db: Session):
+        self.id = int(payload["sub"])
+        self.username = payload.get("username")
+        self.email = payload.get("email")
+        self.role_id = payload.get("role_id")
+        self.organization_id = payload.get("org_id")
+        self.vendor_id = payload.get("vendor_id")
+        self.role = _RoleRef(self, self.role_id, payload["role_code"])
+        self._db = db
+        self._user: Optional[User] = None
+
+    def load(self) -> User:
+        if self._user is None:
+            self._user = self._db.query(User).filter(User.id == self.id).first()
+            if self._user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found or inactive"
+                )
+        return self._user
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
+def can_use_stateless_identity(payload: dict) -> bool:
+    """Token carries identity claims and the user has not changed since it was issued"""
+    if not settings.AUTH_STATELESS or "role_code" not in payload:
+        return False
+    return not token_revocation.is_stale(int(payload["sub"]), payload.get("iat"))
+
+
+def get_current_user(
     token: str = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -27,7 +91,11 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload"
         )
+
+    if can_use_stateless_identity(payload):
+        return AuthenticatedUser(payload, db)
     
+    # Fallback: DB-backed identity
     user = db.query(User).filter(
         User.id == user_id,
         User.inactive == False
@@ -41,7 +109,7 @@ async def get_current_user(
     
     return user
 
-async def get_current_active_user(
+def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
     if current_user.inactive:
@@ -52,6 +120,62 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_user_async(
+    token: str = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    get_current_active_user for handlers on AsyncSession: the user is
+    loaded with an awaited primary-key get instead of a blocking query.
+    """
+    payload = decode_access_token(token)
+
+    if payload is None or payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+
+    user = await db.get(User, int(payload["sub"]))
+
+    if user is None or user.inactive:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive"
+        )
+
+    return user
+
+
+
+# ----------------------------
+# TOKEN IN THE QUERY STRING
+# ----------------------------
+# Only for clients that cannot send an Authorization header (EventSource).
+# Query strings are written to access logs by proxies and servers, so a
+# token passed this way should be short-lived, and the logs for these
+# routes should strip it.
+def get_header_or_query_token(
+    header_token: Optional[str] = Depends(optional_security),
+    token: Optional[str] = Query(None, description="Access token, for clients that can't send headers")
+) -> str:
+    if header_token or token:
+        return header_token or token
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def get_current_active_user_from_query(
+    token: str = Depends(get_header_or_query_token),
+    db: Session = Depends(get_db)
+) -> User:
+    """get_current_active_user, also accepting ?token= when no header is sent"""
+    return get_current_active_user(get_current_user(token, db))
+
+
 # NEW: Permission checker dependency
 class PermissionChecker:
     def __init__(self, required_permissions: List[str]):
@@ -62,12 +186,16 @@ class PermissionChecker:
         current_user: User = Depends(get_current_active_user),
         db: Session = Depends(get_db)
     ):
+        return self.check(current_user, db)
+
+    def check(self, current_user: User, db: Session):
         # SuperAdmin bypass (optional)
         if current_user.role.code == "SUPERADMIN":
             return current_user
         
+        granted = get_role_permission_codes(db, current_user.role_id)
         for permission_code in self.required_permissions:
-            if not check_permission(db, current_user.role_id, permission_code):
+            if permission_code not in granted:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"Missing required permission: {permission_code}"
@@ -75,7 +203,18 @@ class PermissionChecker:
         
         return current_user
 
-async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
+
+class QueryTokenPermissionChecker(PermissionChecker):
+    """PermissionChecker for routes that also take the token as ?token="""
+
+    def __call__(
+        self,
+        current_user: User = Depends(get_current_active_user_from_query),
+        db: Session = Depends(get_db)
+    ):
+        return self.check(current_user, db)
+
+def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
     if current_user.role.code not in ["ADMIN", "SUPERADMIN"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -83,7 +222,7 @@ async def get_admin_user(current_user: User = Depends(get_current_active_user))
         )
     return current_user
 
-async def get_customer_user(current_user: User = Depends(get_current_active_user)) -> User:
+def get_customer_user(current_user: User = Depends(get_current_active_user)) -> User:
     if current_user.role.code != "CUSTOMER" and current_user.role.code not in ["ADMIN", "SUPERADMIN"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
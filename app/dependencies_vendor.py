@@ -3,6 +3,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.dependencies import can_use_stateless_identity
 from app.utils.jwt_utils import decode_access_token
 from app.models.user_m import User
 from app.models.vendor_m import Vendor
@@ -10,7 +11,33 @@ from app.models.vendor_m import Vendor
 security = OAuth2PasswordBearer(tokenUrl="/api/auth/vendor/token")
 
 
-async def get_current_vendor(
+class AuthenticatedVendor:
+    """
+    Vendor identity taken from token claims (AUTH_STATELESS mode).
+    Attributes other than id/user_id/status load the Vendor row lazily.
+    """
+
+    def __init__(self, payload: dict, db: Session):
+        self.id = payload["vendor_id"]
+        self.user_id = int(payload["sub"])
+        self.status = payload.get("vendor_status")
+        self._db = db
+        self._vendor = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._vendor is None:
+            self._vendor = self._db.query(Vendor).filter(Vendor.id == self.id).first()
+            if self._vendor is None:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Vendor profile not found"
+                )
+        return getattr(self._vendor, name)
+
+
+def get_current_vendor(
     token: str = Depends(security),
     db: Session = Depends(get_db)
 ) -> Vendor:
@@ -35,7 +62,10 @@ async def get_current_vendor(
             detail="Invalid token payload"
         )
 
-    # verify user exists
+    if payload.get("vendor_id") and can_use_stateless_identity(payload):
+        return AuthenticatedVendor(payload, db)
+
+    # Fallback: verify user exists
     user = db.query(User).filter(
         User.id == user_id,
         User.inactive == False
@@ -61,7 +91,7 @@ async def get_current_vendor(
     return vendor
 
 
-async def get_current_approved_vendor(
+def get_current_approved_vendor(
     vendor: Vendor = Depends(get_current_vendor)
 ):
     if vendor.status != "approved":
@@ -0,0 +1,40 @@
+import sys
+from datetime import datetime, timedelta
+
+from app.database import SessionLocal
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+
+def compact_analytics_rollups(days: int = None):
+    """
+    Rebuild the daily analytics rollups from source tables.
+
+    With days, only the trailing window is rebuilt (periodic run, catches
+    bulk UPDATEs that bypass the ORM); without it, the whole history.
+    """
+    db = SessionLocal()
+
+    try:
+        day_from = None
+        if days:
+            day_from = datetime.utcnow().date() - timedelta(days=days)
+            print(f"🔄 Compacting analytics rollups for the last {days} days...")
+        else:
+            print("🔄 Rebuilding analytics rollups for the full history...")
+
+        processed = AnalyticsRollupService.compact(db, day_from=day_from)
+        print(f"✅ Rollups rebuilt for {processed} days")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # python -m app.jobs.compact_analytics_rollups [days]
+    compact_analytics_rollups(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,25 @@
+from app.database import SessionLocal
+from app.services.event_bid_counter_service import EventBidCounterService
+
+
+def reconcile_bid_counters():
+    """Rebuild Event.bid_count / submitted_bid_count / shortlisted_count from vendor_bids"""
+    db = SessionLocal()
+
+    try:
+        print("🔄 Reconciling event bid counters...")
+        processed = EventBidCounterService.reconcile(db)
+        print(f"✅ Bid counters rebuilt for {processed} events")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_bid_counters()
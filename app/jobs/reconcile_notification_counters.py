@@ -0,0 +1,25 @@
+from app.database import SessionLocal
+from app.services.vendor_notification_counter_service import VendorNotificationCounterService
+
+
+def reconcile_notification_counters():
+    """Rebuild Vendor.unread_notification_count from vendor_notifications"""
+    db = SessionLocal()
+
+    try:
+        print("🔄 Reconciling vendor unread notification counters...")
+        processed = VendorNotificationCounterService.reconcile(db)
+        print(f"✅ Unread counters rebuilt for {processed} vendors")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_notification_counters()
@@ -0,0 +1,25 @@
+from app.database import SessionLocal
+from app.services.bid_scoring_service import BidScoringService
+
+
+def rescore_bids():
+    """Recompute VendorBid.auto_score for every bid (backfill / repair)"""
+    db = SessionLocal()
+
+    try:
+        print("🔄 Rescoring vendor bids...")
+        processed = BidScoringService.reconcile_stored_scores(db)
+        print(f"✅ Auto scores refreshed for {processed} bids")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rescore_bids()
@@ -4,10 +4,11 @@ from contextlib import asynccontextmanager
 from app.config import settings
 
 # DB
-from app.database import engine, Base
+from app.database import engine, Base, SessionLocal
 from app.seeders.seed_data import seed_database
 from app.seeders.service_seeder import seed_services
 from app.seeders.category_event_type_seeder import seed_categories_and_event_types
+from app.services.vendor_match_index import vendor_match_index
 # Core Admin Routes
 from app.routes import (auth_route,user_route,organization_route,branch_route,role_route,menu_route,category_route,
     event_type_route, event_route,  event_manager_route,service_route,consumer_event_route,
@@ -36,8 +37,18 @@ async def lifespan(app: FastAPI):
     # seed_services()
     # seed_categories_and_event_types()
 
+    db = SessionLocal()
+    try:
+        indexed = vendor_match_index.warm(db)
+        print(f"🔎 Vendor match index warmed with {indexed} vendors")
+    finally:
+        db.close()
+    vendor_match_index.start_refresher(SessionLocal)
+
     yield
 
+    vendor_match_index.stop_refresher()
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
@@ -138,6 +149,10 @@ app.include_router(admin_dashboard_api.router)
 app.include_router(vendor_dashboard_api.router)
 app.include_router(consumer_dashboard_api.router)
 
+# ---- Runtime Metrics ----
+from app.routes.metrics_route import router as metrics_router
+app.include_router(metrics_router, prefix="/api")
+
 
 # -------------------------
 # HEALTH / ROOT
@@ -27,6 +27,7 @@ from .service_m import Service
 from .vendor_notification_m import VendorNotification
 from .review_m import Review
 from .chat_m import Chat, Message
+from .analytics_rollup_m import VendorDailyRollup, EventDailyRollup
 # DO NOT IMPORT vendor models here !!
 # They auto-register because routes import them and SQLAlchemy discovers them.
 
@@ -59,5 +60,7 @@ __all__ = [
     "VendorNotification",
     "Review",
     "Chat",
-    "Message"
+    "Message",
+    "VendorDailyRollup",
+    "EventDailyRollup"
 ]
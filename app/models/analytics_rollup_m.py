@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Index
+from app.models.base_model import BaseModel
+
+
+# ----------------------------
+# DAILY ANALYTICS ROLLUPS
+# ----------------------------
+# Maintained by AnalyticsRollupService (incrementally on commit and by the
+# compaction job); dashboards read these instead of scanning history.
+
+class VendorDailyRollup(BaseModel):
+    __tablename__ = "vendor_daily_rollups"
+    __table_args__ = (
+        Index("ux_vendor_daily_rollups_vendor_day", "vendor_id", "day", unique=True),
+        # platform totals are summed over all vendors by day range
+        Index("ix_vendor_daily_rollups_day", "day"),
+    )
+
+    vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    orders_confirmed = Column(Integer, nullable=False, default=0)  # by confirmed_at
+    revenue = Column(Float, nullable=False, default=0.0)           # confirmed order amount
+    bids_submitted = Column(Integer, nullable=False, default=0)    # by submitted_at
+    bids_pending = Column(Integer, nullable=False, default=0)      # still "submitted", by submitted_at
+    bids_won = Column(Integer, nullable=False, default=0)          # accepted/selected, by selected_at
+
+
+class EventDailyRollup(BaseModel):
+    __tablename__ = "event_daily_rollups"
+    __table_args__ = (
+        Index("ux_event_daily_rollups_day_category_status", "day", "category_id", "status", unique=True),
+    )
+
+    day = Column(Date, nullable=False)  # event_date
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    status = Column(String(20), nullable=False)
+
+    events = Column(Integer, nullable=False, default=0)
@@ -1,15 +1,26 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 from datetime import datetime
 
 class Chat(BaseModel):
     __tablename__ = "chats"
+    __table_args__ = (
+        # Inbox: a participant's chats by recency (keyset on last_message_id, id)
+        Index("ix_chats_consumer_recent", "consumer_id", "last_message_id", "id"),
+        Index("ix_chats_vendor_recent", "vendor_id", "last_message_id", "id"),
+    )
 
     consumer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=True)
 
+    # Maintained by ChatService.send_message / mark_read (0 = none yet).
+    # Message ids grow over time, so last_message_id doubles as recency.
+    last_message_id = Column(Integer, nullable=False, default=0, server_default="0")
+    consumer_last_read_id = Column(Integer, nullable=False, default=0, server_default="0")
+    vendor_last_read_id = Column(Integer, nullable=False, default=0, server_default="0")
+
     consumer = relationship("User", backref="chats")
     vendor = relationship("Vendor", backref="chats")
     event = relationship("Event", backref="chat")
@@ -17,6 +28,12 @@ class Chat(BaseModel):
 
 class Message(BaseModel):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Keyset pagination: WHERE chat_id = ? AND id < / > cursor ORDER BY id
+        Index("ix_messages_chat_id_id", "chat_id", "id"),
+        # Incremental sync: WHERE chat_id = ? AND timestamp > since
+        Index("ix_messages_chat_id_timestamp", "chat_id", "timestamp"),
+    )
 
     chat_id = Column(Integer, ForeignKey("chats.id"), nullable=False)
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=False) # Can be consumer or vendor (linked to user_id)
@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, Enum, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 import enum
@@ -23,6 +23,12 @@ class BiddingStatus(str, enum.Enum):
 
 class Event(BaseModel):
     __tablename__ = "events"
+    __table_args__ = (
+        # open-for-bidding feeds and admin review lists
+        Index("ix_events_bidding_status_inactive", "bidding_status", "inactive"),
+        # analytics rollups rebuild events by day
+        Index("ix_events_event_date", "event_date"),
+    )
 
     # Organization (Consumer who created the event)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -69,6 +75,11 @@ class Event(BaseModel):
     selected_vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=True)
     selected_bid_id = Column(Integer, ForeignKey("vendor_bids.id", use_alter=True, name="fk_events_vendor_bids_id"), nullable=True)
     vendor_selected_at = Column(DateTime, nullable=True)
+
+    # Denormalized bid counters (maintained by EventBidCounterService)
+    bid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    submitted_bid_count = Column(Integer, nullable=False, default=0, server_default="0")
+    shortlisted_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Relationships
     organization = relationship("Organization")
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, JSON, Boolean, Text
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, JSON, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 
 
 class VendorBid(BaseModel):
     __tablename__ = "vendor_bids"
+    __table_args__ = (
+        # bids of an event by status (admin review, counts)
+        Index("ix_vendor_bids_event_status", "event_id", "status", "inactive"),
+        # "has this vendor already bid on the event" and vendor bid lists
+        Index("ix_vendor_bids_vendor_event", "vendor_id", "event_id", "inactive"),
+        # top-K bids of an event by stored auto score
+        Index("ix_vendor_bids_event_auto_score", "event_id", "auto_score"),
+    )
 
     # ----------------------------
     # CORE RELATIONS
@@ -57,6 +65,7 @@ class VendorBid(BaseModel):
     # ADMIN REVIEW FIELDS
     # ----------------------------
     admin_score = Column(Numeric(5, 2), nullable=True)  # 0-100
+    auto_score = Column(Numeric(5, 2), nullable=True)  # 0-100, kept current by BidScoringService
     admin_notes = Column(Text, nullable=True)
     shortlisted = Column(Boolean, default=False)
     shortlisted_rank = Column(Integer, nullable=True)  # 1, 2, or 3
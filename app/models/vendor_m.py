@@ -37,6 +37,9 @@ class Vendor(BaseModel):
     rating = Column(Numeric(3, 2),nullable=False, default=0.0)  # 0.00 to 5.00
     total_reviews = Column(Integer,nullable=False, default=0)
     completed_events = Column(Integer,nullable=False, default=0)
+
+    # Unread vendor_notifications (maintained by VendorNotificationCounterService)
+    unread_notification_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # NEW: Service Areas (cities/states they operate in)
     service_areas = Column(JSON, nullable=True)  # ["Mumbai", "Pune", "Delhi"]
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel
 
 
 class VendorNotification(BaseModel):
     __tablename__ = "vendor_notifications"
+    __table_args__ = (
+        # notification list / unread count per vendor, newest first
+        Index("ix_vendor_notifications_vendor_read_created", "vendor_id", "is_read", "created_at"),
+    )
     
     vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=True)
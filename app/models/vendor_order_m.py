@@ -1,12 +1,18 @@
 # app/models/vendor_order_m.py
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.models.base_model import BaseModel   # use Base
 
 
 class VendorOrder(BaseModel):
     __tablename__ = "vendor_orders"
+    __table_args__ = (
+        # vendor revenue / order stats over a date range
+        Index("ix_vendor_orders_vendor_status_confirmed", "vendor_id", "status", "confirmed_at"),
+        # platform-wide revenue by date (trends, rollup compaction)
+        Index("ix_vendor_orders_status_confirmed", "status", "confirmed_at"),
+    )
 
     vendor_id = Column(Integer, ForeignKey("vendors.id"), nullable=False)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=True)
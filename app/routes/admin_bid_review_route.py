@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database import get_db
 from app.services.admin_bid_review_service import AdminBidReviewService
+from app.services.bid_scoring_service import BidScoringService, WEIGHT_PROFILES
 from app.models.user_m import User
 from app.dependencies import get_current_active_user, PermissionChecker
 
@@ -11,7 +12,10 @@ from app.schemas.event_schema import ConsumerEventListSchema
 from app.schemas.vendor_bid_schema import (
     AdminEventBidReviewResponse,
     AdminShortlistSchema,
+    AdminAutoShortlistSchema,
     AdminScoreUpdateSchema,
+    AdminBidWhatIfSchema,
+    AdminBidWhatIfResponse,
 )
 
 router = APIRouter(
@@ -27,7 +31,7 @@ router = APIRouter(
     response_model=List[ConsumerEventListSchema],
     dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
 )
-async def get_events_for_review(
+def get_events_for_review(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -50,17 +54,64 @@ async def get_events_for_review(
     response_model=AdminEventBidReviewResponse,
     dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
 )
-async def get_bids_for_event(
+def get_bids_for_event(
     event_id: int,
+    profile: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
-    Get all bids for a specific event with vendor details and auto scores.
+    Get bids for a specific event with vendor details, best auto score first.
+    Optional `profile` selects the scoring weight profile and `limit`
+    returns only the top-K bids.
     """
     return AdminBidReviewService.get_bids_for_event(
         db=db,
         event_id=event_id,
+        profile=profile,
+        limit=limit,
+    )
+
+# ---------------------------------------------------------
+# SCORING PROFILES
+# ---------------------------------------------------------
+@router.get(
+    "/scoring/profiles",
+    dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
+)
+async def get_scoring_profiles(
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    List the available auto-score weight profiles.
+    """
+    return WEIGHT_PROFILES
+
+# ---------------------------------------------------------
+# WHAT-IF RE-RANKING
+# ---------------------------------------------------------
+@router.post(
+    "/events/{event_id}/what-if",
+    response_model=AdminBidWhatIfResponse,
+    dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
+)
+def what_if_ranking(
+    event_id: int,
+    data: AdminBidWhatIfSchema,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Re-rank an event's bids under a candidate weighting (explicit weights
+    or a named profile) and compare with the default ranking.
+    Nothing is persisted.
+    """
+    return BidScoringService.what_if(
+        db=db,
+        event_id=event_id,
+        weights=data.weights,
+        profile=data.profile,
     )
 
 # ---------------------------------------------------------
@@ -71,7 +122,7 @@ async def get_bids_for_event(
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(PermissionChecker(["admin.bid.update"]))],
 )
-async def shortlist_top_3_bids(
+def shortlist_top_3_bids(
     event_id: int,
     data: AdminShortlistSchema,
     db: Session = Depends(get_db),
@@ -88,6 +139,53 @@ async def shortlist_top_3_bids(
         admin_user=current_user,
     )
 
+# ---------------------------------------------------------
+# BULK SHORTLIST (N RANKED BIDS)
+# ---------------------------------------------------------
+@router.post(
+    "/events/{event_id}/shortlist/bulk",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(PermissionChecker(["admin.bid.update"]))],
+)
+def shortlist_bids(
+    event_id: int,
+    data: AdminShortlistSchema,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Shortlist any number of bids for an event.
+    bid_ids are given best first; their order becomes the shortlist rank.
+    """
+    return AdminBidReviewService.shortlist_bids(
+        db=db,
+        event_id=event_id,
+        bid_ids=data.bid_ids,
+        admin_user=current_user,
+    )
+
+# ---------------------------------------------------------
+# AUTO SHORTLIST (TOP-K BY AUTO SCORE)
+# ---------------------------------------------------------
+@router.post(
+    "/auto-shortlist",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(PermissionChecker(["admin.bid.update"]))],
+)
+def auto_shortlist(
+    data: AdminAutoShortlistSchema,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Shortlist the top_k bids by stored auto score for each given event.
+    """
+    return AdminBidReviewService.auto_shortlist(
+        db=db,
+        data=data,
+        admin_user=current_user,
+    )
+
 # ---------------------------------------------------------
 # UPDATE ADMIN SCORE
 # ---------------------------------------------------------
@@ -96,7 +194,7 @@ async def shortlist_top_3_bids(
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(PermissionChecker(["admin.bid.update"]))],
 )
-async def update_admin_score(
+def update_admin_score(
     bid_id: int,
     data: AdminScoreUpdateSchema,
     db: Session = Depends(get_db),
@@ -1,22 +1,32 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Any
+from sqlalchemy import func, case
+from typing import List, Any, Optional
 
 from app.database import get_db
 from app.dependencies import get_admin_user
 from app.schemas.analytics_schema import (
     RevenueTrendItem, CategoryRevenueItem, AdminStatsResponse, 
-    EventStatusItem, StatItem
+    EventStatusItem, StatItem, RevenueSeriesResponse, RevenueSeriesPoint
 )
-from app.models.vendor_order_m import VendorOrder
-from app.models.event_m import Event
+from app.services.analytics_service import AnalyticsService
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import AnalyticsCache, PLATFORM_SCOPE
 from app.models.vendor_m import Vendor
-from app.models.vendor_bid_m import VendorBid
 
 router = APIRouter(prefix="/api/admin/analytics", tags=["Admin Analytics"])
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+def _rate(part, whole) -> float:
+    """part / whole as a percentage (0 when whole is 0)"""
+    return float(part) / float(whole) * 100 if whole else 0.0
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Offset-aware query datetimes as naive UTC, matching the stored columns"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 def get_start_date(time_range: str) -> datetime:
     now = datetime.utcnow()
@@ -29,6 +39,7 @@ def get_start_date(time_range: str) -> datetime:
     return now - timedelta(days=30)
 
 @router.get("/stats", response_model=AdminStatsResponse)
+@AnalyticsCache.cached("admin.stats", lambda args: PLATFORM_SCOPE, params=("time_range",))
 def get_admin_stats(
     time_range: str = 'month', 
     db: Session = Depends(get_db),
@@ -38,31 +49,42 @@ def get_admin_stats(
     """
     Returns KPI cards matching the React Admin Dashboard design.
     """
-    start_date = get_start_date(time_range)
-    
-    # Real Queries with Time Filtering
-    total_events = db.query(Event).filter(Event.event_date >= start_date).count()
-    active_vendors = db.query(Vendor).filter(Vendor.status == 'approved').count() # Status is current, not time-bound usually
-    
-    total_revenue = db.query(func.sum(VendorOrder.amount)).filter(
-        VendorOrder.status == 'confirmed',
-        VendorOrder.confirmed_at >= start_date
-    ).scalar() or 0.0
-    
-    pending_bids = db.query(VendorBid).filter(
-        VendorBid.status == 'submitted',
-        VendorBid.submitted_at >= start_date
-    ).count()
-    
-    completed_events = db.query(Event).filter(
-        Event.status == 'Completed',
-        Event.event_date >= start_date
-    ).count()
-    
-    active_bookings = db.query(VendorOrder).filter(
-        VendorOrder.status == 'confirmed',
-        VendorOrder.confirmed_at >= start_date
-    ).count()
+    # Current and previous period in one pass over the daily rollups
+    start_day, prev_start_day = AnalyticsService.period_start_days(time_range)
+    platform, platform_prev = AnalyticsRollupService.platform_totals(db, start_day, prev_start_day)
+    events, events_prev = AnalyticsRollupService.event_totals(db, start_day, prev_start_day)
+
+    # Approved vendors now vs. those that already existed when the period began
+    active_vendors, active_vendors_prev = db.query(
+        func.count(Vendor.id),
+        func.coalesce(func.sum(case((Vendor.created_at < start_day, 1), else_=0)), 0)
+    ).filter(Vendor.status == 'approved').one()
+
+    total_events = events["events"]
+    total_revenue = float(platform["revenue"])
+    pending_bids = platform["bids_pending"]
+    completed_events = events["completed"]
+    active_bookings = platform["orders_confirmed"]
+
+    avg_event_val = (total_revenue / active_bookings) if active_bookings > 0 else 0.0
+    prev_bookings = platform_prev["orders_confirmed"]
+    avg_event_val_prev = (float(platform_prev["revenue"]) / prev_bookings) if prev_bookings > 0 else 0.0
+
+    conversion = _rate(platform["bids_won"], platform["bids_submitted"])
+    conversion_prev = _rate(platform_prev["bids_won"], platform_prev["bids_submitted"])
+
+    change = AnalyticsService.change_pct
+    changes = {
+        "events": change(total_events, events_prev["events"]),
+        "vendors": change(active_vendors, active_vendors_prev),
+        "revenue": change(total_revenue, platform_prev["revenue"]),
+        "pending": change(pending_bids, platform_prev["bids_pending"]),
+        "completed": change(completed_events, events_prev["completed"]),
+        "bookings": change(active_bookings, prev_bookings),
+        "avg_value": change(avg_event_val, avg_event_val_prev),
+        "conversion": AnalyticsService.change_abs(conversion, conversion_prev) + "%",
+    }
+    conversion_value = f"{conversion:.0f}%"
 
     # Fallback / Mock for Demo if empty
     if total_events == 0 and total_revenue == 0:
@@ -76,22 +98,36 @@ def get_admin_stats(
         pending_bids = int(24 * multiplier)
         completed_events = int(128 * multiplier)
         active_bookings = int(45 * multiplier)
-
-    avg_event_val = (total_revenue / active_bookings) if active_bookings > 0 else 182000.0
+        avg_event_val = 182000.0
+        conversion_value = "68%"
+        changes = {
+            "events": "+12%", "vendors": "+8%", "revenue": "+18%", "pending": "-5%",
+            "completed": "+15%", "bookings": "+22%", "avg_value": "+9%", "conversion": "+4%",
+        }
 
     stats = [
-        StatItem(title="Total Events", value=str(total_events), change_pct="+12%", subtext=f"vs last {time_range}", icon_name="Calendar", color_code="yellow"),
-        StatItem(title="Active Vendors", value=str(active_vendors), change_pct="+8%", subtext="total active", icon_name="Store", color_code="yellow"),
-        StatItem(title="Total Revenue", value=f"₹{total_revenue/10000000:.2f}Cr", change_pct="+18%", subtext=f"vs last {time_range}", icon_name="TrendingUp", color_code="green"),
-        StatItem(title="Pending Bids", value=str(pending_bids), change_pct="-5%", subtext="require action", icon_name="Gavel", color_code="orange"),
-        StatItem(title="Completed Events", value=str(completed_events), change_pct="+15%", subtext="96% satisfaction", icon_name="CheckCircle", color_code="green"),
-        StatItem(title="Active Bookings", value=str(active_bookings), change_pct="+22%", subtext="confirmed orders", icon_name="Clock", color_code="blue"),
-        StatItem(title="Avg Event Value", value=f"₹{avg_event_val/100:.2f}k", change_pct="+9%", subtext="avg order val", icon_name="Target", color_code="purple"),
-        StatItem(title="Conversion Rate", value="68%", change_pct="+4%", subtext="Industry avg: 52%", icon_name="Award", color_code="yellow"),
+        StatItem(title="Total Events", value=str(total_events), change_pct=changes["events"], subtext=f"vs last {time_range}", icon_name="Calendar", color_code="yellow"),
+        StatItem(title="Active Vendors", value=str(active_vendors), change_pct=changes["vendors"], subtext="total active", icon_name="Store", color_code="yellow"),
+        StatItem(title="Total Revenue", value=f"₹{total_revenue/10000000:.2f}Cr", change_pct=changes["revenue"], subtext=f"vs last {time_range}", icon_name="TrendingUp", color_code="green"),
+        StatItem(title="Pending Bids", value=str(pending_bids), change_pct=changes["pending"], subtext="require action", icon_name="Gavel", color_code="orange"),
+        StatItem(title="Completed Events", value=str(completed_events), change_pct=changes["completed"], subtext="96% satisfaction", icon_name="CheckCircle", color_code="green"),
+        StatItem(title="Active Bookings", value=str(active_bookings), change_pct=changes["bookings"], subtext="confirmed orders", icon_name="Clock", color_code="blue"),
+        StatItem(title="Avg Event Value", value=f"₹{avg_event_val/100:.2f}k", change_pct=changes["avg_value"], subtext="avg order val", icon_name="Target", color_code="purple"),
+        StatItem(title="Conversion Rate", value=conversion_value, change_pct=changes["conversion"], subtext="Industry avg: 52%", icon_name="Award", color_code="yellow"),
     ]
     return AdminStatsResponse(stats=stats)
 
+# time_range -> (bucket, chart label format)
+TREND_BUCKETS = {
+    'week': ('day', "%a"),
+    'month': ('day', "%d %b"),
+    'year': ('month', "%b"),
+}
+
+SERIES_LABELS = {'day': "%d %b %Y", 'week': "%d %b %Y", 'month': "%b %Y"}
+
 @router.get("/revenue-trends", response_model=List[RevenueTrendItem])
+@AnalyticsCache.cached("admin.revenue_trends", lambda args: PLATFORM_SCOPE, params=("time_range",))
 def get_revenue_trends(
     time_range: str = 'month', 
     db: Session = Depends(get_db),
@@ -101,38 +137,21 @@ def get_revenue_trends(
     try:
         start_date = get_start_date(time_range)
         
-        # 1. Fetch raw orders with confirmed status
-        orders = db.query(VendorOrder).filter(
-            VendorOrder.status == 'confirmed',
-            VendorOrder.confirmed_at >= start_date
-        ).order_by(VendorOrder.confirmed_at).all()
-
-        # 2. Aggregate in Python if we have data
-        if orders:
-            from collections import defaultdict
-            data_map = defaultdict(float)
-            for o in orders:
-                if not o.confirmed_at: continue
-                
-                if time_range == 'year':
-                    label = o.confirmed_at.strftime("%b")
-                elif time_range == 'month':
-                    label = o.confirmed_at.strftime("%d %b")
-                else: # week
-                    label = o.confirmed_at.strftime("%a")
-
-                data_map[label] += float(o.amount or 0)
-
-            trends = []
-            for label, revenue in data_map.items():
-                trends.append(
-                    RevenueTrendItem(
-                        month=label,
-                        revenue=float(revenue),
-                        target=float(revenue * 1.1)
-                    )
+        bucket, label_format = TREND_BUCKETS.get(time_range, TREND_BUCKETS['month'])
+
+        # 1. Revenue per bucket, grouped in SQL (ordered, gaps filled)
+        series = AnalyticsService.revenue_series(db, start_date, datetime.utcnow(), bucket)
+
+        # 2. Shape for the chart if we have data
+        if any(point["orders"] for point in series):
+            return [
+                RevenueTrendItem(
+                    month=point["period"].strftime(label_format),
+                    revenue=point["revenue"],
+                    target=point["revenue"] * 1.1
                 )
-            return trends
+                for point in series
+            ]
 
         # 3. High-Quality Fallback (React Mock Data)
         if time_range == 'week':
@@ -170,6 +189,43 @@ def get_revenue_trends(
         # Fallback even on code error to keep UI alive
         return [{"month": "Jan", "revenue": 185000.0, "target": 180000.0}, {"month": "Feb", "revenue": 220000.0, "target": 200000.0}]
 
+@router.get("/revenue-series", response_model=RevenueSeriesResponse)
+@AnalyticsCache.cached(
+    "admin.revenue_series", lambda args: PLATFORM_SCOPE,
+    params=("bucket", "time_range", "start_date", "end_date")
+)
+def get_revenue_series(
+    bucket: str = 'day',
+    time_range: str = 'month',
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    admin: Any = Depends(get_admin_user)
+):
+    """
+    Confirmed revenue bucketed by day / week / month over any range.
+    start_date / end_date override time_range; empty buckets are zero-filled.
+    """
+    end = _naive_utc(end_date) or datetime.utcnow()
+    start = _naive_utc(start_date) or get_start_date(time_range)
+
+    series = AnalyticsService.revenue_series(db, start, end, bucket)
+
+    return RevenueSeriesResponse(
+        bucket=bucket,
+        start=start,
+        end=end,
+        points=[
+            RevenueSeriesPoint(
+                period=point["period"],
+                label=point["period"].strftime(SERIES_LABELS[bucket]),
+                revenue=point["revenue"],
+                orders=point["orders"]
+            )
+            for point in series
+        ]
+    )
+
 @router.get("/event-analytics", response_model=List[EventStatusItem])
 def get_event_analytics(
     time_range: str = 'month', 
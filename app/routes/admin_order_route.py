@@ -18,7 +18,7 @@ router = APIRouter(
     response_model=List[AdminOrderListSchema],
     dependencies=[Depends(PermissionChecker(["admin.order.view"]))], # Assuming permission exists or generic admin access
 )
-async def get_all_orders(
+def get_all_orders(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -34,7 +34,7 @@ async def get_all_orders(
     response_model=AdminOrderDetailSchema,
     dependencies=[Depends(PermissionChecker(["admin.order.view"]))],
 )
-async def get_order_details(
+def get_order_details(
     id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -22,7 +22,7 @@ router = APIRouter(
     response_model=List[QuoteListSchema],
     dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
 )
-async def get_all_quotes(
+def get_all_quotes(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -38,7 +38,7 @@ async def get_all_quotes(
     response_model=QuoteComparisonResponseSchema,
     dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
 )
-async def compare_quotes(
+def compare_quotes(
     data: QuoteComparisonRequestSchema,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -53,7 +53,7 @@ async def compare_quotes(
     response_model=AdminQuoteDetailSchema,
     dependencies=[Depends(PermissionChecker(["admin.bid.view"]))],
 )
-async def get_quote_details(
+def get_quote_details(
     id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
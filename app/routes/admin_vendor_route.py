@@ -30,7 +30,7 @@ class VendorRejectionRequest(BaseModel):
     "/pending",
     dependencies=[Depends(PermissionChecker(["vendor.approve"]))]
 )
-async def get_pending_vendors(
+def get_pending_vendors(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -44,7 +44,7 @@ async def get_pending_vendors(
     "/{vendor_id}",
     dependencies=[Depends(PermissionChecker(["vendor.view"]))]
 )
-async def get_vendor_details(
+def get_vendor_details(
     vendor_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -57,7 +57,7 @@ async def get_vendor_details(
     "/{vendor_id}/approve",
     dependencies=[Depends(PermissionChecker(["vendor.approve"]))]
 )
-async def approve_vendor(
+def approve_vendor(
     vendor_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -70,7 +70,7 @@ async def approve_vendor(
     "/{vendor_id}/reject",
     dependencies=[Depends(PermissionChecker(["vendor.approve"]))]
 )
-async def reject_vendor(
+def reject_vendor(
     vendor_id: int,
     rejection: VendorRejectionRequest,
     db: Session = Depends(get_db),
@@ -84,7 +84,7 @@ async def reject_vendor(
     "/",
     dependencies=[Depends(PermissionChecker(["vendor.view"]))]
 )
-async def get_all_vendors(
+def get_all_vendors(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
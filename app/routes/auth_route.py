@@ -1,172 +1,92 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import timedelta
+from typing import Optional
 from app.database import get_db
 from app.schemas.auth_schema import LoginRequest, LoginResponse
 from app.models.user_m import User
-from app.models.menu_m import Menu
-from app.models.role_right_m import RoleRight
-from app.utils.password_utils import verify_password
-from app.utils.jwt_utils import create_access_token
-from app.utils.permission_utils import get_user_permissions
+from app.models.role_m import Role
+from app.models.vendor_m import Vendor
+from app.services.role_bootstrap_service import RoleBootstrapService
+from app.utils.password_utils import verify_password_async, hash_password_async, needs_rehash
+from app.utils.jwt_utils import create_access_token, build_token_claims
 from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-@router.post("/token", response_model=LoginResponse)
-async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
-):
-    """
-    OAuth2 compatible token login, get an access token for future requests
-    """
-    # 1. VALIDATE USER
-    user = db.query(User).filter(
-        User.username == form_data.username,
+
+def _load_login_row(db: Session, username: str):
+    """User, role code and vendor profile in one query."""
+    return db.query(User, Role.code, Vendor.id, Vendor.status).join(
+        Role, Role.id == User.role_id
+    ).outerjoin(
+        Vendor, Vendor.user_id == User.id
+    ).filter(
+        User.username == username,
         User.inactive == False
     ).first()
 
-    if not user or not verify_password(form_data.password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # 2. GENERATE JWT TOKEN
-    access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "username": user.username,
-            "email": user.email,
-            "role_id": user.role_id,
-        },
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
-
-    # 3. FETCH DATA (Same as login)
-    role_rights = db.query(RoleRight).filter(
-        RoleRight.role_id == user.role_id,
-        RoleRight.can_view == True,
-        RoleRight.inactive == False
-    ).all()
-
-    menu_ids = [rr.menu_id for rr in role_rights]
-    
-    menus = db.query(Menu).filter(
-        Menu.id.in_(menu_ids),
-        Menu.inactive == False
-    ).order_by(Menu.sort_order).all()
-
-    menus_out = [{
-        "id": m.id,
-        "name": m.name,
-        "route": m.route,
-        "code": m.code,
-        "icon": m.icon,
-    } for m in menus]
-
-    rights_out = [{
-        "menu_id": rr.menu_id,
-        "can_view": rr.can_view,
-        "can_create": rr.can_create,
-        "can_edit": rr.can_edit,
-        "can_delete": rr.can_delete,
-    } for rr in role_rights]
-
-    permissions = get_user_permissions(db, user.role_id)
 
-    return LoginResponse(
-        access_token=access_token,
-        token_type="bearer",
-        user={
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "role_code": user.role.code
-        },
-        menus=menus_out,
-        rights=rights_out,
-        permissions=permissions
-    )
+def _save_password_hash(db: Session, user: User, password_hash: str) -> None:
+    user.password_hash = password_hash
+    db.commit()
 
 
-@router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def _authenticate(
+    db: Session,
+    username: str,
+    password: str,
+    headers: Optional[dict] = None
+) -> LoginResponse:
     """
-    Login endpoint - Returns JWT token with user info, menus, rights, and permissions
+    Shared login flow for /auth/token and /auth/login.
+    Returns JWT token with user info, menus, rights, and permissions.
+
+    The session is synchronous, so every database step is pushed to the
+    threadpool; bcrypt runs on its own bounded executor in between.
     """
-    
+
     # ============================
-    # 1. VALIDATE USER
+    # 1. VALIDATE USER (user, role code and vendor profile in one query)
     # ============================
-    user = db.query(User).filter(
-        User.username == request.username,
-        User.inactive == False
-    ).first()
+    row = await run_in_threadpool(_load_login_row, db, username)
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not row or not await verify_password_async(password, row[0].password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials"
+            detail="Invalid credentials",
+            headers=headers,
         )
 
+    user, role_code, vendor_id, vendor_status = row
+
+    # Transparently upgrade hashes made with an old bcrypt cost
+    if needs_rehash(user.password_hash):
+        new_hash = await hash_password_async(password)
+        await run_in_threadpool(_save_password_hash, db, user, new_hash)
+
     # ============================
     # 2. GENERATE JWT TOKEN
     # ============================
     access_token = create_access_token(
-        data={
-            "sub": str(user.id),
-            "username": user.username,
-            "email": user.email,
-            "role_id": user.role_id,
-        },
+        data=build_token_claims(
+            user,
+            role_code,
+            vendor_id=vendor_id if role_code == "VENDOR" else None,
+            vendor_status=vendor_status if role_code == "VENDOR" else None
+        ),
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
 
     # ============================
-    # 3. FETCH UI MENUS (role_rights)
-    # ============================
-    role_rights = db.query(RoleRight).filter(
-        RoleRight.role_id == user.role_id,
-        RoleRight.can_view == True,
-        RoleRight.inactive == False
-    ).all()
-
-    menu_ids = [rr.menu_id for rr in role_rights]
-    
-    menus = db.query(Menu).filter(
-        Menu.id.in_(menu_ids),
-        Menu.inactive == False
-    ).order_by(Menu.sort_order).all()
-
-    menus_out = [{
-        "id": m.id,
-        "name": m.name,
-        "route": m.route,
-        "code": m.code,
-        "icon": m.icon,
-    } for m in menus]
-
-    rights_out = [{
-        "menu_id": rr.menu_id,
-        "can_view": rr.can_view,
-        "can_create": rr.can_create,
-        "can_edit": rr.can_edit,
-        "can_delete": rr.can_delete,
-    } for rr in role_rights]
-
-    # ============================
-    # 4. FETCH BACKEND PERMISSIONS
+    # 3. UI MENUS, RIGHTS & PERMISSIONS (cached per role)
     # ============================
-    permissions = get_user_permissions(db, user.role_id)
+    bootstrap = await run_in_threadpool(RoleBootstrapService.get_bootstrap, db, user.role_id)
 
     # ============================
-    # 5. RETURN COMPLETE RESPONSE
+    # 4. RETURN COMPLETE RESPONSE
     # ============================
     return LoginResponse(
         access_token=access_token,
@@ -177,12 +97,36 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
             "email": user.email,
             "first_name": user.first_name,
             "last_name": user.last_name,
-            "role_code": user.role.code
+            "role_code": role_code
         },
-        menus=menus_out,
-        rights=rights_out,
-        permissions=permissions
+        menus=bootstrap["menus"],
+        rights=bootstrap["rights"],
+        permissions=bootstrap["permissions"]
     )
 
 
-__all__ = ["router"]
\ No newline at end of file
+@router.post("/token", response_model=LoginResponse)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_db)
+):
+    """
+    OAuth2 compatible token login, get an access token for future requests
+    """
+    return await _authenticate(
+        db,
+        form_data.username,
+        form_data.password,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+@router.post("/login", response_model=LoginResponse)
+async def login(request: LoginRequest, db: Session = Depends(get_db)):
+    """
+    Login endpoint - Returns JWT token with user info, menus, rights, and permissions
+    """
+    return await _authenticate(db, request.username, request.password)
+
+
+__all__ = ["router"]
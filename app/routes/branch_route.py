@@ -10,7 +10,7 @@ from app.dependencies import get_current_active_user
 router = APIRouter(prefix="/branches", tags=["Branches"])
 
 @router.post("/", response_model=BranchResponse, status_code=status.HTTP_201_CREATED)
-async def create_branch(
+def create_branch(
     branch: BranchCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -22,7 +22,7 @@ async def create_branch(
     return new_branch
 
 @router.get("/", response_model=List[BranchResponse])
-async def get_branches(
+def get_branches(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -35,7 +35,7 @@ async def get_branches(
     return branches
 
 @router.get("/{branch_id}", response_model=BranchResponse)
-async def get_branch(
+def get_branch(
     branch_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -50,7 +50,7 @@ async def get_branch(
     return branch
 
 @router.put("/{branch_id}", response_model=BranchResponse)
-async def update_branch(
+def update_branch(
     branch_id: int,
     branch_update: BranchUpdate,
     db: Session = Depends(get_db),
@@ -72,7 +72,7 @@ async def update_branch(
     return branch
 
 @router.delete("/{branch_id}")
-async def delete_branch(
+def delete_branch(
     branch_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
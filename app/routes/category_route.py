@@ -15,7 +15,7 @@ router = APIRouter(prefix="/categories", tags=["Event Categories"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["event.category.create"]))]
 )
-async def create_category(
+def create_category(
     category: CategoryCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -28,7 +28,7 @@ async def create_category(
     "/",
     dependencies=[Depends(PermissionChecker(["event.category.view"]))]
 )
-async def get_categories(
+def get_categories(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -42,7 +42,7 @@ async def get_categories(
     "/{category_id}",
     dependencies=[Depends(PermissionChecker(["event.category.view"]))]
 )
-async def get_category(
+def get_category(
     category_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -58,7 +58,7 @@ async def get_category(
     "/{category_id}",
     dependencies=[Depends(PermissionChecker(["event.category.update"]))]
 )
-async def update_category(
+def update_category(
     category_id: int,
     category_update: CategoryUpdate,
     db: Session = Depends(get_db),
@@ -72,7 +72,7 @@ async def update_category(
     "/{category_id}",
     dependencies=[Depends(PermissionChecker(["event.category.delete"]))]
 )
-async def delete_category(
+def delete_category(
     category_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
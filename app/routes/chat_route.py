@@ -1,18 +1,28 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+import asyncio
 
-from app.database import get_db
+from fastapi import APIRouter, Depends, status, HTTPException, Query, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+
+from app.config import settings
+from app.database import get_async_db, AsyncSessionLocal
+from app.services.chat_hub import chat_hub, ChatSubscription, OVERFLOW
 from app.services.chat_service import ChatService
+from app.utils.metrics_utils import metrics
 from app.models.user_m import User
-from app.dependencies import get_current_active_user
+from app.dependencies import get_current_active_user_async
 
 from app.schemas.chat_schema import (
     ChatCreate,
     ChatResponse,
     MessageCreate,
     MessageResponse,
-    ChatHistory
+    ChatHistory,
+    InboxResponse,
+    ChatReadResponse
 )
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
@@ -24,13 +34,43 @@ router = APIRouter(prefix="/chat", tags=["Chat"])
 )
 async def start_chat(
     chat_data: ChatCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """
     Start a chat with a vendor.
     """
-    return ChatService.create_or_get_chat(db, chat_data, current_user.id)
+    return await ChatService.create_or_get_chat(db, chat_data, current_user.id)
+
+@router.get(
+    "/inbox",
+    response_model=InboxResponse
+)
+async def get_inbox(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    My chats, most recent activity first, with last message and unread count.
+    """
+    return await ChatService.get_my_chats(db, current_user.id, limit=limit, cursor=cursor)
+
+@router.post(
+    "/{chat_id}/read",
+    response_model=ChatReadResponse
+)
+async def mark_chat_read(
+    chat_id: int,
+    up_to: Optional[int] = Query(None, description="Last message id read (default: latest)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Mark a chat as read up to a message.
+    """
+    return await ChatService.mark_read(db, chat_id, current_user.id, up_to)
 
 @router.post(
     "/{chat_id}/message",
@@ -40,14 +80,16 @@ async def start_chat(
 async def send_message(
     chat_id: int,
     message_data: MessageCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """
     Send a message in a chat.
     """
-    # Verify user belongs to chat needed here ideally
-    return ChatService.send_message(db, chat_id, current_user.id, message_data)
+    if await ChatService.get_participant_chat(db, chat_id, current_user.id) is None:
+        raise HTTPException(status_code=404, detail="Chat not found")
+
+    return await ChatService.send_message(db, chat_id, current_user.id, message_data)
 
 @router.get(
     "/{chat_id}/history",
@@ -55,24 +97,103 @@ async def send_message(
 )
 async def get_chat_history(
     chat_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    before: Optional[int] = Query(None, description="Messages older than this message id"),
+    after: Optional[int] = Query(None, description="Messages newer than this message id"),
+    since: Optional[datetime] = Query(None, description="Messages written after this time"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """
-    Get message history of a chat.
+    Get message history of a chat, one page at a time (latest page by default).
     """
-    # Verify user belongs to chat needed
-    chat = ChatService.get_chat_history(db, chat_id)
+    # Only the consumer and the vendor's user may read it
+    chat = await ChatService.get_participant_chat(db, chat_id, current_user.id)
     if not chat:
         raise HTTPException(status_code=404, detail="Chat not found")
-    
-    # Basic access check
-    if chat.consumer_id != current_user.id and chat.vendor_id != current_user.id: # Note: vendor logic check needs refinement if user_id!=vendor_id
-         # If current user is vendor, we must check if they own the vendor profile of chat.vendor_id
-         # For MVP, assuming loose check or that we resolved it.
-         pass 
-
-    return {
-        "chat": chat,
-        "messages": chat.messages
+
+    page = await ChatService.get_messages(db, chat_id, before=before, after=after, since=since, limit=limit)
+    return {"chat": chat, **page}
+
+
+# ----------------------------
+# REAL-TIME DELIVERY
+# ----------------------------
+# Close codes: 1008 = not allowed in this chat, 1013 = too far behind
+# (reconnect and fetch missed messages from history).
+WS_POLICY_VIOLATION = 1008
+WS_TRY_AGAIN_LATER = 1013
+
+
+async def _send_loop(websocket: WebSocket, subscription: ChatSubscription):
+    """Drain the subscription's queue to the socket"""
+    while True:
+        message = await subscription.queue.get()
+        if message is OVERFLOW:
+            metrics.counter("chat_ws.slow_consumer_disconnects").inc()
+            await websocket.close(code=WS_TRY_AGAIN_LATER)
+            return
+        try:
+            await asyncio.wait_for(websocket.send_json(message), settings.CHAT_WS_SEND_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            metrics.counter("chat_ws.send_timeouts").inc()
+            await websocket.close(code=WS_TRY_AGAIN_LATER)
+            return
+
+
+async def _receive_loop(websocket: WebSocket, chat_id: int, user_id: int):
+    """Messages sent over the socket are stored like POST /message"""
+    while True:
+        try:
+            message_data = MessageCreate(**await websocket.receive_json())
+        except (TypeError, ValueError, ValidationError):
+            await websocket.send_json({"type": "error", "detail": "Expected {\"content\": \"...\"}"})
+            continue
+
+        # Short-lived session per message; sockets don't hold a connection
+        try:
+            async with AsyncSessionLocal() as db:
+                await ChatService.send_message(db, chat_id, user_id, message_data)
+        except SQLAlchemyError:
+            metrics.counter("chat_ws.save_errors").inc()
+            await websocket.send_json({"type": "error", "detail": "Message could not be saved"})
+
+
+@router.websocket("/{chat_id}/ws")
+async def chat_socket(
+    websocket: WebSocket,
+    chat_id: int,
+    token: str = Query(...)
+):
+    """
+    Live messages for a chat (consumer or vendor participant only).
+    Pass the access token as ?token=. Every new message in the chat is
+    pushed as {"type": "message", "chat_id", "message"}; send
+    {"content": "..."} to post one.
+    """
+    async with AsyncSessionLocal() as db:
+        user = await ChatService.authenticate_socket(db, token)
+        chat = await ChatService.get_participant_chat(db, chat_id, user.id) if user else None
+
+    if chat is None:
+        metrics.counter("chat_ws.rejected").inc()
+        await websocket.close(code=WS_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = await chat_hub.subscribe(chat_id, user.id)
+
+    tasks = {
+        asyncio.create_task(_send_loop(websocket, subscription)),
+        asyncio.create_task(_receive_loop(websocket, chat_id, user.id)),
     }
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not task.cancelled() and isinstance(task.exception(), WebSocketDisconnect):
+                continue
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        chat_hub.unsubscribe(subscription)
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/consumer/events", tags=["Consumer Events"])
     response_model=dict,
     dependencies=[Depends(PermissionChecker(["event.create"]))],
 )
-async def create_event(
+def create_event(
     event_data: EventCreateSchema,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -45,7 +45,7 @@ async def create_event(
     response_model=List[ConsumerEventListSchema],
     dependencies=[Depends(PermissionChecker(["event.view"]))],
 )
-async def get_my_events(
+def get_my_events(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
@@ -24,7 +24,7 @@ router = APIRouter(
     response_model=ConsumerShortlistedBidResponse,
     dependencies=[Depends(PermissionChecker(["event.view"]))],
 )
-async def get_shortlisted_bids(
+def get_shortlisted_bids(
     event_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -48,7 +48,7 @@ async def get_shortlisted_bids(
     response_model=ConsumerBidSelectionResponse,
     dependencies=[Depends(PermissionChecker(["event.update"]))],
 )
-async def select_winning_bid(
+def select_winning_bid(
     event_id: int,
     bid_id: int,
     db: Session = Depends(get_db),
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/event-managers", tags=["Event Managers"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["event.manager.create"]))]
 )
-async def create_event_manager_profile(
+def create_event_manager_profile(
     profile: EventManagerProfileCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -31,7 +31,7 @@ async def create_event_manager_profile(
     "/",
     dependencies=[Depends(PermissionChecker(["event.manager.view"]))]
 )
-async def get_event_managers(
+def get_event_managers(
     availability_status: str = None,
     skip: int = 0,
     limit: int = 100,
@@ -48,7 +48,7 @@ async def get_event_managers(
     "/available",
     dependencies=[Depends(PermissionChecker(["event.manager.view"]))]
 )
-async def get_available_managers(
+def get_available_managers(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -60,7 +60,7 @@ async def get_available_managers(
     "/{manager_id}",
     dependencies=[Depends(PermissionChecker(["event.manager.view"]))]
 )
-async def get_event_manager(
+def get_event_manager(
     manager_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -76,7 +76,7 @@ async def get_event_manager(
     "/{manager_id}",
     dependencies=[Depends(PermissionChecker(["event.manager.update"]))]
 )
-async def update_event_manager_profile(
+def update_event_manager_profile(
     manager_id: int,
     profile_update: EventManagerProfileUpdate,
     db: Session = Depends(get_db),
@@ -90,7 +90,7 @@ async def update_event_manager_profile(
     "/{manager_id}/events",
     dependencies=[Depends(PermissionChecker(["event.manager.view"]))]
 )
-async def get_manager_events(
+def get_manager_events(
     manager_id: int,
     status: str = None,
     db: Session = Depends(get_db),
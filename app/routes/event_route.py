@@ -15,7 +15,7 @@ router = APIRouter(prefix="/events", tags=["Events"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["event.create"]))],
 )
-async def create_event(
+def create_event(
     event: EventCreateSchema,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -27,7 +27,7 @@ async def create_event(
     "/{event_id}",
     dependencies=[Depends(PermissionChecker(["event.update"]))],
 )
-async def update_event(
+def update_event(
     event_id: int,
     event_update: EventUpdateSchema,
     db: Session = Depends(get_db),
@@ -40,7 +40,7 @@ async def update_event(
     "/",
     dependencies=[Depends(PermissionChecker(["event.view"]))]
 )
-async def get_events(
+def get_events(
     status: Optional[str] = None,
     category_id: Optional[int] = None,
     event_type_id: Optional[int] = None,
@@ -62,7 +62,7 @@ async def get_events(
     "/stats",
     dependencies=[Depends(PermissionChecker(["event.view"]))]
 )
-async def get_event_stats(
+def get_event_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -74,7 +74,7 @@ async def get_event_stats(
     "/{event_id}",
     dependencies=[Depends(PermissionChecker(["event.view"]))]
 )
-async def get_event(
+def get_event(
     event_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -90,7 +90,7 @@ async def get_event(
     "/{event_id}",
     dependencies=[Depends(PermissionChecker(["event.delete"]))]
 )
-async def delete_event(
+def delete_event(
     event_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -104,7 +104,7 @@ async def delete_event(
     "/{event_id}/assign-manager",
     dependencies=[Depends(PermissionChecker(["event.update"]))]
 )
-async def assign_manager(
+def assign_manager(
     event_id: int,
     manager_id: int,
     db: Session = Depends(get_db),
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/event-types", tags=["Event Types"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["event.type.create"]))]
 )
-async def create_event_type(
+def create_event_type(
     event_type: EventTypeCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -28,7 +28,7 @@ async def create_event_type(
     "/",
     dependencies=[Depends(PermissionChecker(["event.type.view"]))]
 )
-async def get_event_types(
+def get_event_types(
     category_id: int = None,
     skip: int = 0,
     limit: int = 100,
@@ -43,7 +43,7 @@ async def get_event_types(
     "/{type_id}",
     dependencies=[Depends(PermissionChecker(["event.type.view"]))]
 )
-async def get_event_type(
+def get_event_type(
     type_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -59,7 +59,7 @@ async def get_event_type(
     "/{type_id}",
     dependencies=[Depends(PermissionChecker(["event.type.update"]))]
 )
-async def update_event_type(
+def update_event_type(
     type_id: int,
     type_update: EventTypeUpdate,
     db: Session = Depends(get_db),
@@ -73,7 +73,7 @@ async def update_event_type(
     "/{type_id}",
     dependencies=[Depends(PermissionChecker(["event.type.delete"]))]
 )
-async def delete_event_type(
+def delete_event_type(
     type_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_admin_user
+from app.utils.metrics_utils import metrics
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/", dependencies=[Depends(get_admin_user)])
+async def get_metrics():
+    """
+    In-process runtime metrics: DB pool usage, checkout wait times,
+    overflow checkouts and pool timeouts. Admins only.
+    """
+    return metrics.snapshot()
@@ -10,7 +10,7 @@ from app.dependencies import get_current_active_user
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
 @router.post("/", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
-async def create_organization(
+def create_organization(
     org: OrganizationCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -26,7 +26,7 @@ async def create_organization(
     return new_org
 
 @router.get("/", response_model=List[OrganizationResponse])
-async def get_organizations(
+def get_organizations(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def get_organizations(
     return orgs
 
 @router.get("/{org_id}", response_model=OrganizationResponse)
-async def get_organization(
+def get_organization(
     org_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -47,7 +47,7 @@ async def get_organization(
     return org
 
 @router.put("/{org_id}", response_model=OrganizationResponse)
-async def update_organization(
+def update_organization(
     org_id: int,
     org_update: OrganizationUpdate,
     db: Session = Depends(get_db),
@@ -66,7 +66,7 @@ async def update_organization(
     return org
 
 @router.delete("/{org_id}")
-async def delete_organization(
+def delete_organization(
     org_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
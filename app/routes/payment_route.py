@@ -14,11 +14,14 @@ from app.schemas.payment_schema import (
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
+# Plain `def` handlers: the Razorpay client and PaymentService are blocking,
+# so FastAPI runs them in its threadpool instead of on the event loop.
+
 @router.post(
     "/initiate",
     response_model=PaymentResponse,
 )
-async def initiate_payment(
+def initiate_payment(
     payment_data: PaymentInitiate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -32,7 +35,7 @@ async def initiate_payment(
     "/verify",
     response_model=PaymentResponse,
 )
-async def verify_payment(
+def verify_payment(
     verify_data: PaymentVerify,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
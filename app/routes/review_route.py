@@ -21,7 +21,7 @@ router = APIRouter(prefix="/reviews", tags=["Reviews"])
     response_model=ReviewResponse,
     dependencies=[Depends(PermissionChecker(["review.create"]))], # Assuming this permission exists or is generic
 )
-async def create_review(
+def create_review(
     review_data: ReviewCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -35,7 +35,7 @@ async def create_review(
     "/vendor/{vendor_id}",
     response_model=List[VendorReviewList]
 )
-async def get_vendor_reviews(
+def get_vendor_reviews(
     vendor_id: int,
     skip: int = 0,
     limit: int = 20,
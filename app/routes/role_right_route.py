@@ -28,7 +28,7 @@ class RoleRightUpdate(BaseModel):
     "/",
     dependencies=[Depends(PermissionChecker(["role.manage"]))]
 )
-async def create_role_right(
+def create_role_right(
     data: RoleRightCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -69,7 +69,7 @@ async def create_role_right(
     "/{role_right_id}",
     dependencies=[Depends(PermissionChecker(["role.manage"]))]
 )
-async def update_role_right(
+def update_role_right(
     role_right_id: int,
     data: RoleRightUpdate,
     db: Session = Depends(get_db),
@@ -101,7 +101,7 @@ async def update_role_right(
     return {"message": "Role right updated and permissions synced"}
 
 @router.get("/{role_id}")
-async def get_role_rights(
+def get_role_rights(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -10,7 +10,7 @@ from app.dependencies import get_current_active_user
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
 @router.post("/", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
-async def create_role(
+def create_role(
     role: RoleCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -26,7 +26,7 @@ async def create_role(
     return new_role
 
 @router.get("/", response_model=List[RoleResponse])
-async def get_roles(
+def get_roles(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -36,7 +36,7 @@ async def get_roles(
     return roles
 
 @router.get("/{role_id}", response_model=RoleResponse)
-async def get_role(
+def get_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -47,7 +47,7 @@ async def get_role(
     return role
 
 @router.put("/{role_id}", response_model=RoleResponse)
-async def update_role(
+def update_role(
     role_id: int,
     role_update: RoleUpdate,
     db: Session = Depends(get_db),
@@ -66,7 +66,7 @@ async def update_role(
     return role
 
 @router.delete("/{role_id}")
-async def delete_role(
+def delete_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -17,7 +17,7 @@ router = APIRouter(prefix="/services", tags=["Services"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["service.create"]))]
 )
-async def create_service(
+def create_service(
     service: ServiceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -31,7 +31,7 @@ async def create_service(
     response_model=List[ServiceResponse],
     dependencies=[Depends(PermissionChecker(["service.view"]))]
 )
-async def get_services(
+def get_services(
     is_active: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
@@ -47,7 +47,7 @@ async def get_services(
     response_model=ServiceResponse,
     dependencies=[Depends(PermissionChecker(["service.view"]))]
 )
-async def get_service(
+def get_service(
     service_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -64,7 +64,7 @@ async def get_service(
     response_model=ServiceResponse,
     dependencies=[Depends(PermissionChecker(["service.update"]))]
 )
-async def update_service(
+def update_service(
     service_id: int,
     service_update: ServiceUpdate,
     db: Session = Depends(get_db),
@@ -78,7 +78,7 @@ async def update_service(
     "/{service_id}",
     dependencies=[Depends(PermissionChecker(["service.delete"]))]
 )
-async def delete_service(
+def delete_service(
     service_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(PermissionChecker(["user.create"]))]  # NEW
 )
-async def create_user(
+def create_user(
     user: UserCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -68,7 +68,7 @@ async def create_user(
     response_model=List[UserResponse],
     dependencies=[Depends(PermissionChecker(["user.view"]))]  # NEW
 )
-async def get_users(
+def get_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -85,7 +85,7 @@ async def get_users(
     response_model=UserResponse,
     dependencies=[Depends(PermissionChecker(["user.view"]))]  # NEW
 )
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -105,7 +105,7 @@ async def get_user(
     response_model=UserResponse,
     dependencies=[Depends(PermissionChecker(["user.update"]))]  # NEW
 )
-async def update_user(
+def update_user(
     user_id: int,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
@@ -131,7 +131,7 @@ async def update_user(
     "/{user_id}",
     dependencies=[Depends(PermissionChecker(["user.delete"]))]  # NEW
 )
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
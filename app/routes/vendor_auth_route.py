@@ -14,8 +14,8 @@ from app.schemas.vendor_auth_schema import (
     VendorAuthResponse,
     VendorAuthUser,
 )
-from app.utils.password_utils import hash_password, verify_password
-from app.utils.jwt_utils import create_access_token
+from app.utils.password_utils import hash_password, verify_password, needs_rehash
+from app.utils.jwt_utils import create_access_token, build_token_claims
 
 
 router = APIRouter(prefix="/auth/vendor", tags=["Vendor Auth"])
@@ -46,6 +46,10 @@ def login_vendor_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if needs_rehash(user.password_hash):
+        user.password_hash = hash_password(form_data.password)
+        db.commit()
+
     # Ensure user is vendor
     role = db.query(Role).filter(Role.id == user.role_id).first()
     if not role or role.code != "VENDOR":
@@ -54,12 +58,13 @@ def login_vendor_token(
             detail="Not a vendor account",
         )
 
-    token_data = {
-        "sub": str(user.id),
-        "username": user.username,
-        "email": user.email,
-        "role_id": user.role_id,
-    }
+    vendor = user.vendor_profile
+    token_data = build_token_claims(
+        user,
+        role.code,
+        vendor_id=vendor.id if vendor else None,
+        vendor_status=vendor.status if vendor else None
+    )
     access_token = create_access_token(token_data)
 
     return VendorAuthResponse(
@@ -146,12 +151,7 @@ def register_vendor(payload: VendorRegisterRequest, db: Session = Depends(get_db
     db.commit()
     db.refresh(user)
 
-    token_data = {
-        "sub": str(user.id),
-        "username": user.username,
-        "email": user.email,
-        "role_id": user.role_id,
-    }
+    token_data = build_token_claims(user, vendor_role.code, vendor_id=vendor.id, vendor_status=vendor.status)
     access_token = create_access_token(token_data)
 
     return VendorAuthResponse(
@@ -176,6 +176,10 @@ def login_vendor(payload: VendorLoginRequest, db: Session = Depends(get_db)):
             detail="Invalid credentials",
         )
 
+    if needs_rehash(user.password_hash):
+        user.password_hash = hash_password(payload.password)
+        db.commit()
+
     # Ensure user is vendor
     role = db.query(Role).filter(Role.id == user.role_id).first()
     if not role or role.code != "VENDOR":
@@ -184,12 +188,13 @@ def login_vendor(payload: VendorLoginRequest, db: Session = Depends(get_db)):
             detail="Not a vendor account",
         )
 
-    token_data = {
-        "sub": str(user.id),
-        "username": user.username,
-        "email": user.email,
-        "role_id": user.role_id,
-    }
+    vendor = user.vendor_profile
+    token_data = build_token_claims(
+        user,
+        role.code,
+        vendor_id=vendor.id if vendor else None,
+        vendor_status=vendor.status if vendor else None
+    )
     access_token = create_access_token(token_data)
 
     return VendorAuthResponse(
@@ -25,15 +25,17 @@ router = APIRouter(
     "/available-events",
     response_model=List[VendorAvailableEventSchema],
 )
-async def get_available_events(
+def get_available_events(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get all events available for the vendor to bid on.
     Only returns events where vendor can provide all required services.
+    Pass the id of the last event received as `cursor` to get the next page.
     """
     vendor = db.query(Vendor).filter(Vendor.user_id == current_user.id).first()
     if not vendor:
@@ -44,13 +46,14 @@ async def get_available_events(
         vendor_id=vendor.id,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
 @router.post(
     "/submit",
     status_code=status.HTTP_201_CREATED,
 )
-async def submit_bid(
+def submit_bid(
     bid_data: VendorBidCreateSchema,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -73,7 +76,7 @@ async def submit_bid(
     "/my-bids",
     response_model=List[VendorMyBidSchema],
 )
-async def get_my_bids(
+def get_my_bids(
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
@@ -101,7 +104,7 @@ async def get_my_bids(
     "/{id}",
     response_model=VendorBidDetailSchema,
 )
-async def get_bid_details(
+def get_bid_details(
     id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -124,7 +127,7 @@ async def get_bid_details(
     "/{id}",
     response_model=dict,
 )
-async def update_bid(
+def update_bid(
     id: int,
     bid_data: VendorBidUpdateSchema,
     db: Session = Depends(get_db),
@@ -149,7 +152,7 @@ async def update_bid(
     "/{id}",
     response_model=dict,
 )
-async def withdraw_bid(
+def withdraw_bid(
     id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
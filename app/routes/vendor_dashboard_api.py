@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
 from typing import List
-from datetime import datetime, timedelta
 
 from app.database import get_db
 from app.dependencies_vendor import get_current_vendor
@@ -10,66 +9,74 @@ from app.schemas.analytics_schema import (
     VendorStatsResponse, VendorChartsResponse, NotificationItem, StatItem, ChartDataPoint
 )
 from app.models.vendor_m import Vendor
-from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_order_m import VendorOrder
+from app.models.review_m import Review
+from app.services.analytics_service import AnalyticsService
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.analytics_cache import AnalyticsCache, vendor_scope
 
 router = APIRouter(prefix="/api/vendor/analytics", tags=["Vendor Analytics"])
 
-def get_start_date(time_range: str) -> datetime:
-    now = datetime.utcnow()
-    if time_range == 'week':
-        return now - timedelta(days=7)
-    elif time_range == 'month':
-        return now - timedelta(days=30)
-    elif time_range == 'year':
-        return now - timedelta(days=365)
-    return now - timedelta(days=30) # Default to month
+def _rate(part, whole) -> float:
+    """part / whole as a percentage (0 when whole is 0)"""
+    return float(part) / float(whole) * 100 if whole else 0.0
 
 @router.get("/stats", response_model=VendorStatsResponse)
+@AnalyticsCache.cached("vendor.stats", lambda args: vendor_scope(args["vendor"].id), params=("time_range",))
 def get_vendor_stats(
     time_range: str = 'month',
     db: Session = Depends(get_db),
     vendor: Vendor = Depends(get_current_vendor)
 ):
     print(f"📡 [FASTAPI] Vendor Stats Request - Vendor: {vendor.id}, Range: {time_range}")
-    start_date = get_start_date(time_range)
-    
-    # REAL QUERIES
-    # 1. Active Bids (Status = 'submitted')
-    # Note: Active bids are current, so maybe date filter isn't strictly necessary, but arguably 'submitted within range'
-    active_bids_count = db.query(VendorBid).filter(
-        VendorBid.vendor_id == vendor.id,
-        VendorBid.status == 'submitted',
-        VendorBid.submitted_at >= start_date
-    ).count()
+    # Current and previous period from the vendor's daily rollups, in one query
+    start_day, prev_start_day = AnalyticsService.period_start_days(time_range)
+    totals, previous = AnalyticsRollupService.vendor_totals(db, vendor.id, start_day, prev_start_day)
+
+    # 1. Active Bids (still 'submitted', submitted within range)
+    active_bids_count = totals["bids_pending"]
 
     # 2. Won Contracts
-    won_contracts_count = db.query(VendorBid).filter(
-        VendorBid.vendor_id == vendor.id,
-        VendorBid.status == 'accepted',
-        VendorBid.selected_at >= start_date # Assuming selected_at exists
-    ).count()
+    won_contracts_count = totals["bids_won"]
 
     # 3. Total Orders (Confirmed within range)
-    orders_count = db.query(VendorOrder).filter(
-        VendorOrder.vendor_id == vendor.id,
-        VendorOrder.status == 'confirmed',
-        VendorOrder.confirmed_at >= start_date
-    ).count()
+    orders_count = totals["orders_confirmed"]
 
     # 4. Total Revenue
-    revenue_val = db.query(func.sum(VendorOrder.amount)).filter(
-        VendorOrder.vendor_id == vendor.id,
-        VendorOrder.status == 'confirmed',
-        VendorOrder.confirmed_at >= start_date
-    ).scalar() or 0.0
+    revenue_val = float(totals["revenue"])
     
     # 5. Pending Payments (Assumption: Orders confirmed but not completed/paid fully?) 
     # For now, let's say status='confirmed' counts as pending payment if not 'completed'
-    pending_payment_val = db.query(func.sum(VendorOrder.amount)).filter(
-        VendorOrder.vendor_id == vendor.id,
-        VendorOrder.status == 'confirmed' 
-    ).scalar() or 0.0
+    pending_payment_val = float(totals["revenue_all_time"])
+    pending_payment_prev = pending_payment_val - revenue_val  # as of the period start
+
+    # 6. Success Rate (won / submitted bids)
+    success_rate = _rate(totals["bids_won"], totals["bids_submitted"])
+    success_rate_prev = _rate(previous["bids_won"], previous["bids_submitted"])
+
+    # 7. Rating trend: average review rating this period vs the previous one
+    current_reviews = Review.created_at >= start_day
+    previous_reviews = (Review.created_at >= prev_start_day) & (Review.created_at < start_day)
+    review_avg, review_avg_prev = db.query(
+        func.avg(case((current_reviews, Review.rating))),
+        func.avg(case((previous_reviews, Review.rating)))
+    ).filter(
+        Review.vendor_id == vendor.id,
+        Review.created_at >= prev_start_day
+    ).one()
+
+    change = AnalyticsService.change_pct
+    changes = {
+        "orders": change(orders_count, previous["orders_confirmed"]),
+        "revenue": change(revenue_val, previous["revenue"]),
+        "bids": AnalyticsService.change_abs(active_bids_count, previous["bids_pending"]),
+        "payments": change(pending_payment_val, pending_payment_prev),
+        "success": AnalyticsService.change_abs(success_rate, success_rate_prev) + "%",
+        "rating": AnalyticsService.change_abs(review_avg, review_avg_prev, digits=1)
+        if review_avg is not None and review_avg_prev is not None else "0.0",
+    }
+    success_value = f"{success_rate:.0f}%"
+    rating_value = f"{float(vendor.rating or 0):.1f}"
 
     # IF DB EMPTY (0 results), use Demo Logic to match React
     if orders_count == 0 and revenue_val == 0 and active_bids_count == 0:
@@ -82,18 +89,25 @@ def get_vendor_stats(
         orders_count = int(48 * multiplier)
         revenue_val = 540000.0 * multiplier
         pending_payment_val = 45000.0 * multiplier
+        success_value = "94%"
+        rating_value = "4.8"
+        changes = {
+            "orders": "+12%", "revenue": "+23%", "bids": "+3",
+            "payments": "-8%", "success": "+2%", "rating": "+0.2",
+        }
     
     stats = [
-        StatItem(title="Total Orders", value=str(orders_count), change_pct="+12%", subtext=f"vs last {time_range}", icon_name="Package", color_code="purple"),
-        StatItem(title="Total Revenue", value=f"₹{revenue_val/1000:.0f}K", change_pct="+23%", subtext=f"vs last {time_range}", icon_name="DollarSign", color_code="green"),
-        StatItem(title="Active Bids", value=str(active_bids_count), change_pct="+3", subtext="pending", icon_name="Target", color_code="blue"),
-        StatItem(title="Pending Payments", value=f"₹{pending_payment_val/1000:.0f}K", change_pct="-8%", subtext="urgent", icon_name="Wallet", color_code="orange"),
-        StatItem(title="Success Rate", value="94%", change_pct="+2%", subtext="win rate", icon_name="TrendingUp", color_code="teal"),
-        StatItem(title="Rating", value="4.8", change_pct="+0.2", subtext="avg rating", icon_name="Award", color_code="yellow"),
+        StatItem(title="Total Orders", value=str(orders_count), change_pct=changes["orders"], subtext=f"vs last {time_range}", icon_name="Package", color_code="purple"),
+        StatItem(title="Total Revenue", value=f"₹{revenue_val/1000:.0f}K", change_pct=changes["revenue"], subtext=f"vs last {time_range}", icon_name="DollarSign", color_code="green"),
+        StatItem(title="Active Bids", value=str(active_bids_count), change_pct=changes["bids"], subtext="pending", icon_name="Target", color_code="blue"),
+        StatItem(title="Pending Payments", value=f"₹{pending_payment_val/1000:.0f}K", change_pct=changes["payments"], subtext="urgent", icon_name="Wallet", color_code="orange"),
+        StatItem(title="Success Rate", value=success_value, change_pct=changes["success"], subtext="win rate", icon_name="TrendingUp", color_code="teal"),
+        StatItem(title="Rating", value=rating_value, change_pct=changes["rating"], subtext="avg rating", icon_name="Award", color_code="yellow"),
     ]
     return VendorStatsResponse(stats=stats)
 
 @router.get("/notifications", response_model=List[NotificationItem])
+@AnalyticsCache.cached("vendor.notifications", lambda args: vendor_scope(args["vendor"].id))
 def get_notifications(
     db: Session = Depends(get_db),
     vendor: Vendor = Depends(get_current_vendor)
@@ -131,24 +145,20 @@ def get_notifications(
     return mock_notifs
 
 @router.get("/charts", response_model=VendorChartsResponse)
+@AnalyticsCache.cached("vendor.charts", lambda args: vendor_scope(args["vendor"].id), params=("time_range",))
 def get_vendor_charts(
     time_range: str = 'month',
     db: Session = Depends(get_db),
     vendor: Vendor = Depends(get_current_vendor)
 ):
     print(f"📡 [FASTAPI] Vendor Charts Request - Vendor: {vendor.id}, Range: {time_range}")
-    start_date = get_start_date(time_range)
+    start_day, _ = AnalyticsService.period_start_days(time_range)
     
-    # Real Revenue Query Grouped by Date
-    # Note: Grouping by 'month' or 'day' depends on dialect. Using Python aggregation for simplicity/safety across DBs
-    orders = db.query(VendorOrder).filter(
-        VendorOrder.vendor_id == vendor.id,
-        VendorOrder.status == 'confirmed',
-        VendorOrder.confirmed_at >= start_date
-    ).all()
+    # Daily revenue from the vendor's rollups (one row per day with orders)
+    daily_revenue = AnalyticsRollupService.vendor_daily_revenue(db, vendor.id, start_day)
     
     # If no real data, use Mock
-    if not orders:
+    if not daily_revenue:
         if time_range == 'week':
             revenue_chart = [
                 {"label": 'Mon', "value": 5000.0},
@@ -172,21 +182,18 @@ def get_vendor_charts(
         ]
         return VendorChartsResponse(revenue_trend=revenue_chart, bids_by_category=bid_chart)
 
-    # Aggregate Real Data
-    from collections import defaultdict
-    rev_map = defaultdict(float)
+    # Aggregate Real Data (days are in order, so labels stay in order)
+    rev_map = {}
     
-    for o in orders:
-        if not o.confirmed_at: continue
+    for day, revenue in daily_revenue:
         if time_range == 'week':
-             label = o.confirmed_at.strftime("%a") # Mon, Tue
+             label = day.strftime("%a") # Mon, Tue
         elif time_range == 'year':
-            label = o.confirmed_at.strftime("%b") # Jan, Feb
+            label = day.strftime("%b") # Jan, Feb
         else:
-            label = o.confirmed_at.strftime("%d") # 01, 02
-        rev_map[label] += o.amount
+            label = day.strftime("%d") # 01, 02
+        rev_map[label] = rev_map.get(label, 0.0) + revenue
 
-    # Convert map to sorted list
     revenue_chart = [{"label": k, "value": v} for k, v in rev_map.items()]
     
     # Real Bid Categories
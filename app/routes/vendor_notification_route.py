@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, status, HTTPException, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, SessionLocal
 from app.services.vendor_notification_service import VendorNotificationService
+from app.services.vendor_notification_bus import notification_bus, VendorNotificationBus, OVERFLOW
 from app.models.user_m import User
 from app.models.vendor_m import Vendor
-from app.dependencies import get_current_active_user, PermissionChecker
+from app.dependencies import get_current_active_user, PermissionChecker, QueryTokenPermissionChecker
 from app.schemas.vendor_notification_schema import VendorNotificationListItem
+from app.utils.metrics_utils import metrics
 
 router = APIRouter(
     prefix="/vendor/notifications",
@@ -19,7 +27,7 @@ router = APIRouter(
     response_model=List[VendorNotificationListItem],
     dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))] # Assumed permission
 )
-async def get_my_notifications(
+def get_my_notifications(
     unread_only: bool = False,
     skip: int = 0,
     limit: int = 50,
@@ -46,18 +54,17 @@ async def get_my_notifications(
     response_model=dict,
     dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))]
 )
-async def get_unread_count(
+def get_unread_count(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get count of unread notifications
     """
-    vendor = db.query(Vendor).filter(Vendor.user_id == current_user.id).first()
-    if not vendor:
+    count = VendorNotificationService.get_unread_count_for_user(db, current_user.id)
+    if count is None:
         raise HTTPException(status_code=403, detail="User is not a vendor")
 
-    count = VendorNotificationService.get_unread_count(db, vendor.id)
     return {"unread_count": count}
 
 @router.put(
@@ -65,7 +72,7 @@ async def get_unread_count(
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))]
 )
-async def mark_as_read(
+def mark_as_read(
     notification_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -88,7 +95,7 @@ async def mark_as_read(
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(PermissionChecker(["vendor.profile.view"]))]
 )
-async def mark_all_as_read(
+def mark_all_as_read(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -103,3 +110,117 @@ async def mark_all_as_read(
         db=db,
         vendor_id=vendor.id
     )
+
+
+# ----------------------------
+# LIVE STREAM (Server-Sent Events)
+# ----------------------------
+
+def _stream_vendor_id(user_id: int) -> int:
+    """Vendor profile of the streaming user"""
+    db = SessionLocal()
+    try:
+        vendor_id = db.query(Vendor.id).filter(Vendor.user_id == user_id).scalar()
+        if vendor_id is None:
+            raise HTTPException(status_code=403, detail="User is not a vendor")
+        return vendor_id
+    finally:
+        db.close()
+
+
+def _stream_snapshot(vendor_id: int, last_event_id: Optional[int]):
+    """Notifications missed since last_event_id (oldest first) and the unread count"""
+    db = SessionLocal()
+    try:
+        missed = []
+        if last_event_id is not None:
+            missed = VendorNotificationService.get_notifications_after(
+                db, vendor_id, last_event_id, settings.NOTIFICATION_SSE_RESUME_LIMIT
+            )
+        items = [VendorNotificationBus.notification_item(n) for n in missed]
+        return items, VendorNotificationService.get_unread_count(db, vendor_id)
+    finally:
+        db.close()
+
+
+def _sse(item: dict) -> str:
+    lines = [f"event: {item['type']}"]
+    if "id" in item:
+        lines.append(f"id: {item['id']}")
+    lines.append(f"data: {json.dumps(item['data'])}")
+    return "\n".join(lines) + "\n\n"
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    current_user: User = Depends(QueryTokenPermissionChecker(["vendor.profile.view"])),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    resume_from: Optional[int] = Query(None, description="Last notification id seen, if not sent as Last-Event-ID"),
+):
+    """
+    Live notifications for the current vendor as text/event-stream.
+
+    Events: `notification` (id = notification id) and `unread_count`.
+    On reconnect the browser sends Last-Event-ID and missed notifications
+    are replayed first. A comment line is sent every
+    NOTIFICATION_SSE_HEARTBEAT_SECONDS to keep proxies from closing it.
+
+    EventSource can't send headers, so the access token may be given as
+    ?token=. That puts the JWT in access logs: strip the query string for
+    this path in proxy / server logs.
+    """
+    vendor_id = await run_in_threadpool(_stream_vendor_id, current_user.id)
+    resume_id = last_event_id if last_event_id is not None else resume_from
+
+    # Subscribe before reading the snapshot so nothing falls in between;
+    # anything delivered twice is skipped by id below
+    subscription = notification_bus.subscribe(vendor_id)
+    try:
+        missed, unread_count = await run_in_threadpool(_stream_snapshot, vendor_id, resume_id)
+    except Exception:
+        notification_bus.unsubscribe(subscription)
+        raise
+
+    if missed:
+        metrics.counter("notification_sse.resumed").inc()
+
+    async def events():
+        metrics.counter("notification_sse.connections_opened").inc()
+        last_sent = max([resume_id or 0] + [item["id"] for item in missed])
+        try:
+            yield f"retry: {settings.NOTIFICATION_SSE_HEARTBEAT_SECONDS * 1000}\n\n"
+            for item in missed + [VendorNotificationBus.unread_count_item(unread_count)]:
+                yield _sse(item)
+
+            while not await request.is_disconnected():
+                try:
+                    item = await asyncio.wait_for(
+                        subscription.queue.get(), settings.NOTIFICATION_SSE_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    metrics.counter("notification_sse.heartbeats").inc()
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if item is OVERFLOW:
+                    # Too far behind: close; the client reconnects and resumes
+                    metrics.counter("notification_sse.overflow_disconnects").inc()
+                    return
+
+                if "id" in item:
+                    if item["id"] <= last_sent:
+                        continue
+                    last_sent = item["id"]
+
+                metrics.counter("notification_sse.events_sent").inc()
+                yield _sse(item)
+        finally:
+            notification_bus.unsubscribe(subscription)
+            metrics.counter("notification_sse.connections_closed").inc()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
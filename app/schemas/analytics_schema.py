@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional, Any
+from datetime import date, datetime
 
 # ==========================================
 # 1. SHARED / COMMON SCHEMAS
@@ -28,6 +29,18 @@ class RevenueTrendItem(BaseModel):
     revenue: float
     target: float
 
+class RevenueSeriesPoint(BaseModel):
+    period: date  # first day of the bucket
+    label: str
+    revenue: float
+    orders: int
+
+class RevenueSeriesResponse(BaseModel):
+    bucket: str  # "day", "week" or "month"
+    start: datetime
+    end: datetime
+    points: List[RevenueSeriesPoint]
+
 class CategoryRevenueItem(BaseModel):
     category: str
     revenue: float
@@ -31,6 +31,26 @@ class ChatResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class InboxItem(BaseModel):
+    chat: ChatResponse  # last_message filled in
+    unread_count: int
+    last_message_at: Optional[datetime] = None
+
+class InboxResponse(BaseModel):
+    items: List[InboxItem]
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
+
+class ChatReadResponse(BaseModel):
+    chat_id: int
+    last_read_id: int
+    unread_count: int
+
 class ChatHistory(BaseModel):
     chat: ChatResponse
-    messages: List[MessageResponse]
+    messages: List[MessageResponse]  # oldest first
+
+    # Cursors: pass next_before as ?before= for older messages,
+    # next_after as ?after= for newer ones
+    has_more: bool = False
+    next_before: Optional[int] = None
+    next_after: Optional[int] = None
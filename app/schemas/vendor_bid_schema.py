@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from decimal import Decimal
 from datetime import datetime
@@ -100,6 +100,42 @@ class AdminShortlistSchema(BaseModel):
     bid_ids: List[int]
 
 
+class AdminAutoShortlistSchema(BaseModel):
+    event_ids: List[int]
+    top_k: int = Field(3, ge=1)
+
+
+class BidScoreWeightsSchema(BaseModel):
+    """Maximum points per auto-score component (defaults = standard scoring)"""
+    rating: float = Field(30, ge=0)
+    experience: float = Field(25, ge=0)
+    budget_savings: float = Field(20, ge=0)
+    budget_overrun: float = Field(15, ge=0)
+    timeline: float = Field(10, ge=0)
+    reviews: float = Field(10, ge=0)
+
+
+class AdminBidWhatIfSchema(BaseModel):
+    profile: Optional[str] = None
+    weights: Optional[BidScoreWeightsSchema] = None
+
+
+class AdminBidWhatIfItemSchema(BaseModel):
+    bidId: int
+    vendorId: int
+    score: float
+    rank: int
+    baselineScore: float
+    baselineRank: int
+    rankChange: int
+
+
+class AdminBidWhatIfResponse(BaseModel):
+    eventId: int
+    weights: BidScoreWeightsSchema
+    bids: List[AdminBidWhatIfItemSchema]
+
+
 
 class AdminScoreUpdateSchema(BaseModel):
     score: float
@@ -2,15 +2,19 @@
 # ADMIN BID REVIEW SERVICE
 # ============================================
 
+import numpy as np
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from datetime import datetime
-from typing import List
-from sqlalchemy import func
+from typing import Dict, List, Optional
+from sqlalchemy import func, case
 
 from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event, BiddingStatus
+from app.services.event_bid_counter_service import EventBidCounterService
+from app.services.bid_scoring_service import BidScoringService, BidScoreColumns
+from app.services.analytics_rollup_service import AnalyticsRollupService
 
 from app.schemas.vendor_bid_schema import (
     AdminEventBidReviewResponse,
@@ -20,7 +24,16 @@ from app.schemas.vendor_bid_schema import (
     AdminBidProposalSchema,
 )
 from app.schemas.event_schema import ConsumerEventListSchema
-from app.schemas.vendor_bid_schema import AdminShortlistSchema, AdminScoreUpdateSchema
+from app.schemas.vendor_bid_schema import (
+    AdminShortlistSchema,
+    AdminAutoShortlistSchema,
+    AdminScoreUpdateSchema,
+)
+
+# Events whose bids can still be reviewed / shortlisted
+REVIEWABLE_STATUSES = [BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW]
+# Manual shortlists may also replace an earlier shortlist
+RESHORTLIST_STATUSES = REVIEWABLE_STATUSES + [BiddingStatus.SHORTLISTED]
 
 
 class AdminBidReviewService:
@@ -35,37 +48,27 @@ class AdminBidReviewService:
         limit: int = 100
     ) -> List[ConsumerEventListSchema]:
 
+        # submitted_bid_count is maintained on every bid write, so this is a
+        # plain filtered scan of events with no join or per-event COUNT
         events = db.query(Event).filter(
-            Event.bidding_status.in_(
-                [BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW]
-            ),
-            Event.inactive == False
-        ).offset(skip).limit(limit).all()
-
-        response: List[ConsumerEventListSchema] = []
-
-        for event in events:
-            bid_count = db.query(func.count(VendorBid.id)).filter(
-                VendorBid.event_id == event.id,
-                VendorBid.status == "submitted",
-                VendorBid.inactive == False
-            ).scalar()
-
-            if bid_count > 0:
-                response.append(
-                    ConsumerEventListSchema(
-                        id=event.id,
-                        name=event.name,
-                        eventDate=event.event_date.strftime("%b %d, %Y"),
-                        location=event.location,
-                        budget=event.budget or 0,
-                        biddingStatus=event.bidding_status,
-                        bidCount=bid_count,
-                        createdAt=event.created_at,
-                    )
-                )
-
-        return response
+            Event.bidding_status.in_(REVIEWABLE_STATUSES),
+            Event.inactive == False,
+            Event.submitted_bid_count > 0
+        ).order_by(Event.id).offset(skip).limit(limit).all()
+
+        return [
+            ConsumerEventListSchema(
+                id=event.id,
+                name=event.name,
+                eventDate=event.event_date.strftime("%b %d, %Y"),
+                location=event.location,
+                budget=event.budget or 0,
+                biddingStatus=event.bidding_status,
+                bidCount=event.submitted_bid_count,
+                createdAt=event.created_at,
+            )
+            for event in events
+        ]
 
     # ---------------------------------------------------------
     # BIDS FOR SINGLE EVENT (ADMIN REVIEW)
@@ -73,26 +76,42 @@ class AdminBidReviewService:
     @staticmethod
     def get_bids_for_event(
         db: Session,
-        event_id: int
+        event_id: int,
+        profile: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> AdminEventBidReviewResponse:
 
         event = db.query(Event).filter(Event.id == event_id).first()
         if not event:
             raise HTTPException(404, "Event not found")
 
-        bids = db.query(VendorBid, Vendor).join(Vendor).filter(
+        query = db.query(VendorBid, Vendor).join(Vendor).filter(
             VendorBid.event_id == event_id,
             VendorBid.status == "submitted",
             VendorBid.inactive == False
-        ).all()
-
-        bid_items: List[AdminBidReviewItemSchema] = []
+        )
 
-        for bid, vendor in bids:
-            auto_score = AdminBidReviewService._calculate_auto_score(
-                vendor, bid, event
+        if profile in (None, "default"):
+            # Stored scores: the database returns the top-K already ordered
+            query = query.order_by(VendorBid.auto_score.desc(), VendorBid.id)
+            if limit:
+                query = query.limit(limit)
+            bids = query.all()
+            auto_scores = [float(bid.auto_score or 0) for bid, _ in bids]
+        else:
+            # Other weightings are scored on the fly in one vectorized pass
+            bids = query.order_by(VendorBid.id).all()
+            scores = BidScoringService.score(
+                BidScoreColumns.from_bids(bids, event),
+                BidScoringService.get_profile(profile)
             )
+            order = np.argsort(-scores, kind="stable")[:limit]
+            bids = [bids[i] for i in order]
+            auto_scores = scores[order].round(2).tolist()
 
+        bid_items: List[AdminBidReviewItemSchema] = []
+
+        for (bid, vendor), auto_score in zip(bids, auto_scores):
             bid_items.append(
                 AdminBidReviewItemSchema(
                     bidId=bid.id,
@@ -127,9 +146,6 @@ class AdminBidReviewService:
                 )
             )
 
-        # Sort bids by auto score
-        bid_items.sort(key=lambda x: x.autoScore, reverse=True)
-
         return AdminEventBidReviewResponse(
             event={
                 "id": event.id,
@@ -139,53 +155,6 @@ class AdminBidReviewService:
             bids=bid_items,
         )
 
-    # ---------------------------------------------------------
-    # AUTO SCORE CALCULATION
-    # ---------------------------------------------------------
-    @staticmethod
-    def _calculate_auto_score(
-        vendor: Vendor,
-        bid: VendorBid,
-        event: Event
-    ) -> float:
-
-        score = 0.0
-
-        # 1. Rating (30)
-        if vendor.rating:
-            score += float(vendor.rating) * 6
-
-        # 2. Experience (25)
-        score += min((vendor.completed_events or 0) * 1.5, 25)
-
-        # 3. Budget competitiveness (25)
-        if event.budget and bid.total_amount:
-            budget = float(event.budget)
-            amount = float(bid.total_amount)
-
-            if amount <= budget:
-                savings = ((budget - amount) / budget) * 100
-                score += min(savings / 4, 20)
-            else:
-                over = ((amount - budget) / budget) * 100
-                score -= min(over / 2, 15)
-
-        # 4. Timeline (10)
-        if bid.timeline_days:
-            if bid.timeline_days <= 30:
-                score += 10
-            elif bid.timeline_days <= 60:
-                score += 7
-            elif bid.timeline_days <= 90:
-                score += 5
-            else:
-                score += 3
-
-        # 5. Reviews (10)
-        score += min((vendor.total_reviews or 0) / 10, 10)
-
-        return max(0, min(score, 100))
-
     # ---------------------------------------------------------
     # SHORTLIST TOP 3 BIDS
     # ---------------------------------------------------------
@@ -200,46 +169,174 @@ class AdminBidReviewService:
         if len(data.bid_ids) != 3:
             raise HTTPException(400, "Must select exactly 3 bids")
 
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
-            raise HTTPException(404, "Event not found")
+        AdminBidReviewService.shortlist_bids(db, event_id, data.bid_ids, admin_user)
 
-        db.query(VendorBid).filter(
-            VendorBid.event_id == event_id,
-            VendorBid.status.in_(["submitted", "shortlisted"])
-        ).update(
+        return {
+            "message": "Top 3 bids shortlisted successfully",
+            "shortlistedBids": data.bid_ids,
+        }
+
+    # ---------------------------------------------------------
+    # BULK SHORTLIST (N RANKED BIDS)
+    # ---------------------------------------------------------
+    @staticmethod
+    def _check_reviewable(db: Session, event_ids: List[int], statuses: List[str] = REVIEWABLE_STATUSES):
+        """404 for unknown events, 400 for events whose bidding status is not in statuses"""
+        current = dict(db.query(Event.id, Event.bidding_status).filter(
+            Event.id.in_(event_ids),
+            Event.inactive == False
+        ).all())
+
+        missing = [e for e in event_ids if e not in current]
+        if missing:
+            raise HTTPException(404, f"Events not found: {missing}")
+
+        closed = [e for e in event_ids if current[e] not in statuses]
+        if closed:
+            raise HTTPException(400, f"Bids cannot be shortlisted for events in their current bidding status: {closed}")
+
+    @staticmethod
+    def _apply_shortlist(
+        db: Session,
+        ranks: Dict[int, int],
+        event_ids: List[int],
+        admin_user,
+        statuses: List[str] = REVIEWABLE_STATUSES
+    ):
+        """
+        One UPDATE over the events' reviewable bids: the ranked ones become
+        shortlisted with their rank (CASE on id), every other one is reset.
+        Events whose bidding status has since left statuses are left untouched.
+        """
+        now = datetime.utcnow()
+        chosen = VendorBid.id.in_(list(ranks))
+
+        reviewable = db.query(Event.id).filter(
+            Event.id.in_(event_ids),
+            Event.bidding_status.in_(statuses)
+        ).with_for_update()
+        event_ids = [event_id for (event_id,) in reviewable.all()]
+        if not event_ids:
+            raise HTTPException(400, "Bids cannot be shortlisted for these events in their current bidding status")
+
+        with AnalyticsRollupService.track_event_bids(db, event_ids):
+            db.query(VendorBid).filter(
+                VendorBid.event_id.in_(event_ids),
+                VendorBid.status.in_(["submitted", "shortlisted"]),
+                VendorBid.inactive == False
+            ).update(
+                {
+                    "shortlisted": chosen,
+                    "shortlisted_rank": case(ranks, value=VendorBid.id, else_=None),
+                    "status": case((chosen, "shortlisted"), else_="submitted"),
+                    "admin_reviewed_at": case((chosen, now), else_=VendorBid.admin_reviewed_at),
+                    "admin_reviewed_by": case((chosen, admin_user.username), else_=VendorBid.admin_reviewed_by),
+                    "modified_by": admin_user.username,
+                },
+                synchronize_session=False,
+            )
+
+        db.query(Event).filter(Event.id.in_(event_ids)).update(
             {
-                "shortlisted": False,
-                "shortlisted_rank": None,
-                "status": "submitted",
+                "bidding_status": BiddingStatus.SHORTLISTED,
+                "modified_by": admin_user.username,
             },
             synchronize_session=False,
         )
 
-        for rank, bid_id in enumerate(data.bid_ids, start=1):
-            bid = db.query(VendorBid).filter(
-                VendorBid.id == bid_id,
+        EventBidCounterService.refresh(db, event_ids)
+        db.commit()
+
+    @staticmethod
+    def shortlist_bids(
+        db: Session,
+        event_id: int,
+        bid_ids: List[int],
+        admin_user
+    ):
+
+        if not bid_ids:
+            raise HTTPException(400, "At least one bid must be selected")
+
+        if len(set(bid_ids)) != len(bid_ids):
+            raise HTTPException(400, "Duplicate bid ids")
+
+        AdminBidReviewService._check_reviewable(db, [event_id], RESHORTLIST_STATUSES)
+
+        # Validate every id in one query
+        found = {
+            bid_id for (bid_id,) in db.query(VendorBid.id).filter(
+                VendorBid.id.in_(bid_ids),
                 VendorBid.event_id == event_id,
-            ).first()
+                VendorBid.status.in_(["submitted", "shortlisted"]),
+                VendorBid.inactive == False
+            ).all()
+        }
+        missing = [bid_id for bid_id in bid_ids if bid_id not in found]
+        if missing:
+            raise HTTPException(404, f"Bids not found for this event: {missing}")
+
+        ranks = {bid_id: rank for rank, bid_id in enumerate(bid_ids, start=1)}
+        AdminBidReviewService._apply_shortlist(db, ranks, [event_id], admin_user, RESHORTLIST_STATUSES)
+
+        return {
+            "message": f"{len(bid_ids)} bids shortlisted successfully",
+            "shortlistedBids": bid_ids,
+        }
+
+    # ---------------------------------------------------------
+    # AUTO SHORTLIST (TOP-K BY AUTO SCORE, MANY EVENTS)
+    # ---------------------------------------------------------
+    @staticmethod
+    def auto_shortlist(
+        db: Session,
+        data: AdminAutoShortlistSchema,
+        admin_user
+    ):
 
-            if not bid:
-                raise HTTPException(404, f"Bid {bid_id} not found")
+        if not data.event_ids:
+            raise HTTPException(400, "At least one event must be given")
+
+        AdminBidReviewService._check_reviewable(db, list(set(data.event_ids)))
+
+        position = func.row_number().over(
+            partition_by=VendorBid.event_id,
+            order_by=(VendorBid.auto_score.desc(), VendorBid.id)
+        ).label("position")
+
+        ranked = db.query(
+            VendorBid.id.label("bid_id"),
+            VendorBid.event_id.label("event_id"),
+            position
+        ).join(
+            Event, Event.id == VendorBid.event_id
+        ).filter(
+            VendorBid.event_id.in_(data.event_ids),
+            VendorBid.status.in_(["submitted", "shortlisted"]),
+            VendorBid.inactive == False,
+            Event.inactive == False
+        ).subquery()
 
-            bid.shortlisted = True
-            bid.shortlisted_rank = rank
-            bid.status = "shortlisted"
-            bid.admin_reviewed_at = datetime.utcnow()
-            bid.admin_reviewed_by = admin_user.username
-            bid.modified_by = admin_user.username
+        rows = db.query(
+            ranked.c.bid_id, ranked.c.event_id, ranked.c.position
+        ).filter(
+            ranked.c.position <= data.top_k
+        ).order_by(ranked.c.event_id, ranked.c.position).all()
 
-        event.bidding_status = BiddingStatus.SHORTLISTED
-        event.modified_by = admin_user.username
+        if not rows:
+            raise HTTPException(404, "No reviewable bids found for these events")
 
-        db.commit()
+        ranks = {bid_id: position for bid_id, _, position in rows}
+        shortlisted: Dict[int, List[int]] = {}
+        for bid_id, event_id, _ in rows:
+            shortlisted.setdefault(event_id, []).append(bid_id)
+
+        AdminBidReviewService._apply_shortlist(db, ranks, list(shortlisted), admin_user)
 
         return {
-            "message": "Top 3 bids shortlisted successfully",
-            "shortlistedBids": data.bid_ids,
+            "message": f"Bids shortlisted for {len(shortlisted)} events",
+            "shortlistedBids": shortlisted,
+            "skippedEvents": [e for e in data.event_ids if e not in shortlisted],
         }
 
     # ---------------------------------------------------------
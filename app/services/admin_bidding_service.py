@@ -6,6 +6,7 @@ from sqlalchemy import func
 from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event
+from app.services.event_bid_counter_service import EventBidCounterService
 
 
 # -------------------------
@@ -84,6 +85,7 @@ def approve_bid(db: Session, bid_id: int, notes: str | None):
     if notes:
         bid.notes = notes
 
+    EventBidCounterService.refresh(db, [bid.event_id])
     db.commit()
     return True
 
@@ -100,5 +102,6 @@ def decline_bid(db: Session, bid_id: int, notes: str | None):
     if notes:
         bid.notes = notes
 
+    EventBidCounterService.refresh(db, [bid.event_id])
     db.commit()
     return True
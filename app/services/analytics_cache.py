@@ -0,0 +1,186 @@
+# app/services/analytics_cache.py
+
+import functools
+import inspect as pyinspect
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.event_m import Event
+from app.models.review_m import Review
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_m import Vendor
+from app.models.vendor_order_m import VendorOrder
+from app.models.vendor_payment_m import VendorPayment
+from app.utils.cache_utils import LocalCacheBackend, RedisCacheBackend
+from app.utils.metrics_utils import metrics
+
+# Cache scopes: platform-wide (admin dashboards) or one vendor's dashboards
+PLATFORM_SCOPE = "platform"
+
+_MISSING = object()
+
+
+def vendor_scope(vendor_id: int) -> str:
+    return f"vendor:{vendor_id}"
+
+
+def _build_backend():
+    if settings.ANALYTICS_CACHE_REDIS_URL:
+        return RedisCacheBackend.from_url(
+            settings.ANALYTICS_CACHE_REDIS_URL,
+            ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            namespace="analytics"
+        )
+    return LocalCacheBackend(
+        ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+        max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES
+    )
+
+
+_backend = _build_backend()
+
+
+class AnalyticsCache:
+    """
+    Response cache for the analytics endpoints.
+
+    Entries are keyed by scope (platform / vendor id), endpoint and the
+    request parameters (e.g. time_range). Order, bid, payment, event,
+    vendor and review writes invalidate the scopes they touch once their
+    transaction commits; the TTL bounds staleness for anything else.
+    """
+
+    @staticmethod
+    def set_backend(backend):
+        """Swap the backend (e.g. a shared Redis client or a local stand-in)"""
+        global _backend
+        _backend = backend
+
+    @staticmethod
+    def key(endpoint: str, scope: str, params: Optional[Dict] = None) -> str:
+        query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        return f"{scope}:{endpoint}:{query}"
+
+    @staticmethod
+    def get_or_load(endpoint: str, scope: str, loader: Callable, params: Optional[Dict] = None):
+        key = AnalyticsCache.key(endpoint, scope, params)
+
+        value = _backend.get(key, _MISSING)
+        if value is not _MISSING:
+            metrics.counter(f"analytics_cache.{endpoint}.hits").inc()
+            return value
+
+        metrics.counter(f"analytics_cache.{endpoint}.misses").inc()
+        value = loader()
+        _backend.set(key, value)
+        return value
+
+    @staticmethod
+    def invalidate(scopes: Iterable[str]):
+        for scope in set(scopes):
+            dropped = _backend.delete_prefix(f"{scope}:")
+            metrics.counter("analytics_cache.invalidations").inc()
+            metrics.counter("analytics_cache.evicted_entries").inc(dropped)
+
+    @staticmethod
+    def cached(endpoint: str, scope: Callable[[dict], str], params: Sequence[str] = ()):
+        """
+        Decorator for a route / service function. scope receives the bound
+        arguments by name; params lists the arguments that vary the response.
+        """
+        def decorator(fn):
+            signature = pyinspect.signature(fn)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                arguments = signature.bind(*args, **kwargs).arguments
+                return AnalyticsCache.get_or_load(
+                    endpoint,
+                    scope(arguments),
+                    lambda: fn(*args, **kwargs),
+                    {name: arguments.get(name, signature.parameters[name].default) for name in params}
+                )
+
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def mark_vendors(db: Session, vendor_ids: Iterable[int]):
+        """Queue invalidation for these vendors (for bulk UPDATEs that skip mapper events)"""
+        _pending(db).update({PLATFORM_SCOPE, *(vendor_scope(v) for v in vendor_ids)})
+
+
+metrics.gauge("analytics_cache", lambda: _backend.stats())
+
+
+# ----------------------------
+# WRITE INVALIDATION
+# ----------------------------
+# Mapper events collect the scopes a flush touched (old and new vendor alike);
+# they are invalidated after the transaction commits, so a concurrent reader
+# can't re-cache pre-commit data, and dropped on rollback.
+_PENDING_KEY = "analytics_cache_pending"
+
+
+def _pending(session: Session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _vendor_ids(target, attr: str = "vendor_id") -> list:
+    history = inspect(target).attrs[attr].history
+    return [v for v in (*history.added, *history.deleted, *history.unchanged) if v is not None]
+
+
+def _stage(target, scopes: Iterable[str]):
+    session = Session.object_session(target)
+    if session is not None:
+        _pending(session).update(scopes)
+
+
+@event.listens_for(VendorOrder, "after_insert")
+@event.listens_for(VendorOrder, "after_update")
+@event.listens_for(VendorOrder, "after_delete")
+@event.listens_for(VendorBid, "after_insert")
+@event.listens_for(VendorBid, "after_update")
+@event.listens_for(VendorBid, "after_delete")
+@event.listens_for(VendorPayment, "after_insert")
+@event.listens_for(VendorPayment, "after_update")
+@event.listens_for(VendorPayment, "after_delete")
+def _vendor_record_written(mapper, connection, target):
+    _stage(target, [PLATFORM_SCOPE, *(vendor_scope(v) for v in _vendor_ids(target))])
+
+
+@event.listens_for(Review, "after_insert")
+@event.listens_for(Review, "after_update")
+@event.listens_for(Review, "after_delete")
+def _review_written(mapper, connection, target):
+    # Admin dashboards show ratings too
+    _stage(target, [PLATFORM_SCOPE, *(vendor_scope(v) for v in _vendor_ids(target))])
+
+
+@event.listens_for(Vendor, "after_insert")
+@event.listens_for(Vendor, "after_update")
+def _vendor_written(mapper, connection, target):
+    _stage(target, [PLATFORM_SCOPE, vendor_scope(target.id)])
+
+
+@event.listens_for(Event, "after_insert")
+@event.listens_for(Event, "after_update")
+@event.listens_for(Event, "after_delete")
+def _event_written(mapper, connection, target):
+    _stage(target, [PLATFORM_SCOPE])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    scopes = session.info.pop(_PENDING_KEY, None)
+    if scopes:
+        AnalyticsCache.invalidate(scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
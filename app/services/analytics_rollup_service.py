@@ -0,0 +1,559 @@
+# app/services/analytics_rollup_service.py
+
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, func, select, delete, insert, case, inspect
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.analytics_rollup_m import VendorDailyRollup, EventDailyRollup
+from app.models.event_m import Event, EventStatus
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_order_m import VendorOrder
+from app.services.analytics_cache import AnalyticsCache
+from app.utils.date_bucket_utils import bucket_expr, to_date
+
+ROLLUP_METRICS = ("orders_confirmed", "revenue", "bids_submitted", "bids_pending", "bids_won")
+WON_BID_STATUSES = ("accepted", "selected")
+
+
+def _dialect_name(conn) -> str:
+    dialect = getattr(conn, "dialect", None) or conn.get_bind().dialect
+    return dialect.name
+
+
+def _bounds(day_from: date, day_to: date) -> Tuple[datetime, datetime]:
+    """[start, end) datetimes covering whole days day_from..day_to"""
+    start = datetime.combine(day_from, datetime.min.time())
+    end = datetime.combine(day_to + timedelta(days=1), datetime.min.time())
+    return start, end
+
+
+def _empty_metrics() -> dict:
+    return {"orders_confirmed": 0, "revenue": 0.0, "bids_submitted": 0, "bids_pending": 0, "bids_won": 0}
+
+
+class AnalyticsRollupService:
+    """
+    Daily rollups behind the admin and vendor analytics endpoints.
+
+    Writes keep the rollups current with signed deltas: each transaction
+    works out how its order / bid / event changes move the (vendor, day)
+    and (day, category, status) totals and adds exactly that with an
+    upsert (count = count + delta) just before it commits. Concurrent
+    writers therefore add to each other's totals instead of overwriting
+    them. Platform totals are summed from the vendor rows at read time.
+
+    Writes that bypass both the ORM and track_event_bids() are not
+    counted; the compaction job rebuilds days from the source tables to
+    repair any such drift.
+    """
+
+    # --------------------------------------------------
+    # REBUILD FROM SOURCE
+    # --------------------------------------------------
+    @staticmethod
+    def _vendor_aggregates(
+        conn,
+        day_from: date,
+        day_to: date,
+        vendor_ids: Optional[Iterable[int]] = None
+    ) -> Dict[Tuple[int, date], dict]:
+        dialect = _dialect_name(conn)
+        start, end = _bounds(day_from, day_to)
+        vendor_ids = list(vendor_ids) if vendor_ids is not None else None
+        rows: Dict[Tuple[int, date], dict] = defaultdict(_empty_metrics)
+
+        def scoped(stmt, vendor_column):
+            return stmt if vendor_ids is None else stmt.where(vendor_column.in_(vendor_ids))
+
+        # Confirmed orders and revenue, by confirmed_at
+        day = bucket_expr(VendorOrder.confirmed_at, "day", dialect)
+        stmt = select(
+            VendorOrder.vendor_id, day,
+            func.count(VendorOrder.id), func.coalesce(func.sum(VendorOrder.amount), 0)
+        ).where(
+            VendorOrder.status == "confirmed",
+            VendorOrder.confirmed_at >= start,
+            VendorOrder.confirmed_at < end
+        ).group_by(VendorOrder.vendor_id, day)
+
+        for vendor_id, bucket, orders, revenue in conn.execute(scoped(stmt, VendorOrder.vendor_id)):
+            metrics = rows[(vendor_id, to_date(bucket))]
+            metrics["orders_confirmed"] = orders
+            metrics["revenue"] = float(revenue)
+
+        # Submitted / still pending bids, by submitted_at
+        day = bucket_expr(VendorBid.submitted_at, "day", dialect)
+        stmt = select(
+            VendorBid.vendor_id, day,
+            func.count(VendorBid.id),
+            func.sum(case((VendorBid.status == "submitted", 1), else_=0))
+        ).where(
+            VendorBid.inactive == False,
+            VendorBid.submitted_at >= start,
+            VendorBid.submitted_at < end
+        ).group_by(VendorBid.vendor_id, day)
+
+        for vendor_id, bucket, submitted, pending in conn.execute(scoped(stmt, VendorBid.vendor_id)):
+            metrics = rows[(vendor_id, to_date(bucket))]
+            metrics["bids_submitted"] = submitted
+            metrics["bids_pending"] = int(pending or 0)
+
+        # Won bids, by selected_at
+        day = bucket_expr(VendorBid.selected_at, "day", dialect)
+        stmt = select(
+            VendorBid.vendor_id, day, func.count(VendorBid.id)
+        ).where(
+            VendorBid.inactive == False,
+            VendorBid.status.in_(WON_BID_STATUSES),
+            VendorBid.selected_at >= start,
+            VendorBid.selected_at < end
+        ).group_by(VendorBid.vendor_id, day)
+
+        for vendor_id, bucket, won in conn.execute(scoped(stmt, VendorBid.vendor_id)):
+            rows[(vendor_id, to_date(bucket))]["bids_won"] = won
+
+        return rows
+
+    @staticmethod
+    def rebuild_vendor_days(
+        conn,
+        day_from: date,
+        day_to: date,
+        vendor_ids: Optional[Iterable[int]] = None
+    ):
+        vendor_ids = list(vendor_ids) if vendor_ids is not None else None
+        aggregates = AnalyticsRollupService._vendor_aggregates(conn, day_from, day_to, vendor_ids)
+
+        stmt = delete(VendorDailyRollup).where(
+            VendorDailyRollup.day >= day_from,
+            VendorDailyRollup.day <= day_to
+        )
+        if vendor_ids is not None:
+            stmt = stmt.where(VendorDailyRollup.vendor_id.in_(vendor_ids))
+        conn.execute(stmt.execution_options(synchronize_session=False))
+
+        if aggregates:
+            conn.execute(insert(VendorDailyRollup), [
+                {"vendor_id": vendor_id, "day": day, **metrics}
+                for (vendor_id, day), metrics in aggregates.items()
+            ])
+
+    @staticmethod
+    def rebuild_event_days(conn, day_from: date, day_to: date):
+        start, end = _bounds(day_from, day_to)
+        day = bucket_expr(Event.event_date, "day", _dialect_name(conn))
+
+        rows = conn.execute(
+            select(day, Event.category_id, Event.status, func.count(Event.id))
+            .where(
+                Event.inactive == False,
+                Event.event_date >= start,
+                Event.event_date < end
+            )
+            .group_by(day, Event.category_id, Event.status)
+        ).all()
+
+        conn.execute(delete(EventDailyRollup).where(
+            EventDailyRollup.day >= day_from,
+            EventDailyRollup.day <= day_to
+        ).execution_options(synchronize_session=False))
+
+        if rows:
+            conn.execute(insert(EventDailyRollup), [
+                {
+                    "day": to_date(bucket),
+                    "category_id": category_id,
+                    "status": getattr(status, "value", status) or EventStatus.PLANNING.value,
+                    "events": count,
+                }
+                for bucket, category_id, status, count in rows
+            ])
+
+    # --------------------------------------------------
+    # DELTAS
+    # --------------------------------------------------
+    @staticmethod
+    def _upsert_add(conn, model, keys: Tuple[str, ...], metrics: Tuple[str, ...], rows: List[dict]):
+        """INSERT the rows, or add their metrics to the existing row with the same keys"""
+        table = model.__table__
+        dialect = _dialect_name(conn)
+
+        if dialect == "mysql":
+            stmt = mysql.insert(table).values(rows)
+            stmt = stmt.on_duplicate_key_update({m: table.c[m] + stmt.inserted[m] for m in metrics})
+        else:
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = dialect_insert(table).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c[k] for k in keys],
+                set_={m: table.c[m] + stmt.excluded[m] for m in metrics}
+            )
+        conn.execute(stmt)
+
+    @staticmethod
+    def apply_deltas(conn, vendor_deltas: Dict[tuple, dict], event_deltas: Dict[tuple, int]):
+        """Add staged deltas to the rollups, in key order so writers lock rows in the same order"""
+        vendor_rows = [
+            {"vendor_id": vendor_id, "day": day, **{m: delta.get(m, 0) for m in ROLLUP_METRICS}}
+            for (vendor_id, day), delta in sorted(vendor_deltas.items())
+            if any(delta.values())
+        ]
+        if vendor_rows:
+            AnalyticsRollupService._upsert_add(
+                conn, VendorDailyRollup, ("vendor_id", "day"), ROLLUP_METRICS, vendor_rows
+            )
+
+        event_rows = [
+            {"day": day, "category_id": category_id, "status": status, "events": delta}
+            for (day, category_id, status), delta in sorted(event_deltas.items())
+            if delta
+        ]
+        if event_rows:
+            AnalyticsRollupService._upsert_add(
+                conn, EventDailyRollup, ("day", "category_id", "status"), ("events",), event_rows
+            )
+
+    # --------------------------------------------------
+    # COMPACTION
+    # --------------------------------------------------
+    @staticmethod
+    def compact(
+        db: Session,
+        day_from: Optional[date] = None,
+        day_to: Optional[date] = None,
+        chunk_days: int = 31
+    ) -> int:
+        """
+        Rebuild every rollup between day_from and day_to (default: from the
+        oldest to the newest source row, at least up to today) in chunks,
+        one commit per chunk. The newest row is usually a future event_date,
+        which the event counts on the dashboards include. Picks up bulk
+        UPDATEs that bypass the ORM. Returns days processed.
+        """
+        today = datetime.utcnow().date()
+        columns = (VendorOrder.confirmed_at, VendorBid.submitted_at,
+                   VendorBid.selected_at, Event.event_date)
+
+        if day_to is None:
+            newest = [db.execute(select(func.max(column))).scalar() for column in columns]
+            day_to = max([today] + [to_date(value) for value in newest if value is not None])
+
+        if day_from is None:
+            oldest = [db.execute(select(func.min(column))).scalar() for column in columns]
+            oldest = [to_date(value) for value in oldest if value is not None]
+            day_from = min(oldest) if oldest else today
+
+        # Each chunk must start a fresh transaction (see below)
+        db.commit()
+
+        processed = 0
+        chunk_start = day_from
+        while chunk_start <= day_to:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), day_to)
+
+            # Lock the chunk's rollup rows before reading any source table:
+            # writers adding deltas there wait for this commit, and the
+            # source snapshot is only taken once the lock is held, so every
+            # write is either counted in the rebuild or added on top of it
+            for model in (VendorDailyRollup, EventDailyRollup):
+                db.execute(
+                    select(model.id)
+                    .where(model.day >= chunk_start, model.day <= chunk_end)
+                    .with_for_update()
+                ).all()
+
+            AnalyticsRollupService.rebuild_vendor_days(db, chunk_start, chunk_end)
+            AnalyticsRollupService.rebuild_event_days(db, chunk_start, chunk_end)
+            db.commit()
+
+            processed += (chunk_end - chunk_start).days + 1
+            chunk_start = chunk_end + timedelta(days=1)
+
+        return processed
+
+    @staticmethod
+    @contextmanager
+    def track_event_bids(db: Session, event_ids: Iterable[int]):
+        """
+        Count bulk UPDATEs of these events' bids (they skip mapper events):
+
+            with AnalyticsRollupService.track_event_bids(db, event_ids):
+                db.query(VendorBid).filter(...).update(...)
+
+        The bids are locked and their rollup contributions read before and
+        after the block; the difference is staged like any other delta.
+        """
+        event_ids = list(event_ids)
+        db.flush()
+
+        def contributions(lock: bool) -> Dict[tuple, dict]:
+            query = db.query(
+                *(getattr(VendorBid, attr) for attr in _BID_STATE)
+            ).filter(VendorBid.event_id.in_(event_ids))
+            if lock:
+                query = query.with_for_update()
+
+            totals: Dict[tuple, dict] = defaultdict(lambda: defaultdict(float))
+            for row in query.all():
+                for key, metric, value in _bid_contributions(dict(zip(_BID_STATE, row))):
+                    totals[key][metric] += value
+            return totals
+
+        before = contributions(lock=True)
+        yield
+        db.flush()
+        after = contributions(lock=False)
+
+        pending = _pending(db)
+        for key in set(before) | set(after):
+            for metric in ROLLUP_METRICS:
+                delta = after.get(key, {}).get(metric, 0) - before.get(key, {}).get(metric, 0)
+                if delta:
+                    pending["vendor"][key][metric] += delta
+
+        AnalyticsCache.mark_vendors(db, {vendor_id for vendor_id, _ in set(before) | set(after)})
+
+    # --------------------------------------------------
+    # READS
+    # --------------------------------------------------
+    @staticmethod
+    def _period_columns(day_column, start_day: date, prev_start_day: date, values):
+        """SUM(CASE ...) pairs splitting each value into current / previous period"""
+        current = day_column >= start_day
+        previous = (day_column >= prev_start_day) & (day_column < start_day)
+        columns = []
+        for value in values:
+            columns.append(func.coalesce(func.sum(case((current, value), else_=0)), 0))
+            columns.append(func.coalesce(func.sum(case((previous, value), else_=0)), 0))
+        return columns
+
+    @staticmethod
+    def _split_periods(names, row) -> Tuple[dict, dict]:
+        current = {name: row[2 * i] for i, name in enumerate(names)}
+        previous = {name: row[2 * i + 1] for i, name in enumerate(names)}
+        return current, previous
+
+    @staticmethod
+    def platform_totals(db: Session, start_day: date, prev_start_day: date) -> Tuple[dict, dict]:
+        """
+        Platform metrics for [start_day, today] and [prev_start_day, start_day),
+        summed over every vendor's rows in one pass
+        """
+        row = db.query(
+            *AnalyticsRollupService._period_columns(
+                VendorDailyRollup.day, start_day, prev_start_day,
+                [getattr(VendorDailyRollup, m) for m in ROLLUP_METRICS]
+            )
+        ).filter(VendorDailyRollup.day >= prev_start_day).one()
+        return AnalyticsRollupService._split_periods(ROLLUP_METRICS, row)
+
+    @staticmethod
+    def vendor_totals(db: Session, vendor_id: int, start_day: date, prev_start_day: date) -> Tuple[dict, dict]:
+        """Current / previous period metrics for one vendor, plus all-time revenue, in one query"""
+        row = db.query(
+            *AnalyticsRollupService._period_columns(
+                VendorDailyRollup.day, start_day, prev_start_day,
+                [getattr(VendorDailyRollup, m) for m in ROLLUP_METRICS]
+            ),
+            func.coalesce(func.sum(VendorDailyRollup.revenue), 0)
+        ).filter(VendorDailyRollup.vendor_id == vendor_id).one()
+
+        current, previous = AnalyticsRollupService._split_periods(ROLLUP_METRICS, row[:-1])
+        current["revenue_all_time"] = row[-1]
+        return current, previous
+
+    @staticmethod
+    def event_totals(db: Session, start_day: date, prev_start_day: date) -> Tuple[dict, dict]:
+        completed = case(
+            (EventDailyRollup.status == EventStatus.COMPLETED.value, EventDailyRollup.events),
+            else_=0
+        )
+        row = db.query(
+            *AnalyticsRollupService._period_columns(
+                EventDailyRollup.day, start_day, prev_start_day,
+                [EventDailyRollup.events, completed]
+            )
+        ).filter(EventDailyRollup.day >= prev_start_day).one()
+        return AnalyticsRollupService._split_periods(("events", "completed"), row)
+
+    @staticmethod
+    def vendor_daily_revenue(db: Session, vendor_id: int, start_day: date) -> List[Tuple[date, float]]:
+        rows = db.query(VendorDailyRollup.day, VendorDailyRollup.revenue).filter(
+            VendorDailyRollup.vendor_id == vendor_id,
+            VendorDailyRollup.day >= start_day,
+            VendorDailyRollup.orders_confirmed > 0
+        ).order_by(VendorDailyRollup.day).all()
+        return [(to_date(day), float(revenue)) for day, revenue in rows]
+
+
+# --------------------------------------------------
+# INCREMENTAL DELTAS FROM ORM WRITES
+# --------------------------------------------------
+# Each write's contribution to the rollups is worked out from the row's
+# state before and after the flush (removed from the old keys, added to the
+# new ones). Deltas collect per session and are upserted just before the
+# transaction commits, so rollups commit (or roll back) with the write.
+_PENDING_KEY = "analytics_rollup_pending"
+
+_ORDER_STATE = ("vendor_id", "status", "amount", "confirmed_at")
+_BID_STATE = ("vendor_id", "status", "inactive", "submitted_at", "selected_at")
+_EVENT_STATE = ("status", "event_date", "category_id", "inactive")
+
+
+def _pending(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {
+        "vendor": defaultdict(lambda: defaultdict(float)),
+        "event": defaultdict(int),
+    })
+
+
+def _order_contributions(state: dict):
+    """((vendor_id, day), metric, amount) added to the rollups by an order in this state"""
+    if state["status"] == "confirmed" and state["confirmed_at"] is not None and state["vendor_id"] is not None:
+        key = (state["vendor_id"], to_date(state["confirmed_at"]))
+        yield key, "orders_confirmed", 1
+        yield key, "revenue", float(state["amount"] or 0)
+
+
+def _bid_contributions(state: dict):
+    if state["inactive"] or state["vendor_id"] is None:
+        return
+    if state["submitted_at"] is not None:
+        key = (state["vendor_id"], to_date(state["submitted_at"]))
+        yield key, "bids_submitted", 1
+        if state["status"] == "submitted":
+            yield key, "bids_pending", 1
+    if state["status"] in WON_BID_STATUSES and state["selected_at"] is not None:
+        yield (state["vendor_id"], to_date(state["selected_at"])), "bids_won", 1
+
+
+def _event_key(state: dict):
+    if state["inactive"] or state["event_date"] is None:
+        return None
+    status = getattr(state["status"], "value", state["status"]) or EventStatus.PLANNING.value
+    return to_date(state["event_date"]), state["category_id"], status
+
+
+def _states(target, attrs, old: bool, new: bool):
+    """(old state, new state) dicts of the row around this flush; None where absent"""
+    state = inspect(target)
+    current, previous = {}, {}
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if history.added or history.unchanged:
+            value = (history.added or history.unchanged)[0]
+        else:
+            # Never set on a new row (NULL), or not loaded on an existing one
+            value = state.dict.get(attr) if not old else getattr(target, attr)
+        current[attr] = value
+        previous[attr] = history.deleted[0] if history.deleted else value
+    return (previous if old else None), (current if new else None)
+
+
+def _changed(target, attrs) -> bool:
+    state = inspect(target)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _stage_vendor(target, attrs, contributions, old: bool, new: bool):
+    session = Session.object_session(target)
+    if session is None or (old and new and not _changed(target, attrs)):
+        return
+
+    before, after = _states(target, attrs, old, new)
+    pending = _pending(session)["vendor"]
+    for state, sign in ((before, -1), (after, 1)):
+        if state is not None:
+            for key, metric, value in contributions(state):
+                pending[key][metric] += sign * value
+
+
+def _stage_event(target, old: bool, new: bool):
+    session = Session.object_session(target)
+    if session is None or (old and new and not _changed(target, _EVENT_STATE)):
+        return
+
+    before, after = _states(target, _EVENT_STATE, old, new)
+    pending = _pending(session)["event"]
+    for state, sign in ((before, -1), (after, 1)):
+        key = _event_key(state) if state is not None else None
+        if key is not None:
+            pending[key] += sign
+
+
+# Load the previous value when these are set on a row whose attribute was
+# not loaded, so the old contribution can be subtracted
+def _keep_old_value(target, value, oldvalue, initiator):
+    return value
+
+
+for _model, _attrs in ((VendorOrder, _ORDER_STATE), (VendorBid, _BID_STATE), (Event, _EVENT_STATE)):
+    for _attr in _attrs:
+        event.listen(getattr(_model, _attr), "set", _keep_old_value, active_history=True, retval=True)
+
+
+@event.listens_for(VendorOrder, "after_insert")
+def _order_inserted(mapper, connection, target):
+    _stage_vendor(target, _ORDER_STATE, _order_contributions, old=False, new=True)
+
+
+@event.listens_for(VendorOrder, "after_update")
+def _order_updated(mapper, connection, target):
+    _stage_vendor(target, _ORDER_STATE, _order_contributions, old=True, new=True)
+
+
+@event.listens_for(VendorOrder, "after_delete")
+def _order_deleted(mapper, connection, target):
+    _stage_vendor(target, _ORDER_STATE, _order_contributions, old=True, new=False)
+
+
+@event.listens_for(VendorBid, "after_insert")
+def _bid_inserted(mapper, connection, target):
+    _stage_vendor(target, _BID_STATE, _bid_contributions, old=False, new=True)
+
+
+@event.listens_for(VendorBid, "after_update")
+def _bid_updated(mapper, connection, target):
+    _stage_vendor(target, _BID_STATE, _bid_contributions, old=True, new=True)
+
+
+@event.listens_for(VendorBid, "after_delete")
+def _bid_deleted(mapper, connection, target):
+    _stage_vendor(target, _BID_STATE, _bid_contributions, old=True, new=False)
+
+
+@event.listens_for(Event, "after_insert")
+def _event_inserted(mapper, connection, target):
+    _stage_event(target, old=False, new=True)
+
+
+@event.listens_for(Event, "after_update")
+def _event_updated(mapper, connection, target):
+    _stage_event(target, old=True, new=True)
+
+
+@event.listens_for(Event, "after_delete")
+def _event_deleted(mapper, connection, target):
+    _stage_event(target, old=True, new=False)
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_pending(session):
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not (pending["vendor"] or pending["event"]):
+        return
+
+    AnalyticsRollupService.apply_deltas(session, pending["vendor"], pending["event"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,106 @@
+# app/services/analytics_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi import HTTPException
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from app.models.vendor_order_m import VendorOrder
+from app.utils.date_bucket_utils import BUCKETS, bucket_expr, bucket_count, iter_buckets, to_date
+
+# Upper bound on points per series (e.g. ~13 years of daily buckets)
+MAX_SERIES_POINTS = 5000
+
+# Dashboard time_range -> period length in days
+PERIOD_DAYS = {"week": 7, "month": 30, "year": 365}
+
+
+class AnalyticsService:
+
+    # --------------------------------------------------
+    # PERIOD COMPARISON
+    # --------------------------------------------------
+    @staticmethod
+    def period_start_days(time_range: str, today: Optional[date] = None) -> Tuple[date, date]:
+        """
+        First day of the current period (which ends today) and of the
+        equally long period before it, e.g. the last 30 days vs the 30 before.
+        """
+        days = PERIOD_DAYS.get(time_range, PERIOD_DAYS["month"])
+        start_day = (today or datetime.utcnow().date()) - timedelta(days=days - 1)
+        return start_day, start_day - timedelta(days=days)
+
+    @staticmethod
+    def change_pct(current, previous) -> str:
+        """Relative change as shown on stat cards, e.g. "+12%" """
+        current, previous = float(current or 0), float(previous or 0)
+        if previous == 0:
+            return "+100%" if current > 0 else "0%"
+        return f"{(current - previous) / previous * 100:+.0f}%"
+
+    @staticmethod
+    def change_abs(current, previous, digits: int = 0) -> str:
+        """Absolute change, e.g. "+3" or "+0.2" """
+        delta = float(current or 0) - float(previous or 0)
+        if round(delta, digits) == 0:
+            return "0"
+        return f"{delta:+.{digits}f}"
+
+    # --------------------------------------------------
+    # REVENUE TIME SERIES
+    # --------------------------------------------------
+    @staticmethod
+    def revenue_series(
+        db: Session,
+        start: datetime,
+        end: datetime,
+        bucket: str = "day",
+        vendor_id: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Confirmed order revenue per day / week / month between start and end.
+
+        Buckets are computed with GROUP BY in the database, so only one row
+        per bucket leaves it. Empty buckets are filled with zeros and the
+        series is returned oldest first.
+        """
+        if bucket not in BUCKETS:
+            raise HTTPException(400, f"bucket must be one of: {', '.join(BUCKETS)}")
+
+        if start > end:
+            raise HTTPException(400, "start must be before end")
+
+        if bucket_count(start, end, bucket) > MAX_SERIES_POINTS:
+            raise HTTPException(400, f"Range too large for {bucket} buckets")
+
+        period = bucket_expr(
+            VendorOrder.confirmed_at, bucket, db.get_bind().dialect.name
+        ).label("period")
+
+        query = db.query(
+            period,
+            func.coalesce(func.sum(VendorOrder.amount), 0),
+            func.count(VendorOrder.id)
+        ).filter(
+            VendorOrder.status == "confirmed",
+            VendorOrder.confirmed_at >= start,
+            VendorOrder.confirmed_at <= end
+        )
+
+        if vendor_id is not None:
+            query = query.filter(VendorOrder.vendor_id == vendor_id)
+
+        totals = {
+            to_date(row_period): (float(revenue), orders)
+            for row_period, revenue, orders in query.group_by(period).all()
+        }
+
+        return [
+            {
+                "period": day,
+                "revenue": totals.get(day, (0.0, 0))[0],
+                "orders": totals.get(day, (0.0, 0))[1],
+            }
+            for day in iter_buckets(start, end, bucket)
+        ]
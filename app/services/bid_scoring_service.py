@@ -0,0 +1,370 @@
+# app/services/bid_scoring_service.py
+
+import numpy as np
+from sqlalchemy import event, select, update, bindparam, inspect
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from typing import Dict, List, Optional, Sequence
+
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_m import Vendor
+from app.models.event_m import Event, BiddingStatus
+from app.schemas.vendor_bid_schema import (
+    BidScoreWeightsSchema,
+    AdminBidWhatIfItemSchema,
+    AdminBidWhatIfResponse,
+)
+
+
+# --------------------------------------------------
+# WEIGHT PROFILES
+# --------------------------------------------------
+WEIGHT_PROFILES: Dict[str, BidScoreWeightsSchema] = {
+    "default": BidScoreWeightsSchema(),
+    "price_focused": BidScoreWeightsSchema(
+        rating=20, experience=15, budget_savings=40,
+        budget_overrun=30, timeline=10, reviews=5
+    ),
+    "quality_focused": BidScoreWeightsSchema(
+        rating=40, experience=30, budget_savings=10,
+        budget_overrun=10, timeline=5, reviews=15
+    ),
+}
+
+
+class BidScoreColumns:
+    """
+    Columnar (one array per field) view of a set of bids, so a whole
+    event - or every open event - is scored in a few array operations.
+    Missing values are stored as 0, matching the scalar rules.
+    """
+
+    FIELDS = (
+        "bid_id", "event_id", "vendor_id", "amount", "timeline_days",
+        "rating", "completed_events", "total_reviews", "budget",
+    )
+
+    def __init__(self, rows: Sequence[tuple]):
+        if rows:
+            columns = list(zip(*rows))
+        else:
+            columns = [()] * len(self.FIELDS)
+
+        for name, values in zip(self.FIELDS, columns):
+            if name in ("bid_id", "event_id", "vendor_id"):
+                setattr(self, name, np.fromiter(values, np.int64, len(values)))
+            else:
+                # float() per value is far cheaper than numpy coercing Decimals
+                setattr(self, name, np.fromiter(
+                    (0.0 if v is None else float(v) for v in values),
+                    np.float64,
+                    len(values)
+                ))
+
+    @classmethod
+    def from_bids(cls, bids_with_vendors, event: Event) -> "BidScoreColumns":
+        """Build from already loaded (VendorBid, Vendor) pairs of one event"""
+        return cls([
+            (
+                bid.id, bid.event_id, vendor.id, bid.total_amount, bid.timeline_days,
+                vendor.rating, vendor.completed_events, vendor.total_reviews, event.budget
+            )
+            for bid, vendor in bids_with_vendors
+        ])
+
+    def __len__(self):
+        return len(self.bid_id)
+
+
+class BidScoringService:
+
+    # --------------------------------------------------
+    # PROFILES
+    # --------------------------------------------------
+    @staticmethod
+    def get_profile(name: Optional[str]) -> BidScoreWeightsSchema:
+        weights = WEIGHT_PROFILES.get(name or "default")
+        if weights is None:
+            raise HTTPException(
+                400,
+                f"Unknown scoring profile '{name}'. "
+                f"Available: {', '.join(sorted(WEIGHT_PROFILES))}"
+            )
+        return weights
+
+    @staticmethod
+    def register_profile(name: str, weights: BidScoreWeightsSchema):
+        WEIGHT_PROFILES[name] = weights
+
+    # --------------------------------------------------
+    # LOADING
+    # --------------------------------------------------
+    @staticmethod
+    def _score_inputs():
+        return select(
+            VendorBid.id,
+            VendorBid.event_id,
+            VendorBid.vendor_id,
+            VendorBid.total_amount,
+            VendorBid.timeline_days,
+            Vendor.rating,
+            Vendor.completed_events,
+            Vendor.total_reviews,
+            Event.budget
+        ).join(
+            Vendor, Vendor.id == VendorBid.vendor_id
+        ).join(
+            Event, Event.id == VendorBid.event_id
+        )
+
+    @staticmethod
+    def load_columns(db: Session, event_ids: Optional[List[int]] = None) -> BidScoreColumns:
+        """Submitted bids of the given events, or of every event open for review"""
+        stmt = BidScoringService._score_inputs().where(
+            VendorBid.status == "submitted",
+            VendorBid.inactive == False
+        )
+
+        if event_ids is not None:
+            stmt = stmt.where(VendorBid.event_id.in_(event_ids))
+        else:
+            stmt = stmt.where(
+                Event.bidding_status.in_([BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW]),
+                Event.inactive == False
+            )
+
+        return BidScoreColumns(db.execute(stmt.order_by(VendorBid.event_id, VendorBid.id)).all())
+
+    # --------------------------------------------------
+    # SCORING
+    # --------------------------------------------------
+    @staticmethod
+    def score(
+        columns: BidScoreColumns,
+        weights: Optional[BidScoreWeightsSchema] = None
+    ) -> np.ndarray:
+        """
+        Auto score (0-100) for every bid in columns.
+
+        With the default weights this is the standard scoring: rating x6,
+        1.5 pts per completed event (cap 25), up to 20 for coming in under
+        budget / minus up to 15 for going over, 10/7/5/3 by timeline and
+        1 pt per 10 reviews (cap 10). Other weights rescale each component
+        to its new maximum.
+        """
+        w = weights or WEIGHT_PROFILES["default"]
+
+        # 1. Rating (0-5 stars)
+        score = columns.rating * (w.rating / 5)
+
+        # 2. Experience
+        score += np.minimum(columns.completed_events * 1.5 * (w.experience / 25), w.experience)
+
+        # 3. Budget competitiveness (only when both amounts are known)
+        budget = columns.budget
+        amount = columns.amount
+        priced = (budget != 0) & (amount != 0)
+        diff_pct = np.divide(
+            (budget - amount) * 100, budget,
+            out=np.zeros_like(budget), where=priced
+        )
+        savings = np.minimum(diff_pct / 4 * (w.budget_savings / 20), w.budget_savings)
+        overrun = np.minimum(-diff_pct / 2 * (w.budget_overrun / 15), w.budget_overrun)
+        score += np.where(priced & (amount <= budget), savings, 0.0)
+        score -= np.where(priced & (amount > budget), overrun, 0.0)
+
+        # 4. Timeline
+        days = columns.timeline_days
+        score += np.select(
+            [days == 0, days <= 30, days <= 60, days <= 90],
+            [0.0, 10.0, 7.0, 5.0],
+            default=3.0
+        ) * (w.timeline / 10)
+
+        # 5. Reviews
+        score += np.minimum(columns.total_reviews / 10 * (w.reviews / 10), w.reviews)
+
+        return np.clip(score, 0, 100)
+
+    @staticmethod
+    def rank(columns: BidScoreColumns, scores: np.ndarray) -> np.ndarray:
+        """1-based rank of each bid within its event (ties broken by bid id)"""
+        order = np.lexsort((columns.bid_id, -scores, columns.event_id))
+        ranks = np.empty(len(order), dtype=np.int64)
+        if not len(order):
+            return ranks
+
+        sorted_events = columns.event_id[order]
+        starts = np.r_[0, np.flatnonzero(np.diff(sorted_events)) + 1]
+        group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        ranks[order] = np.arange(len(order)) - group_start + 1
+        return ranks
+
+    @staticmethod
+    def score_events(
+        db: Session,
+        event_ids: Optional[List[int]] = None,
+        profile: Optional[str] = None
+    ) -> Dict[int, float]:
+        """bid_id -> auto score for the given events (default: all open events)"""
+        columns = BidScoringService.load_columns(db, event_ids)
+        scores = BidScoringService.score(columns, BidScoringService.get_profile(profile))
+        return dict(zip(columns.bid_id.tolist(), scores.round(2).tolist()))
+
+    # --------------------------------------------------
+    # WHAT-IF
+    # --------------------------------------------------
+    @staticmethod
+    def what_if(
+        db: Session,
+        event_id: int,
+        weights: Optional[BidScoreWeightsSchema] = None,
+        profile: Optional[str] = None
+    ) -> AdminBidWhatIfResponse:
+        """Re-rank an event's bids under candidate weights, against the default ranking"""
+        event = db.query(Event.id).filter(Event.id == event_id).first()
+        if not event:
+            raise HTTPException(404, "Event not found")
+
+        candidate = weights or BidScoringService.get_profile(profile)
+        columns = BidScoringService.load_columns(db, [event_id])
+
+        baseline_scores = BidScoringService.score(columns)
+        baseline_ranks = BidScoringService.rank(columns, baseline_scores)
+        scores = BidScoringService.score(columns, candidate)
+        ranks = BidScoringService.rank(columns, scores)
+
+        bids = [
+            AdminBidWhatIfItemSchema(
+                bidId=bid_id,
+                vendorId=vendor_id,
+                score=round(score, 2),
+                rank=rank,
+                baselineScore=round(baseline_score, 2),
+                baselineRank=baseline_rank,
+                rankChange=baseline_rank - rank
+            )
+            for bid_id, vendor_id, score, rank, baseline_score, baseline_rank in zip(
+                columns.bid_id.tolist(),
+                columns.vendor_id.tolist(),
+                scores.tolist(),
+                ranks.tolist(),
+                baseline_scores.tolist(),
+                baseline_ranks.tolist()
+            )
+        ]
+        bids.sort(key=lambda b: b.rank)
+
+        return AdminBidWhatIfResponse(eventId=event_id, weights=candidate, bids=bids)
+
+    # --------------------------------------------------
+    # STORED SCORES (VendorBid.auto_score)
+    # --------------------------------------------------
+    @staticmethod
+    def refresh_stored_scores(
+        conn,
+        event_ids: Optional[List[int]] = None,
+        vendor_ids: Optional[List[int]] = None,
+        bid_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        Recompute VendorBid.auto_score (default weights) for the matching
+        bids and write it back in one executemany UPDATE.
+        conn may be a Session or a Connection. Returns bids updated.
+        """
+        stmt = BidScoringService._score_inputs()
+        if event_ids is not None:
+            stmt = stmt.where(VendorBid.event_id.in_(event_ids))
+        if vendor_ids is not None:
+            stmt = stmt.where(VendorBid.vendor_id.in_(vendor_ids))
+        if bid_ids is not None:
+            stmt = stmt.where(VendorBid.id.in_(bid_ids))
+
+        columns = BidScoreColumns(conn.execute(stmt).all())
+        if not len(columns):
+            return 0
+
+        scores = BidScoringService.score(columns).round(2)
+        table = VendorBid.__table__
+        conn.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(auto_score=bindparam("b_score")),
+            [
+                {"b_id": bid_id, "b_score": score}
+                for bid_id, score in zip(columns.bid_id.tolist(), scores.tolist())
+            ]
+        )
+        return len(columns)
+
+    @staticmethod
+    def reconcile_stored_scores(db: Session, batch_size: int = 5000) -> int:
+        """Rescore every bid in id batches. Returns bids processed."""
+        processed = 0
+        last_id = 0
+
+        while True:
+            ids = db.execute(
+                select(VendorBid.id)
+                .where(VendorBid.id > last_id)
+                .order_by(VendorBid.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+
+            processed += BidScoringService.refresh_stored_scores(db, bid_ids=ids)
+            db.commit()
+            last_id = ids[-1]
+
+        return processed
+
+
+# --------------------------------------------------
+# KEEP STORED SCORES IN SYNC WITH THEIR INPUTS
+# --------------------------------------------------
+# The score depends on the bid's amount/timeline, the vendor's rating,
+# reviews and completed events, and the event budget. Vendors and events
+# flush before their bids (FK order), so a bid written in the same flush
+# is scored against the new values.
+_BID_INPUTS = ("total_amount", "timeline_days", "vendor_id", "event_id")
+_VENDOR_INPUTS = ("rating", "total_reviews", "completed_events")
+_EVENT_INPUTS = ("budget",)
+
+
+def _changed(target, attrs) -> bool:
+    state = inspect(target)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(VendorBid, "before_insert")
+@event.listens_for(VendorBid, "before_update")
+def _score_bid(mapper, connection, target):
+    if inspect(target).has_identity and not _changed(target, _BID_INPUTS):
+        return
+
+    budget = select(Event.budget).where(Event.id == target.event_id).scalar_subquery()
+    row = connection.execute(
+        select(Vendor.rating, Vendor.completed_events, Vendor.total_reviews, budget)
+        .where(Vendor.id == target.vendor_id)
+    ).first()
+    if row is None:
+        return
+
+    columns = BidScoreColumns([(
+        target.id or 0, target.event_id, target.vendor_id,
+        target.total_amount, target.timeline_days, *row
+    )])
+    target.auto_score = round(float(BidScoringService.score(columns)[0]), 2)
+
+
+@event.listens_for(Vendor, "after_update")
+def _vendor_score_inputs_changed(mapper, connection, target):
+    if _changed(target, _VENDOR_INPUTS):
+        BidScoringService.refresh_stored_scores(connection, vendor_ids=[target.id])
+
+
+@event.listens_for(Event, "after_update")
+def _event_score_inputs_changed(mapper, connection, target):
+    if _changed(target, _EVENT_INPUTS):
+        BidScoringService.refresh_stored_scores(connection, event_ids=[target.id])
@@ -0,0 +1,188 @@
+# app/services/chat_hub.py
+
+import asyncio
+import json
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional, Set
+
+from app.config import settings
+from app.utils.metrics_utils import metrics
+
+# Queued in place of a slow subscriber's backlog; its socket is then closed
+OVERFLOW = object()
+
+Deliver = Callable[[int, dict], None]
+
+
+class ChatSubscription:
+    """One connected socket: a bounded queue of messages waiting to be sent"""
+
+    def __init__(self, chat_id: int, user_id: int, max_queue: int):
+        self.chat_id = chat_id
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def offer(self, message: dict) -> bool:
+        """Queue without waiting; on a full queue drop the backlog and flag overflow"""
+        if self.overflowed:
+            return False
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+            return False
+
+
+# ----------------------------
+# BROKERS
+# ----------------------------
+# The hub publishes through a broker and receives every message (its own
+# included) back through deliver(). LocalChatBroker loops straight back in
+# this process; RedisChatBroker fans out across workers over Redis pub/sub
+# and accepts any redis.asyncio-compatible client.
+
+class LocalChatBroker:
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def publish(self, chat_id: int, message: dict):
+        self._deliver(chat_id, message)
+
+    async def stop(self):
+        self._deliver = None
+
+
+class RedisChatBroker:
+
+    def __init__(self, client, channel_prefix: str = "chat"):
+        self.client = client
+        self.channel_prefix = channel_prefix
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_url(cls, url: str, channel_prefix: str = "chat") -> "RedisChatBroker":
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("The redis package is required for a Redis chat broker URL") from exc
+        return cls(redis.Redis.from_url(url), channel_prefix)
+
+    async def start(self, deliver: Deliver):
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.psubscribe(f"{self.channel_prefix}:*")
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def _listen(self, deliver: Deliver):
+        async for item in self._pubsub.listen():
+            if item["type"] != "pmessage":
+                continue
+            channel = item["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            deliver(int(channel.rsplit(":", 1)[1]), json.loads(item["data"]))
+
+    async def publish(self, chat_id: int, message: dict):
+        await self.client.publish(f"{self.channel_prefix}:{chat_id}", json.dumps(message))
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.close()
+
+
+# ----------------------------
+# HUB
+# ----------------------------
+
+class ChatHub:
+    """
+    Pushes new chat messages to the sockets connected to that chat.
+
+    Delivery never waits on a socket: each subscriber has a bounded queue
+    drained by its own sender task. A subscriber that falls more than
+    max_queue messages behind is disconnected (it resyncs from history)
+    instead of slowing down or buffering unboundedly for everyone else.
+    """
+
+    def __init__(self, broker=None, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._broker = broker or LocalChatBroker()
+        self._started = False
+        self._subscribers: Dict[int, Set[ChatSubscription]] = defaultdict(set)
+
+    async def set_broker(self, broker):
+        if self._started:
+            await self._broker.stop()
+            self._started = False
+        self._broker = broker
+
+    async def _ensure_started(self):
+        if not self._started:
+            self._started = True
+            await self._broker.start(self._deliver)
+
+    async def subscribe(self, chat_id: int, user_id: int) -> ChatSubscription:
+        await self._ensure_started()
+        subscription = ChatSubscription(chat_id, user_id, self.max_queue)
+        self._subscribers[chat_id].add(subscription)
+        metrics.counter("chat_ws.connections_opened").inc()
+        return subscription
+
+    def unsubscribe(self, subscription: ChatSubscription):
+        subscribers = self._subscribers.get(subscription.chat_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.chat_id]
+        metrics.counter("chat_ws.connections_closed").inc()
+
+    async def publish(self, chat_id: int, message: dict):
+        await self._ensure_started()
+        metrics.counter("chat_ws.messages_published").inc()
+        await self._broker.publish(chat_id, message)
+
+    def _deliver(self, chat_id: int, message: dict):
+        start = time.perf_counter()
+        delivered = dropped = 0
+
+        for subscription in list(self._subscribers.get(chat_id, ())):
+            if subscription.offer(message):
+                delivered += 1
+            else:
+                dropped += 1
+
+        metrics.counter("chat_ws.messages_delivered").inc(delivered)
+        if dropped:
+            metrics.counter("chat_ws.messages_dropped").inc(dropped)
+        metrics.timer("chat_ws.fanout").observe(time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        return {
+            "connections": sum(len(s) for s in self._subscribers.values()),
+            "chats": len(self._subscribers),
+            "broker": type(self._broker).__name__,
+        }
+
+
+def _build_broker():
+    if settings.CHAT_BROKER_REDIS_URL:
+        return RedisChatBroker.from_url(settings.CHAT_BROKER_REDIS_URL)
+    return LocalChatBroker()
+
+
+chat_hub = ChatHub(_build_broker(), max_queue=settings.CHAT_WS_QUEUE_SIZE)
+
+metrics.gauge("chat_ws", chat_hub.stats)
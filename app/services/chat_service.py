@@ -1,17 +1,27 @@
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import select, update, func, case, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from typing import Optional
 from app.models.chat_m import Chat, Message
-from app.schemas.chat_schema import ChatCreate, MessageCreate
+from app.models.user_m import User
+from app.models.vendor_m import Vendor
+from app.schemas.chat_schema import ChatCreate, ChatResponse, MessageCreate, MessageResponse
+from app.services.chat_hub import chat_hub
+from app.utils.jwt_utils import decode_access_token
 from datetime import datetime
 
 class ChatService:
     @staticmethod
-    def create_or_get_chat(db: Session, chat_data: ChatCreate, consumer_id: int):
+    async def create_or_get_chat(db: AsyncSession, chat_data: ChatCreate, consumer_id: int):
         # Check if chat exists
-        chat = db.query(Chat).filter(
-            Chat.consumer_id == consumer_id,
-            Chat.vendor_id == chat_data.vendor_id,
-            Chat.event_id == chat_data.event_id
-        ).first()
+        chat = (await db.execute(
+            select(Chat).filter(
+                Chat.consumer_id == consumer_id,
+                Chat.vendor_id == chat_data.vendor_id,
+                Chat.event_id == chat_data.event_id
+            ).limit(1)
+        )).scalars().first()
         
         if not chat:
             chat = Chat(
@@ -21,12 +31,12 @@ class ChatService:
                 created_by=str(consumer_id)
             )
             db.add(chat)
-            db.commit()
-            db.refresh(chat)
+            await db.commit()
+            await db.refresh(chat)
         return chat
 
     @staticmethod
-    def send_message(db: Session, chat_id: int, sender_id: int, message_data: MessageCreate):
+    async def send_message(db: AsyncSession, chat_id: int, sender_id: int, message_data: MessageCreate):
         new_message = Message(
             chat_id=chat_id,
             sender_id=sender_id,
@@ -34,27 +44,225 @@ class ChatService:
             created_by=str(sender_id)
         )
         db.add(new_message)
-        db.commit()
-        db.refresh(new_message)
+        await db.flush()
+
+        # Inbox state: newest message, and the sender has read up to it
+        advance = ChatService._advance
+        await db.execute(
+            update(Chat)
+            .where(Chat.id == chat_id)
+            .values(
+                last_message_id=advance(Chat.last_message_id, new_message.id),
+                consumer_last_read_id=case(
+                    (Chat.consumer_id == sender_id, advance(Chat.consumer_last_read_id, new_message.id)),
+                    else_=Chat.consumer_last_read_id
+                ),
+                vendor_last_read_id=case(
+                    (Chat.consumer_id != sender_id, advance(Chat.vendor_last_read_id, new_message.id)),
+                    else_=Chat.vendor_last_read_id
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        await db.refresh(new_message)
+
+        # Push to sockets connected to this chat (after commit, so history agrees)
+        await chat_hub.publish(chat_id, ChatService.message_event(chat_id, new_message))
         return new_message
 
     @staticmethod
-    def get_my_chats(db: Session, user_id: int, role_code: str):
-        if role_code == "CONSUMER":
-            return db.query(Chat).filter(Chat.consumer_id == user_id).all()
-        elif role_code == "VENDOR":
-            return db.query(Chat).filter(Chat.vendor_id == user_id).all() # This assumes vendor_id matches user_id logic or we need to join Vendor
-            # Wait, vendor_id in Chat is Vendor table ID. user_id passed is User table ID.
-            # I must find Vendor ID from User ID first for vendor.
-            # Assuming caller handles this or we do it here.
-            # For simplicity, if role is VENDOR, we assume user_id needs resolution.
-            # However, simpler if we pass the correct ID. Let's assume the router resolves it.
-            return []
-        return []
+    def message_event(chat_id: int, message: Message) -> dict:
+        """WebSocket frame for a new message"""
+        return {
+            "type": "message",
+            "chat_id": chat_id,
+            "message": MessageResponse.model_validate(message).model_dump(mode="json"),
+        }
+
+    @staticmethod
+    async def authenticate_socket(db: AsyncSession, token: str) -> Optional[User]:
+        """Active user for a WebSocket access token (sockets can't send auth headers)"""
+        payload = decode_access_token(token or "")
+        if not payload or payload.get("sub") is None:
+            return None
+
+        user = await db.get(User, int(payload["sub"]))
+        if user is None or user.inactive:
+            return None
+        return user
+
+    @staticmethod
+    async def get_participant_chat(db: AsyncSession, chat_id: int, user_id: int) -> Optional[Chat]:
+        """The chat, if the user is its consumer or the user behind its vendor"""
+        return (await db.execute(
+            select(Chat)
+            .join(Vendor, Vendor.id == Chat.vendor_id)
+            .filter(
+                Chat.id == chat_id,
+                (Chat.consumer_id == user_id) | (Vendor.user_id == user_id)
+            )
+        )).scalars().first()
+
+    @staticmethod
+    def _advance(column, message_id: int):
+        """column = max(column, message_id), so cursors only move forward"""
+        return case((column < message_id, message_id), else_=column)
+
+    @staticmethod
+    async def get_my_chats(
+        db: AsyncSession,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Inbox: the user's chats (as consumer and as the vendor behind their
+        user) newest activity first, each with its last message and the
+        user's unread count, in one query.
+
+        Recency and read state come from columns maintained on Chat, so
+        the page is an index range scan and each unread count only counts
+        messages past the read cursor. Pass next_cursor as cursor to page.
+        """
+        vendor_id = (await db.execute(
+            select(Vendor.id).filter(Vendor.user_id == user_id)
+        )).scalar()
+
+        # A vendor's user can also chat as a consumer, so match both sides
+        # and take the read cursor of the side the user is on per row
+        owned = Chat.consumer_id == user_id
+        if vendor_id is not None:
+            owned = or_(owned, Chat.vendor_id == vendor_id)
+        last_read = case(
+            (Chat.consumer_id == user_id, Chat.consumer_last_read_id),
+            else_=Chat.vendor_last_read_id
+        )
+
+        unread = aliased(Message)
+        unread_count = (
+            select(func.count(unread.id))
+            .where(unread.chat_id == Chat.id, unread.id > last_read)
+            .correlate(Chat)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(Chat, Message, unread_count)
+            .outerjoin(Message, Message.id == Chat.last_message_id)
+            .filter(owned)
+        )
+
+        if cursor:
+            try:
+                cursor_message_id, cursor_chat_id = (int(part) for part in cursor.split(":"))
+            except ValueError:
+                raise HTTPException(400, "Invalid cursor")
+            query = query.filter(or_(
+                Chat.last_message_id < cursor_message_id,
+                and_(Chat.last_message_id == cursor_message_id, Chat.id < cursor_chat_id)
+            ))
+
+        rows = (await db.execute(
+            query.order_by(Chat.last_message_id.desc(), Chat.id.desc()).limit(limit + 1)
+        )).all()
+
+        items = []
+        for chat, last_message, count in rows[:limit]:
+            chat_out = ChatResponse.model_validate(chat)
+            if last_message is not None:
+                chat_out.last_message = MessageResponse.model_validate(last_message)
+            items.append({
+                "chat": chat_out,
+                "unread_count": count,
+                "last_message_at": last_message.timestamp if last_message is not None else None,
+            })
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_chat = rows[limit - 1][0]
+            next_cursor = f"{last_chat.last_message_id}:{last_chat.id}"
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    @staticmethod
+    async def mark_read(db: AsyncSession, chat_id: int, user_id: int, up_to: Optional[int] = None) -> dict:
+        """Move the user's read cursor forward to up_to (default: the latest message)"""
+        chat = await ChatService.get_participant_chat(db, chat_id, user_id)
+        if chat is None:
+            raise HTTPException(404, "Chat not found")
+
+        last_read = Chat.consumer_last_read_id if chat.consumer_id == user_id else Chat.vendor_last_read_id
+        target = min(up_to, chat.last_message_id) if up_to is not None else chat.last_message_id
+
+        await db.execute(
+            update(Chat)
+            .where(Chat.id == chat_id)
+            .values({last_read: ChatService._advance(last_read, target)})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        read_id = (await db.execute(select(last_read).filter(Chat.id == chat_id))).scalar()
+        unread_count = (await db.execute(
+            select(func.count(Message.id)).filter(Message.chat_id == chat_id, Message.id > read_id)
+        )).scalar()
+
+        return {"chat_id": chat_id, "last_read_id": read_id, "unread_count": unread_count}
 
     @staticmethod
-    def get_chat_history(db: Session, chat_id: int):
-        chat = db.query(Chat).filter(Chat.id == chat_id).first()
+    async def get_chat_history(db: AsyncSession, chat_id: int):
+        chat = await db.get(Chat, chat_id)
         if not chat:
             return None
         return chat
+
+    @staticmethod
+    async def get_messages(
+        db: AsyncSession,
+        chat_id: int,
+        before: Optional[int] = None,
+        after: Optional[int] = None,
+        since: Optional[datetime] = None,
+        limit: int = 50
+    ) -> dict:
+        """
+        One page of a chat's messages, oldest first, by keyset on (chat_id, id).
+
+        - no cursor: the latest `limit` messages
+        - before: the `limit` messages just older than that id (scroll back)
+        - after: the `limit` messages just newer than that id (catch up)
+        - since: messages written after that time (incremental sync); page
+          on with after=next_after
+
+        Reads at most limit + 1 rows however long the conversation is.
+        """
+        if sum(cursor is not None for cursor in (before, after, since)) > 1:
+            raise HTTPException(400, "Use only one of before, after or since")
+
+        query = select(Message).filter(Message.chat_id == chat_id)
+
+        if after is not None:
+            query = query.filter(Message.id > after).order_by(Message.id)
+        elif since is not None:
+            query = query.filter(Message.timestamp > since).order_by(Message.timestamp, Message.id)
+        else:
+            if before is not None:
+                query = query.filter(Message.id < before)
+            query = query.order_by(Message.id.desc())
+
+        rows = (await db.execute(query.limit(limit + 1))).scalars().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        newest_first = after is None and since is None
+        messages = list(reversed(rows)) if newest_first else list(rows)
+
+        return {
+            "messages": messages,
+            "has_more": has_more,
+            # Older pages exist only when we paged backwards and hit the limit;
+            # newer ones may always appear, so next_after is always set
+            "next_before": messages[0].id if messages and newest_first and has_more else None,
+            "next_after": messages[-1].id if messages else after,
+        }
@@ -13,6 +13,7 @@ from app.models.vendor_notification_m import VendorNotification
 from app.models.category_m import Category
 from app.models.event_type_m import EventType
 from app.models.vendor_bid_m import VendorBid
+from app.services.vendor_match_index import VendorMatchIndex, vendor_match_index
 
 from app.schemas.event_schema import (
     EventCreateSchema,
@@ -96,30 +97,38 @@ class ConsumerEventService:
     # --------------------------------------------------
     @staticmethod
     def _notify_matched_vendors(db: Session, event: Event) -> int:
-        required_services = set(event.required_services)
-
-        vendors = db.query(Vendor).filter(
+        required = event.required_services or []
+        query = db.query(
+            Vendor.id,
+            Vendor.offered_services,
+            Vendor.service_areas
+        ).filter(
             Vendor.status == "approved",
             Vendor.inactive == False
-        ).all()
+        )
 
-        matched_vendors = []
+        # The index narrows the candidates; until it has been loaded every
+        # approved vendor is a candidate
+        if vendor_match_index.loaded_at is not None:
+            candidate_ids = vendor_match_index.match(required, city=event.city, state=event.state)
+            query = query.filter(Vendor.id.in_(candidate_ids)) if candidate_ids else None
 
-        for vendor in vendors:
-            if required_services.issubset(set(vendor.offered_services or [])):
-                if vendor.service_areas:
-                    if event.city not in vendor.service_areas and event.state not in vendor.service_areas:
-                        continue
-                matched_vendors.append(vendor)
+        # Re-check status, services and area on the fresh rows so a vendor
+        # changed by another worker since the last refresh is never
+        # notified by mistake
+        matched_vendor_ids = [] if query is None else [
+            vendor_id for vendor_id, services, areas in query.all()
+            if VendorMatchIndex.serves(services, areas, required, city=event.city, state=event.state)
+        ]
 
         service_names = db.query(Service.name).filter(
             Service.id.in_(event.required_services)
         ).all()
         service_list = ", ".join(s[0] for s in service_names)
 
-        for vendor in matched_vendors:
+        for vendor_id in matched_vendor_ids:
             db.add(VendorNotification(
-                vendor_id=vendor.id,
+                vendor_id=vendor_id,
                 event_id=event.id,
                 notification_type="new_event_match",
                 title=f"New Event Opportunity: {event.name}",
@@ -137,7 +146,7 @@ class ConsumerEventService:
             ))
 
         db.flush()
-        return len(matched_vendors)
+        return len(matched_vendor_ids)
 
     # --------------------------------------------------
     # EVENT RESPONSE (Pydantic)
@@ -204,11 +213,6 @@ class ConsumerEventService:
 
         result = []
         for event in events:
-            bid_count = db.query(func.count(VendorBid.id)).filter(
-                VendorBid.event_id == event.id,
-                VendorBid.inactive == False
-            ).scalar()
-
             result.append(ConsumerEventListSchema(
                 id=event.id,
                 name=event.name,
@@ -220,7 +224,7 @@ class ConsumerEventService:
                 ),
                 budget=event.budget or 0,
                 biddingStatus=event.bidding_status,
-                bidCount=bid_count,
+                bidCount=event.bid_count,
                 createdAt=event.created_at
             ))
 
@@ -8,6 +8,8 @@ from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_m import Vendor
 from app.models.event_m import Event, BiddingStatus, EventStatus
 from app.models.vendor_order_m import VendorOrder
+from app.services.event_bid_counter_service import EventBidCounterService
+from app.services.analytics_rollup_service import AnalyticsRollupService
 
 from app.schemas.consumer_schema import (
     ConsumerShortlistedBidResponse,
@@ -148,18 +150,20 @@ class ConsumerSelectionService:
         # event.status = EventStatus.CONFIRMED  <-- DEFERRED until payment
         event.modified_by = consumer_user.username
 
-        db.query(VendorBid).filter(
-            VendorBid.event_id == event_id,
-            VendorBid.id != bid_id,
-            VendorBid.shortlisted == True
-        ).update(
-            {
-                "status": "rejected",
-                "rejected_at": datetime.utcnow()
-            },
-            synchronize_session=False
-        )
+        with AnalyticsRollupService.track_event_bids(db, [event.id]):
+            db.query(VendorBid).filter(
+                VendorBid.event_id == event_id,
+                VendorBid.id != bid_id,
+                VendorBid.shortlisted == True
+            ).update(
+                {
+                    "status": "rejected",
+                    "rejected_at": datetime.utcnow()
+                },
+                synchronize_session=False
+            )
 
+        EventBidCounterService.refresh(db, [event.id])
         db.commit()
 
         order = VendorOrder(
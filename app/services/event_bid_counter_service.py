@@ -0,0 +1,80 @@
+# app/services/event_bid_counter_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from typing import Iterable
+
+from app.models.event_m import Event
+from app.models.vendor_bid_m import VendorBid
+
+
+class EventBidCounterService:
+    """
+    Keeps the denormalized bid counters on Event (bid_count,
+    submitted_bid_count, shortlisted_count) in line with vendor_bids.
+
+    Callers run refresh() inside the same transaction as the bid write,
+    before commit. The counters are recomputed from the event's bids in a
+    single UPDATE, so concurrent writers and bulk status changes cannot
+    drift them the way +1/-1 increments could.
+    """
+
+    @staticmethod
+    def _count(*conditions):
+        return select(func.count(VendorBid.id)).where(
+            VendorBid.event_id == Event.id,
+            VendorBid.inactive == False,
+            *conditions
+        ).scalar_subquery()
+
+    @staticmethod
+    def refresh(db: Session, event_ids: Iterable[int]) -> None:
+        event_ids = list({e for e in event_ids if e is not None})
+        if not event_ids:
+            return
+
+        db.flush()
+        db.execute(
+            update(Event)
+            .where(Event.id.in_(event_ids))
+            .values(
+                bid_count=EventBidCounterService._count(),
+                submitted_bid_count=EventBidCounterService._count(
+                    VendorBid.status == "submitted"
+                ),
+                shortlisted_count=EventBidCounterService._count(
+                    VendorBid.shortlisted == True
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        # Loaded Event objects should not keep serving stale counters
+        for obj in db.identity_map.values():
+            if isinstance(obj, Event) and obj.id in event_ids:
+                db.expire(obj, ["bid_count", "submitted_bid_count", "shortlisted_count"])
+
+    @staticmethod
+    def reconcile(db: Session, batch_size: int = 1000) -> int:
+        """Rebuild counters for every event, in id batches. Returns events processed."""
+        processed = 0
+        last_id = 0
+
+        while True:
+            ids = [
+                event_id for (event_id,) in db.query(Event.id)
+                .filter(Event.id > last_id)
+                .order_by(Event.id)
+                .limit(batch_size)
+                .all()
+            ]
+            if not ids:
+                break
+
+            EventBidCounterService.refresh(db, ids)
+            db.commit()
+
+            processed += len(ids)
+            last_id = ids[-1]
+
+        return processed
@@ -3,6 +3,8 @@ from app.models.role_right_m import RoleRight
 from app.models.role_permission_m import RolePermission
 from app.models.menu_permission_m import MenuPermission
 from app.models.permission_m import Permission
+from app.utils.permission_utils import invalidate_role_permissions
+from app.services.role_bootstrap_service import RoleBootstrapService
 
 class PermissionSyncService:
     """
@@ -68,6 +70,8 @@ class PermissionSyncService:
                     existing.modified_by = "system"
         
         db.commit()
+        invalidate_role_permissions(role_id)
+        RoleBootstrapService.invalidate(role_id)
     
     @staticmethod
     def sync_all_role_permissions(db: Session, role_id: int):
@@ -0,0 +1,135 @@
+# app/services/role_bootstrap_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.models.menu_m import Menu
+from app.models.role_right_m import RoleRight
+from app.utils.cache_utils import TTLCache
+from app.utils.permission_utils import get_role_permission_codes
+
+# role_id -> {"menus": [...], "rights": [...], "permissions": [...]}
+_bootstrap_cache = TTLCache(
+    ttl_seconds=settings.PERMISSION_CACHE_TTL_SECONDS,
+    max_entries=256
+)
+
+# role_id -> nested menu hierarchy with rights
+_menu_tree_cache = TTLCache(
+    ttl_seconds=settings.PERMISSION_CACHE_TTL_SECONDS,
+    max_entries=256
+)
+
+
+class RoleBootstrapService:
+    """
+    Role-level payload sent to the UI after login (menus, rights and
+    permission codes) and the role's menu hierarchy. Identical for every
+    user of a role, so both are built once per role and cached until role
+    rights or menus change.
+    """
+
+    @staticmethod
+    def _load(db: Session, role_id: int) -> dict:
+        rows = db.query(RoleRight, Menu).outerjoin(
+            Menu,
+            and_(Menu.id == RoleRight.menu_id, Menu.inactive == False)
+        ).filter(
+            RoleRight.role_id == role_id,
+            RoleRight.can_view == True,
+            RoleRight.inactive == False
+        ).order_by(RoleRight.id).all()
+
+        rights_out = [{
+            "menu_id": rr.menu_id,
+            "can_view": rr.can_view,
+            "can_create": rr.can_create,
+            "can_edit": rr.can_edit,
+            "can_delete": rr.can_delete,
+        } for rr, _ in rows]
+
+        menus = sorted(
+            {m.id: m for _, m in rows if m is not None}.values(),
+            key=lambda m: (m.sort_order or 0)
+        )
+        menus_out = [{
+            "id": m.id,
+            "name": m.name,
+            "route": m.route,
+            "code": m.code,
+            "icon": m.icon,
+        } for m in menus]
+
+        return {
+            "menus": menus_out,
+            "rights": rights_out,
+            "permissions": sorted(get_role_permission_codes(db, role_id))
+        }
+
+    @staticmethod
+    def get_bootstrap(db: Session, role_id: int) -> dict:
+        return _bootstrap_cache.get_or_load(
+            role_id, lambda: RoleBootstrapService._load(db, role_id)
+        )
+
+    @staticmethod
+    def _load_menu_tree(db: Session, role_id: int) -> List[dict]:
+        # All accessible menus with their rights in one query
+        rows = db.query(Menu, RoleRight).join(
+            RoleRight, RoleRight.menu_id == Menu.id
+        ).filter(
+            RoleRight.role_id == role_id,
+            RoleRight.can_view == True,
+            RoleRight.inactive == False,
+            Menu.inactive == False
+        ).order_by(Menu.sort_order, Menu.id).all()
+
+        nodes: Dict[int, dict] = {}
+        for menu, rr in rows:
+            nodes[menu.id] = {
+                "id": menu.id,
+                "name": menu.name,
+                "code": menu.code,
+                "icon": menu.icon,
+                "route": menu.route,
+                "menu_type": menu.menu_type,
+                "sort_order": menu.sort_order,
+                "parent_id": menu.parent_id,
+                "rights": {
+                    "can_view": rr.can_view,
+                    "can_create": rr.can_create,
+                    "can_edit": rr.can_edit,
+                    "can_delete": rr.can_delete
+                },
+                "children": []
+            }
+
+        # Rows are already in sort order, so children keep it too.
+        # Menus whose parent is not accessible are left out, as before.
+        roots = []
+        for node in nodes.values():
+            parent_id = node["parent_id"]
+            if parent_id is None:
+                roots.append(node)
+            elif parent_id in nodes and parent_id != node["id"]:
+                nodes[parent_id]["children"].append(node)
+
+        return roots
+
+    @staticmethod
+    def get_menu_tree(db: Session, role_id: int) -> List[dict]:
+        """Accessible menu hierarchy (parent -> children) for a role"""
+        return _menu_tree_cache.get_or_load(
+            role_id, lambda: RoleBootstrapService._load_menu_tree(db, role_id)
+        )
+
+    @staticmethod
+    def invalidate(role_id: Optional[int] = None):
+        """Drop the cached payloads for one role, or all roles (e.g. menu changes)"""
+        for cache in (_bootstrap_cache, _menu_tree_cache):
+            if role_id is None:
+                cache.invalidate()
+            else:
+                cache.invalidate(role_id)
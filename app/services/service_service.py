@@ -2,8 +2,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from fastapi import HTTPException
 
+from typing import Dict, Iterable, List
+
 from app.models.service_m import Service
 from app.schemas.service_schema import ServiceCreate, ServiceUpdate
+from app.utils.cache_utils import TTLCache
+
+# Shared id -> service dict catalog, small enough to hold in full
+_catalog_cache = TTLCache(ttl_seconds=300, max_entries=1)
+
 
 class ServiceService:
 
@@ -21,6 +28,7 @@ class ServiceService:
         db.add(new_service)
         db.commit()
         db.refresh(new_service)
+        ServiceService.invalidate_catalog()
         return new_service
 
     @staticmethod
@@ -54,6 +62,7 @@ class ServiceService:
         service.modified_by = current_user.username
         db.commit()
         db.refresh(service)
+        ServiceService.invalidate_catalog()
         return service
 
     @staticmethod
@@ -66,3 +75,41 @@ class ServiceService:
         service.inactive = True
         service.modified_by = current_user.username
         db.commit()
+        ServiceService.invalidate_catalog()
+
+    # --------------------------------------------------
+    # SERVICE CATALOG CACHE
+    # --------------------------------------------------
+    @staticmethod
+    def _load_catalog(db: Session) -> Dict[int, dict]:
+        rows = db.query(
+            Service.id, Service.name, Service.code, Service.icon
+        ).all()
+        return {
+            r.id: {"id": r.id, "name": r.name, "code": r.code, "icon": r.icon}
+            for r in rows
+        }
+
+    @staticmethod
+    def get_catalog(db: Session) -> Dict[int, dict]:
+        """All services keyed by id, cached in-process"""
+        return _catalog_cache.get_or_load("all", lambda: ServiceService._load_catalog(db))
+
+    @staticmethod
+    def get_services_by_ids(db: Session, service_ids: Iterable[int]) -> List[dict]:
+        """
+        Resolve service ids from the cached catalog, ordered by id.
+        Reloads the catalog once if an id is unknown (e.g. created by another worker).
+        """
+        ids = sorted(set(service_ids or []))
+        catalog = ServiceService.get_catalog(db)
+
+        if any(i not in catalog for i in ids):
+            ServiceService.invalidate_catalog()
+            catalog = ServiceService.get_catalog(db)
+
+        return [catalog[i] for i in ids if i in catalog]
+
+    @staticmethod
+    def invalidate_catalog():
+        _catalog_cache.invalidate()
@@ -1,6 +1,9 @@
 # app/services/vendor_bidding_service.py
 
+import json
+
 from sqlalchemy.orm import Session
+from sqlalchemy import func, exists, select
 from fastapi import HTTPException
 from datetime import datetime
 from typing import List, Optional
@@ -10,6 +13,8 @@ from app.models.vendor_bid_m import VendorBid
 from app.models.event_m import Event, BiddingStatus
 from app.models.vendor_m import Vendor
 from app.models.service_m import Service
+from app.services.service_service import ServiceService
+from app.services.event_bid_counter_service import EventBidCounterService
 
 from app.schemas.vendor_bid_schema import (
     VendorBidCreateSchema,
@@ -22,52 +27,81 @@ from app.schemas.vendor_bid_schema import (
 
 class VendorBiddingService:
 
+    @staticmethod
+    def _requires_only(vendor_services: List[int], dialect_name: str):
+        """SQL condition: every id in Event.required_services is in vendor_services"""
+        if dialect_name == "mysql":
+            return func.json_contains(json.dumps(vendor_services), Event.required_services) == 1
+
+        # SQLite (benchmarks, tests): no required service outside the vendor's
+        required = func.json_each(Event.required_services).table_valued("value")
+        return ~exists(
+            select(1).select_from(required).where(required.c.value.not_in(vendor_services))
+        )
+
     @staticmethod
     def get_available_events(
         db: Session,
         vendor_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[int] = None
     ) -> List[VendorAvailableEventSchema]:
+        """
+        Open events the vendor can fully serve and has not bid on yet.
+
+        Service matching and the "already bid" anti-join run in SQL, so every
+        page holds up to `limit` matched events. Pass the last returned event
+        id as `cursor` to fetch the next page (keyset pagination); `skip` is
+        kept for offset-based callers and ignored when a cursor is given.
+        """
 
         vendor = db.query(Vendor).filter(Vendor.id == vendor_id).first()
         if not vendor:
             raise HTTPException(404, "Vendor not found")
 
-        vendor_services = set(vendor.offered_services or [])
+        # May be empty: such a vendor still sees events requiring no services
+        vendor_services = sorted({int(s) for s in (vendor.offered_services or [])})
 
-        events = db.query(Event).filter(
+        already_bid = exists().where(
+            VendorBid.event_id == Event.id,
+            VendorBid.vendor_id == vendor_id,
+            VendorBid.inactive == False
+        )
+
+        query = db.query(Event).filter(
             Event.bidding_status == BiddingStatus.OPEN.value,
-            Event.inactive == False
-        ).offset(skip).limit(limit).all()
+            Event.inactive == False,
+            # Every required service must be in the vendor's offered services
+            VendorBiddingService._requires_only(vendor_services, db.get_bind().dialect.name),
+            ~already_bid
+        ).order_by(Event.id.asc())
+
+        if cursor is not None:
+            query = query.filter(Event.id > cursor)
+        elif skip:
+            query = query.offset(skip)
+
+        events = query.limit(limit).all()
+
+        # One catalog lookup for all services required across the page
+        page_service_ids = {sid for event in events for sid in event.required_services}
+        services_by_id = {
+            s["id"]: s
+            for s in ServiceService.get_services_by_ids(db, page_service_ids)
+        }
 
         result: List[VendorAvailableEventSchema] = []
 
         for event in events:
-            # Check if vendor offers ALL required services
-            if not set(event.required_services).issubset(vendor_services):
-                continue
-
-            existing_bid = db.query(VendorBid).filter(
-                VendorBid.event_id == event.id,
-                VendorBid.vendor_id == vendor_id,
-                VendorBid.inactive == False
-            ).first()
-
-            if existing_bid:
-                continue
-
-            services = db.query(Service).filter(
-                Service.id.in_(event.required_services)
-            ).all()
-
             required_services = [
                 BidRequiredServiceSchema(
-                    id=s.id,
-                    name=s.name,
-                    icon=s.icon
+                    id=services_by_id[sid]["id"],
+                    name=services_by_id[sid]["name"],
+                    icon=services_by_id[sid]["icon"]
                 )
-                for s in services
+                for sid in sorted(set(event.required_services))
+                if sid in services_by_id
             ]
 
             result.append(
@@ -156,6 +190,7 @@ class VendorBiddingService:
         )
 
         db.add(bid)
+        EventBidCounterService.refresh(db, [event.id])
         db.commit()
         db.refresh(bid)
 
@@ -323,6 +358,7 @@ class VendorBiddingService:
         
         # User requested DELETE endpoint implying removal. Let's soft delete.
         bid.inactive = True
+        EventBidCounterService.refresh(db, [bid.event_id])
         db.commit()
         
         return {"message": "Bid withdrawn successfully"}
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
 from app.models.vendor_bid_m import VendorBid
 from app.models.vendor_order_m import VendorOrder
 from app.models.vendor_category_m import VendorCategory
+from app.models.event_m import Event
+from app.models.category_m import Category
 from app.schemas.vendor_dashboard_schema import (
     VendorDashboardResponse,
     VendorStats,
@@ -10,96 +12,95 @@ from app.schemas.vendor_dashboard_schema import (
     CategoryBid,
     NotificationModel,
 )
+from app.services.analytics_cache import AnalyticsCache, vendor_scope
+from app.utils.date_bucket_utils import next_bucket
 import datetime
 
+REVENUE_CHART_MONTHS = 6
 
-def get_vendor_dashboard(db: Session, vendor_id: int) -> VendorDashboardResponse:
-
-    # -----------------------------
-    # 1️⃣ Dynamic Stats
-    # -----------------------------
-    
-    # Active bids = pending + submitted
-    active_bids = (
-        db.query(func.count(VendorBid.id))
-        .filter(
-            VendorBid.vendor_id == vendor_id,
-            VendorBid.status.in_(["pending", "submitted"])
-        )
-        .scalar()
-    ) or 0
 
-    # Won contracts = bids accepted
-    won_contracts = (
-        db.query(func.count(VendorBid.id))
-        .filter(
-            VendorBid.vendor_id == vendor_id,
-            VendorBid.status == "accepted"
-        )
-        .scalar()
-    ) or 0
+def _month_starts(today: datetime.date, count: int) -> list:
+    """First day of the last `count` calendar months, oldest first"""
+    year, month = today.year, today.month - (count - 1)
+    while month < 1:
+        year, month = year - 1, month + 12
+    starts = [datetime.date(year, month, 1)]
+    while len(starts) < count:
+        starts.append(next_bucket(starts[-1], "month"))
+    return starts
 
-    # Monthly Revenue (sum of order.amount for last 30 days)
-    monthly_revenue = (
-        db.query(func.sum(VendorOrder.amount))
-        .filter(
-            VendorOrder.vendor_id == vendor_id,
-            VendorOrder.confirmed_at >= datetime.datetime.now() - datetime.timedelta(days=30)
-        )
-        .scalar()
-    ) or 0
 
-    stats = VendorStats(
-        active_bids=active_bids,
-        won_contracts=won_contracts,
-        monthly_revenue=monthly_revenue,
-    )
+@AnalyticsCache.cached("vendor.dashboard", lambda args: vendor_scope(args["vendor_id"]))
+def get_vendor_dashboard(db: Session, vendor_id: int) -> VendorDashboardResponse:
 
     # -----------------------------
-    # 2️⃣ Revenue Chart (Last 6 Months)
+    # 1️⃣ Bid Stats + Categories (one grouped query)
     # -----------------------------
-    revenue_chart = []
-    for i in range(6):
-        month_date = datetime.date.today().replace(day=1) - datetime.timedelta(days=30 * i)
-        month_name = month_date.strftime("%b")
-
-        revenue = (
-            db.query(func.sum(VendorOrder.amount))
-            .filter(
-                VendorOrder.vendor_id == vendor_id,
-                VendorOrder.confirmed_at >= month_date.replace(day=1),
-                VendorOrder.confirmed_at < (month_date.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
-            )
-            .scalar()
-        ) or 0
-
-        revenue_chart.append(
-            RevenuePoint(month=month_name, revenue=revenue)
+    # Outer joins keep bids without an event/category in the stat totals;
+    # only named categories are listed in the chart.
+    category_rows = (
+        db.query(
+            Category.name,
+            func.count(VendorBid.id),
+            func.sum(case((VendorBid.status.in_(["pending", "submitted"]), 1), else_=0)),
+            func.sum(case((VendorBid.status == "accepted", 1), else_=0)),
         )
-
-    revenue_chart.reverse()  # Show in correct order
-
-    # -----------------------------
-    # 3️⃣ Bid Categories (Count by Category)
-    # -----------------------------
-    from app.models.event_m import Event
-    from app.models.category_m import Category
-    
-    category_counts = (
-        db.query(Category.name, func.count(VendorBid.id))
-        .join(Event, VendorBid.event_id == Event.id)
-        .join(Category, Event.category_id == Category.id)
+        .outerjoin(Event, VendorBid.event_id == Event.id)
+        .outerjoin(Category, Event.category_id == Category.id)
         .filter(VendorBid.vendor_id == vendor_id)
         .group_by(Category.name)
         .all()
     )
 
+    # Active bids = pending + submitted, won contracts = bids accepted
+    active_bids = sum(int(active or 0) for _, _, active, _ in category_rows)
+    won_contracts = sum(int(won or 0) for _, _, _, won in category_rows)
+
     bid_categories = [
         CategoryBid(
             category=cat_name or 'N/A',
             count=count
         )
-        for cat_name, count in category_counts
+        for cat_name, count, _, _ in category_rows
+        if cat_name is not None
+    ]
+
+    # -----------------------------
+    # 2️⃣ Revenue Stats + Chart (one conditional-aggregation query)
+    # -----------------------------
+    # Monthly revenue = last 30 days; the chart uses calendar months
+    now = datetime.datetime.now()
+    last_30_days = now - datetime.timedelta(days=30)
+    month_starts = _month_starts(now.date(), REVENUE_CHART_MONTHS)
+    month_bounds = list(zip(month_starts, month_starts[1:] + [next_bucket(month_starts[-1], "month")]))
+
+    def revenue_between(start, end=None):
+        in_range = VendorOrder.confirmed_at >= start
+        if end is not None:
+            in_range = in_range & (VendorOrder.confirmed_at < end)
+        return func.coalesce(func.sum(case((in_range, VendorOrder.amount), else_=0)), 0)
+
+    revenue_row = (
+        db.query(
+            revenue_between(last_30_days),
+            *[revenue_between(start, end) for start, end in month_bounds]
+        )
+        .filter(
+            VendorOrder.vendor_id == vendor_id,
+            VendorOrder.confirmed_at >= min(last_30_days, datetime.datetime.combine(month_starts[0], datetime.time.min))
+        )
+        .one()
+    )
+
+    stats = VendorStats(
+        active_bids=active_bids,
+        won_contracts=won_contracts,
+        monthly_revenue=revenue_row[0] or 0,
+    )
+
+    revenue_chart = [
+        RevenuePoint(month=start.strftime("%b"), revenue=revenue or 0)
+        for (start, _), revenue in zip(month_bounds, revenue_row[1:])
     ]
 
     # -----------------------------
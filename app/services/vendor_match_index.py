@@ -0,0 +1,265 @@
+# app/services/vendor_match_index.py
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.vendor_m import Vendor
+
+
+class VendorMatchIndex:
+    """
+    In-process inverted index of approved vendors.
+
+    Keeps posting lists of vendor ids per service id and per service area
+    (city/state), so "vendors offering all of services S in area A" is a
+    set intersection instead of a scan over every vendor row.
+    Vendors without service_areas serve every area. Area names are
+    compared case-insensitively.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_service: Dict[int, Set[int]] = {}
+        self._by_area: Dict[str, Set[int]] = {}
+        self._unrestricted: Set[int] = set()
+        self._vendors: Dict[int, tuple] = {}
+        self.loaded_at: Optional[float] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+
+    # --------------------------------------------------
+    # MAINTENANCE
+    # --------------------------------------------------
+    @staticmethod
+    def _area_key(area) -> str:
+        return str(area).strip().lower()
+
+    @staticmethod
+    def is_eligible(vendor: Vendor) -> bool:
+        return vendor.status == "approved" and not vendor.inactive
+
+    def add(self, vendor_id: int, services: Iterable[int], areas: Optional[Iterable[str]]):
+        services = frozenset(int(s) for s in (services or []))
+        areas = frozenset(self._area_key(a) for a in (areas or []) if a)
+
+        with self._lock:
+            self.remove(vendor_id)
+            self._vendors[vendor_id] = (services, areas)
+
+            for service_id in services:
+                self._by_service.setdefault(service_id, set()).add(vendor_id)
+
+            if areas:
+                for area in areas:
+                    self._by_area.setdefault(area, set()).add(vendor_id)
+            else:
+                self._unrestricted.add(vendor_id)
+
+    def remove(self, vendor_id: int):
+        with self._lock:
+            entry = self._vendors.pop(vendor_id, None)
+            if entry is None:
+                return
+
+            services, areas = entry
+            for service_id in services:
+                posting = self._by_service.get(service_id)
+                if posting is not None:
+                    posting.discard(vendor_id)
+                    if not posting:
+                        del self._by_service[service_id]
+
+            for area in areas:
+                posting = self._by_area.get(area)
+                if posting is not None:
+                    posting.discard(vendor_id)
+                    if not posting:
+                        del self._by_area[area]
+
+            self._unrestricted.discard(vendor_id)
+
+    def sync_vendor(self, vendor: Vendor):
+        """Add, refresh or drop a vendor according to its current state"""
+        if self.is_eligible(vendor):
+            self.add(vendor.id, vendor.offered_services, vendor.service_areas)
+        else:
+            self.remove(vendor.id)
+
+    def clear(self):
+        with self._lock:
+            self._by_service.clear()
+            self._by_area.clear()
+            self._unrestricted.clear()
+            self._vendors.clear()
+            self.loaded_at = None
+
+    def warm(self, db: Session) -> int:
+        """Rebuild the index from the vendors table"""
+        rows = db.query(
+            Vendor.id,
+            Vendor.offered_services,
+            Vendor.service_areas
+        ).filter(
+            Vendor.status == "approved",
+            Vendor.inactive == False
+        ).all()
+
+        with self._lock:
+            self.clear()
+            for vendor_id, services, areas in rows:
+                self.add(vendor_id, services, areas)
+            self.loaded_at = time.monotonic()
+
+        return len(rows)
+
+    def start_refresher(self, session_factory: Callable[[], Session], interval: Optional[float] = None):
+        """
+        Rebuild the index every interval seconds on a daemon thread, so
+        requests never pay for a full warm-up. Other workers' vendor
+        writes reach this index at the latest one interval later.
+        """
+        if interval is None:
+            interval = settings.VENDOR_INDEX_REFRESH_SECONDS
+        if interval <= 0 or self._refresher is not None:
+            return
+
+        def run():
+            while not self._stop_refresh.wait(interval):
+                db = session_factory()
+                try:
+                    self.warm(db)
+                except Exception as e:
+                    print(f"⚠️ Vendor match index refresh failed: {e}")
+                finally:
+                    db.close()
+
+        self._stop_refresh.clear()
+        self._refresher = threading.Thread(target=run, name="vendor-match-index-refresh", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        if self._refresher is None:
+            return
+        self._stop_refresh.set()
+        self._refresher.join(timeout=5)
+        self._refresher = None
+
+    # --------------------------------------------------
+    # LOOKUP
+    # --------------------------------------------------
+    @staticmethod
+    def serves(
+        services: Optional[Iterable[int]],
+        areas: Optional[Iterable[str]],
+        required_services: Iterable[int],
+        city: Optional[str] = None,
+        state: Optional[str] = None
+    ) -> bool:
+        """match() for a single vendor row, used to re-check candidates"""
+        if not {int(s) for s in required_services} <= {int(s) for s in (services or [])}:
+            return False
+
+        areas = {VendorMatchIndex._area_key(a) for a in (areas or []) if a}
+        if not areas:
+            return True
+        return any(area and VendorMatchIndex._area_key(area) in areas for area in (city, state))
+
+    def match(
+        self,
+        required_services: Iterable[int],
+        city: Optional[str] = None,
+        state: Optional[str] = None
+    ) -> Set[int]:
+        """
+        Vendor ids offering ALL required services and serving city or state.
+        With no required services every vendor qualifies (an empty set is a
+        subset of any vendor's services), so only the area filters.
+        """
+        required = [int(s) for s in required_services]
+
+        with self._lock:
+            postings = []
+            for service_id in required:
+                posting = self._by_service.get(service_id)
+                if not posting:
+                    return set()
+                postings.append(posting)
+
+            if postings:
+                # Intersect starting from the rarest service
+                postings.sort(key=len)
+                candidates = set(postings[0])
+                for posting in postings[1:]:
+                    candidates &= posting
+                    if not candidates:
+                        return candidates
+            else:
+                candidates = set(self._vendors)
+
+            matched = candidates & self._unrestricted
+            for area in (city, state):
+                if area:
+                    matched |= candidates & self._by_area.get(self._area_key(area), set())
+
+            return matched
+
+    def __len__(self):
+        return len(self._vendors)
+
+
+vendor_match_index = VendorMatchIndex()
+
+
+# --------------------------------------------------
+# KEEP INDEX IN SYNC WITH VENDOR WRITES
+# --------------------------------------------------
+# Changes are staged per session and only applied once the transaction
+# commits, so a rolled back update never leaks into the index.
+_PENDING_KEY = "vendor_match_index_pending"
+
+
+def _stage(session: Session, vendor: Vendor, deleted: bool = False):
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    pending[vendor.id] = None if deleted else (
+        VendorMatchIndex.is_eligible(vendor),
+        list(vendor.offered_services or []),
+        list(vendor.service_areas or [])
+    )
+
+
+@event.listens_for(Vendor, "after_insert")
+@event.listens_for(Vendor, "after_update")
+def _vendor_written(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        _stage(session, target)
+
+
+@event.listens_for(Vendor, "after_delete")
+def _vendor_deleted(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        _stage(session, target, deleted=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    for vendor_id, state in pending.items():
+        if state is None or not state[0]:
+            vendor_match_index.remove(vendor_id)
+        else:
+            vendor_match_index.add(vendor_id, state[1], state[2])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
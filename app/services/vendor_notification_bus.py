@@ -0,0 +1,190 @@
+# app/services/vendor_notification_bus.py
+
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.vendor_m import Vendor
+from app.models.vendor_notification_m import VendorNotification
+from app.schemas.vendor_notification_schema import VendorNotificationListItem
+from app.utils.metrics_utils import metrics
+
+# Queued in place of a slow subscriber's backlog; its stream is then closed
+# and the client resumes from its Last-Event-ID
+OVERFLOW = object()
+
+
+class NotificationSubscription:
+    """One open stream: a bounded queue owned by the stream's event loop"""
+
+    def __init__(self, vendor_id: int, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.vendor_id = vendor_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def offer(self, item: dict):
+        """Runs on the subscription's loop"""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(item)
+            metrics.counter("notification_bus.delivered").inc()
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+            metrics.counter("notification_bus.overflows").inc()
+
+
+class VendorNotificationBus:
+    """
+    In-process fan-out of new notifications and unread-count changes to
+    the vendor's open streams.
+
+    Writers run in worker threads (sync routes), streams on the event loop,
+    so publish() hands each item to the subscriber's loop thread-safely.
+    """
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[NotificationSubscription]] = defaultdict(set)
+
+    def subscribe(self, vendor_id: int) -> NotificationSubscription:
+        subscription = NotificationSubscription(vendor_id, asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscribers[vendor_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: NotificationSubscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.vendor_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.vendor_id]
+
+    def publish(self, vendor_id: int, item: dict):
+        """Safe to call from any thread"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(vendor_id, ()))
+
+        metrics.counter("notification_bus.published").inc()
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, item)
+            except RuntimeError:
+                # Loop already closed; the stream is going away
+                self.unsubscribe(subscription)
+
+    def watched_vendors(self) -> Set[int]:
+        with self._lock:
+            return set(self._subscribers)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "streams": sum(len(s) for s in self._subscribers.values()),
+                "vendors": len(self._subscribers),
+            }
+
+    @staticmethod
+    def notification_item(notification: VendorNotification) -> dict:
+        return {
+            "type": "notification",
+            "id": notification.id,
+            "data": VendorNotificationListItem.model_validate(notification).model_dump(mode="json"),
+        }
+
+    @staticmethod
+    def unread_count_item(unread_count: int) -> dict:
+        return {"type": "unread_count", "data": {"unread_count": unread_count}}
+
+
+notification_bus = VendorNotificationBus(max_queue=settings.NOTIFICATION_SSE_QUEUE_SIZE)
+
+metrics.gauge("notification_bus", notification_bus.stats)
+
+
+def mark_unread_changed(db: Session, vendor_ids: Iterable[int]):
+    """Queue unread-count events (for bulk UPDATEs that skip mapper events)"""
+    _pending(db)["vendors"].update(vendor_ids)
+
+
+# ----------------------------
+# PUBLISH ON COMMIT
+# ----------------------------
+# Mapper events record new notification ids and vendors whose unread count
+# may have changed. Just before commit the rows and counts are read (SQL is
+# still allowed there); they are published once the commit succeeds, and
+# dropped on rollback, so a stream never shows an uncommitted notification.
+_PENDING_KEY = "vendor_notification_bus_pending"
+_READY_KEY = "vendor_notification_bus_ready"
+
+
+def _pending(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {"notification_ids": set(), "vendors": set()})
+
+
+@event.listens_for(VendorNotification, "after_insert")
+def _notification_inserted(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        pending = _pending(session)
+        pending["notification_ids"].add(target.id)
+        pending["vendors"].add(target.vendor_id)
+
+
+@event.listens_for(VendorNotification, "after_update")
+@event.listens_for(VendorNotification, "after_delete")
+def _notification_changed(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        _pending(session)["vendors"].add(target.vendor_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _collect_pending(session):
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not (pending["notification_ids"] or pending["vendors"]):
+        return
+
+    # Only vendors with an open stream (in this process) need the payloads
+    vendor_ids = pending["vendors"] & notification_bus.watched_vendors()
+    if not vendor_ids:
+        return
+
+    notifications = session.query(VendorNotification).filter(
+        VendorNotification.id.in_(pending["notification_ids"]),
+        VendorNotification.vendor_id.in_(vendor_ids)
+    ).order_by(VendorNotification.id).all() if pending["notification_ids"] else []
+
+    counts = dict(session.query(Vendor.id, Vendor.unread_notification_count).filter(
+        Vendor.id.in_(vendor_ids)
+    ).all())
+
+    ready = [(n.vendor_id, VendorNotificationBus.notification_item(n)) for n in notifications]
+    ready += [(v, VendorNotificationBus.unread_count_item(counts.get(v, 0))) for v in vendor_ids]
+    session.info[_READY_KEY] = ready
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_ready(session):
+    for vendor_id, item in session.info.pop(_READY_KEY, ()):
+        notification_bus.publish(vendor_id, item)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_READY_KEY, None)
@@ -0,0 +1,94 @@
+# app/services/vendor_notification_counter_service.py
+
+from sqlalchemy import case, event, func, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.models.vendor_m import Vendor
+from app.models.vendor_notification_m import VendorNotification
+
+
+class VendorNotificationCounterService:
+    """
+    Keeps Vendor.unread_notification_count in line with vendor_notifications.
+
+    Every change is a relative UPDATE (count = count + n) in the same
+    transaction as the notification write, so concurrent writers never
+    overwrite each other. Inserts, deletes and ORM is_read flips are picked
+    up by the mapper events below; bulk UPDATEs (mark_as_read,
+    mark_all_as_read) adjust the counter themselves.
+    """
+
+    @staticmethod
+    def adjust(connection, vendor_id: int, delta: int) -> None:
+        if vendor_id is None or delta == 0:
+            return
+        count = Vendor.__table__.c.unread_notification_count
+        connection.execute(
+            update(Vendor.__table__)
+            .where(Vendor.__table__.c.id == vendor_id)
+            .values(unread_notification_count=case((count + delta < 0, 0), else_=count + delta))
+        )
+
+    @staticmethod
+    def _count():
+        return select(func.count(VendorNotification.id)).where(
+            VendorNotification.vendor_id == Vendor.id,
+            VendorNotification.is_read == False
+        ).scalar_subquery()
+
+    @staticmethod
+    def reconcile(db: Session, batch_size: int = 1000) -> int:
+        """Recount every vendor from vendor_notifications, in id batches. Returns vendors processed."""
+        processed = 0
+        last_id = 0
+
+        while True:
+            ids = [
+                vendor_id for (vendor_id,) in db.query(Vendor.id)
+                .filter(Vendor.id > last_id)
+                .order_by(Vendor.id)
+                .limit(batch_size)
+                .all()
+            ]
+            if not ids:
+                break
+
+            db.execute(
+                update(Vendor)
+                .where(Vendor.id.in_(ids))
+                .values(unread_notification_count=VendorNotificationCounterService._count())
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            processed += len(ids)
+            last_id = ids[-1]
+
+        return processed
+
+
+# ----------------------------
+# MAPPER EVENTS
+# ----------------------------
+# Run on the flush's connection, i.e. inside the writer's transaction.
+
+@event.listens_for(VendorNotification, "after_insert")
+def _notification_inserted(mapper, connection, target):
+    if not target.is_read:
+        VendorNotificationCounterService.adjust(connection, target.vendor_id, 1)
+
+
+@event.listens_for(VendorNotification, "after_update")
+def _notification_updated(mapper, connection, target):
+    history = inspect(target).attrs.is_read.history
+    if not history.has_changes():
+        return
+    was_read = any(history.deleted)
+    if was_read != bool(target.is_read):
+        VendorNotificationCounterService.adjust(connection, target.vendor_id, -1 if target.is_read else 1)
+
+
+@event.listens_for(VendorNotification, "after_delete")
+def _notification_deleted(mapper, connection, target):
+    if not target.is_read:
+        VendorNotificationCounterService.adjust(connection, target.vendor_id, -1)
@@ -4,10 +4,13 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from fastapi import HTTPException
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
+from app.models.vendor_m import Vendor
 from app.models.vendor_notification_m import VendorNotification
 from app.schemas.vendor_notification_schema import VendorNotificationListItem
+from app.services.vendor_notification_bus import mark_unread_changed
+from app.services.vendor_notification_counter_service import VendorNotificationCounterService
 
 class VendorNotificationService:
 
@@ -33,26 +36,51 @@ class VendorNotificationService:
 
         return notifications
 
+    @staticmethod
+    def get_notifications_after(
+        db: Session,
+        vendor_id: int,
+        after_id: int,
+        limit: int = 200
+    ) -> List[VendorNotification]:
+        """Notifications newer than after_id, oldest first (stream resume)"""
+        return db.query(VendorNotification).filter(
+            VendorNotification.vendor_id == vendor_id,
+            VendorNotification.id > after_id
+        ).order_by(VendorNotification.id).limit(limit).all()
+
     @staticmethod
     def mark_as_read(
         db: Session,
         notification_id: int,
         vendor_id: int
     ):
-        notification = db.query(VendorNotification).filter(
+        # Conditional UPDATE: only the request that actually flips the row
+        # decrements the counter, even if the same one is marked twice at once
+        flipped = db.query(VendorNotification).filter(
             VendorNotification.id == notification_id,
-            VendorNotification.vendor_id == vendor_id
-        ).first()
+            VendorNotification.vendor_id == vendor_id,
+            VendorNotification.is_read == False
+        ).update(
+            {
+                "is_read": True,
+                "read_at": datetime.utcnow()
+            },
+            synchronize_session=False
+        )
 
-        if not notification:
-            raise HTTPException(404, "Notification not found")
+        if not flipped:
+            exists = db.query(VendorNotification.id).filter(
+                VendorNotification.id == notification_id,
+                VendorNotification.vendor_id == vendor_id
+            ).first()
+            if not exists:
+                raise HTTPException(404, "Notification not found")
+            return {"message": "Notification marked as read"}
 
-        if not notification.is_read:
-            notification.is_read = True
-            notification.read_at = datetime.utcnow()
-            db.commit()
-            db.refresh(notification)
-        
+        VendorNotificationCounterService.adjust(db.connection(), vendor_id, -1)
+        mark_unread_changed(db, [vendor_id])
+        db.commit()
         return {"message": "Notification marked as read"}
 
     @staticmethod
@@ -60,7 +88,9 @@ class VendorNotificationService:
         db: Session,
         vendor_id: int
     ):
-        db.query(VendorNotification).filter(
+        # Always run the UPDATE (the cached counter may lag) and move the
+        # counter by the rows actually flipped, like mark_as_read
+        flipped = db.query(VendorNotification).filter(
             VendorNotification.vendor_id == vendor_id,
             VendorNotification.is_read == False
         ).update(
@@ -70,8 +100,11 @@ class VendorNotificationService:
             },
             synchronize_session=False
         )
-        
-        db.commit()
+
+        if flipped:
+            VendorNotificationCounterService.adjust(db.connection(), vendor_id, -flipped)
+            mark_unread_changed(db, [vendor_id])
+            db.commit()
         return {"message": "All notifications marked as read"}
 
     @staticmethod
@@ -79,7 +112,18 @@ class VendorNotificationService:
         db: Session,
         vendor_id: int
     ) -> int:
-        return db.query(VendorNotification).filter(
-            VendorNotification.vendor_id == vendor_id,
-            VendorNotification.is_read == False
-        ).count()
+        """Maintained counter: a primary-key read, no COUNT over notifications"""
+        return db.query(Vendor.unread_notification_count).filter(
+            Vendor.id == vendor_id
+        ).scalar() or 0
+
+    @staticmethod
+    def get_unread_count_for_user(
+        db: Session,
+        user_id: int
+    ) -> Optional[int]:
+        """Unread count by the vendor's user (unique key); None if not a vendor"""
+        row = db.query(Vendor.unread_notification_count).filter(
+            Vendor.user_id == user_id
+        ).first()
+        return row[0] if row else None
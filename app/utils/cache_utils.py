@@ -0,0 +1,148 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry TTL and LRU eviction.
+
+    Args:
+        ttl_seconds: Lifetime of an entry (0 disables expiry)
+        max_entries: Oldest entries are evicted beyond this size
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, calling loader() and caching it on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable = _MISSING):
+        """Drop one key, or everything when no key is given"""
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every string key starting with prefix; returns how many"""
+        with self._lock:
+            keys = [k for k in self._data if isinstance(k, str) and k.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ----------------------------
+# SHARED CACHE BACKENDS
+# ----------------------------
+# Caches that may need to be shared between workers take a backend with
+# get / set / delete_prefix. LocalCacheBackend is the in-process default;
+# RedisCacheBackend works with any client exposing the redis-py calls used
+# below (get, set(ex=), scan_iter, delete), so a local stand-in can be
+# passed where Redis is not available.
+
+class LocalCacheBackend:
+    """In-process LRU + TTL backend (per worker)"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        self._cache.set(key, value, ttl_seconds)
+
+    def delete_prefix(self, prefix: str) -> int:
+        return self._cache.invalidate_prefix(prefix)
+
+    def stats(self) -> dict:
+        return {"backend": "local", **self._cache.stats()}
+
+
+class RedisCacheBackend:
+    """Backend over a Redis(-compatible) client; values are pickled"""
+
+    def __init__(self, client, ttl_seconds: float, namespace: str = "cache"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float, namespace: str = "cache") -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("The redis package is required for a Redis cache URL") from exc
+        return cls(redis.Redis.from_url(url), ttl_seconds, namespace)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raw = self.client.get(self._key(key))
+        return default if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.client.set(self._key(key), pickle.dumps(value), ex=int(ttl) if ttl else None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = list(self.client.scan_iter(match=f"{self._key(prefix)}*"))
+        if keys:
+            self.client.delete(*keys)
+        return len(keys)
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "namespace": self.namespace}
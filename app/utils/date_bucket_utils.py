@@ -0,0 +1,76 @@
+from datetime import date, datetime, timedelta
+from typing import Iterator, Union
+
+from sqlalchemy import Integer, cast, func
+
+BUCKETS = ("day", "week", "month")
+
+
+def bucket_expr(column, bucket: str, dialect_name: str):
+    """
+    SQL expression truncating a datetime column to the start of its
+    day / week (Monday) / month, for GROUP BY in the database.
+    """
+    if dialect_name == "mysql":
+        if bucket == "day":
+            return func.date(column)
+        if bucket == "week":
+            return func.subdate(func.date(column), func.weekday(column))
+        return func.date_format(column, "%Y-%m-01")
+
+    if dialect_name == "sqlite":
+        if bucket == "day":
+            return func.date(column)
+        if bucket == "week":
+            days_since_monday = (cast(func.strftime("%w", column), Integer) + 6) % 7
+            return func.date(column, func.printf("-%d days", days_since_monday))
+        return func.strftime("%Y-%m-01", column)
+
+    # PostgreSQL and others with date_trunc
+    return func.date_trunc(bucket, column)
+
+
+def to_date(value: Union[str, date, datetime]) -> date:
+    """Normalize a bucket value returned by any dialect to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def bucket_start(value: Union[date, datetime], bucket: str) -> date:
+    day = to_date(value)
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start: date, bucket: str) -> date:
+    if bucket == "day":
+        return start + timedelta(days=1)
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def iter_buckets(start: Union[date, datetime], end: Union[date, datetime], bucket: str) -> Iterator[date]:
+    """Every bucket start from the one containing start up to the one containing end"""
+    current = bucket_start(start, bucket)
+    last = bucket_start(end, bucket)
+    while current <= last:
+        yield current
+        current = next_bucket(current, bucket)
+
+
+def bucket_count(start: Union[date, datetime], end: Union[date, datetime], bucket: str) -> int:
+    days = (to_date(end) - to_date(start)).days
+    if bucket == "day":
+        return days + 1
+    if bucket == "week":
+        return days // 7 + 2
+    return days // 28 + 2
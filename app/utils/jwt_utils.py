@@ -6,12 +6,13 @@ from app.config import settings
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": now})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -20,4 +21,27 @@ def decode_access_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+def build_token_claims(
+    user,
+    role_code: str,
+    vendor_id: Optional[int] = None,
+    vendor_status: Optional[str] = None
+) -> dict:
+    """
+    Standard token payload. Besides the user id it carries enough identity
+    (role code, organization, vendor) for the stateless auth path.
+    """
+    claims = {
+        "sub": str(user.id),
+        "username": user.username,
+        "email": user.email,
+        "role_id": user.role_id,
+        "role_code": role_code,
+        "org_id": user.organization_id,
+    }
+    if vendor_id is not None:
+        claims["vendor_id"] = vendor_id
+        claims["vendor_status"] = vendor_status
+    return claims
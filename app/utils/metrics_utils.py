@@ -0,0 +1,82 @@
+import threading
+from typing import Callable, Dict
+
+
+class Counter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+
+class Timer:
+    """Keeps count, total and max of observed durations (seconds)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+                "max_ms": round(self.max * 1000, 3)
+            }
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry behind the /api/metrics endpoint.
+
+    Counters and timers are created on first use; gauges are callables
+    evaluated when a snapshot is taken (e.g. current pool usage).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._timers: Dict[str, Timer] = {}
+        self._gauges: Dict[str, Callable[[], object]] = {}
+
+    def counter(self, name: str) -> Counter:
+        with self._lock:
+            return self._counters.setdefault(name, Counter())
+
+    def timer(self, name: str) -> Timer:
+        with self._lock:
+            return self._timers.setdefault(name, Timer())
+
+    def gauge(self, name: str, fn: Callable[[], object]):
+        with self._lock:
+            self._gauges[name] = fn
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            timers = dict(self._timers)
+            gauges = dict(self._gauges)
+
+        return {
+            "counters": {name: c.snapshot() for name, c in sorted(counters.items())},
+            "timers": {name: t.snapshot() for name, t in sorted(timers.items())},
+            "gauges": {name: fn() for name, fn in sorted(gauges.items())}
+        }
+
+
+metrics = MetricsRegistry()
@@ -1,6 +1,34 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.config import settings
+from app.utils.metrics_utils import metrics
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# bcrypt releases the GIL, so a small dedicated pool keeps hashing off the
+# event loop without letting login spikes starve the default threadpool.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_pending_lock = threading.Lock()
+_pending = 0
+
+metrics.gauge("password_hash", lambda: {
+    "pending": _pending,
+    "workers": settings.PASSWORD_HASH_WORKERS,
+    "max_pending": settings.PASSWORD_HASH_MAX_PENDING
+})
 
 def hash_password(password: str) -> str:
     # bcrypt supports max 72 bytes – safely truncate
@@ -10,3 +38,46 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     safe_password = plain_password[:72]
     return pwd_context.verify(safe_password, hashed_password)
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True when the hash was made with a different bcrypt cost than configured"""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS or pwd_context.needs_update(hashed_password)
+
+async def _run_bounded(name: str, fn, *args):
+    global _pending
+
+    with _pending_lock:
+        if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            metrics.counter(f"password_hash.{name}.rejected").inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent login attempts, please retry",
+                headers={"Retry-After": "1"}
+            )
+        _pending += 1
+
+    queued_at = time.perf_counter()
+
+    def timed():
+        started_at = time.perf_counter()
+        metrics.timer(f"password_hash.{name}.queue_wait").observe(started_at - queued_at)
+        try:
+            return fn(*args)
+        finally:
+            metrics.timer(f"password_hash.{name}.work").observe(time.perf_counter() - started_at)
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, timed)
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+async def hash_password_async(password: str) -> str:
+    return await _run_bounded("hash", hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_bounded("verify", verify_password, plain_password, hashed_password)
@@ -1,7 +1,47 @@
-from typing import List
+from typing import FrozenSet, List, Optional
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.models.role_permission_m import RolePermission
 from app.models.permission_m import Permission
+from app.utils.cache_utils import TTLCache
+
+# role_id -> frozenset of active permission codes
+_role_permissions_cache = TTLCache(
+    ttl_seconds=settings.PERMISSION_CACHE_TTL_SECONDS,
+    max_entries=256
+)
+
+
+def _load_role_permission_codes(db: Session, role_id: int) -> FrozenSet[str]:
+    rows = db.query(Permission.code).join(
+        RolePermission, RolePermission.permission_id == Permission.id
+    ).filter(
+        RolePermission.role_id == role_id,
+        RolePermission.inactive == False,
+        Permission.inactive == False
+    ).all()
+    return frozenset(code for (code,) in rows)
+
+
+def get_role_permission_codes(db: Session, role_id: int) -> FrozenSet[str]:
+    """
+    Get the set of permission codes granted to a role.
+
+    Loaded with a single query and cached in-process per role; call
+    invalidate_role_permissions() after changing role permissions.
+    """
+    return _role_permissions_cache.get_or_load(
+        role_id, lambda: _load_role_permission_codes(db, role_id)
+    )
+
+
+def invalidate_role_permissions(role_id: Optional[int] = None):
+    """Drop cached permissions for one role, or for all roles"""
+    if role_id is None:
+        _role_permissions_cache.invalidate()
+    else:
+        _role_permissions_cache.invalidate(role_id)
+
 
 def check_permission(db: Session, role_id: int, permission_code: str) -> bool:
     """
@@ -15,21 +55,7 @@ def check_permission(db: Session, role_id: int, permission_code: str) -> bool:
     Returns:
         bool: True if role has permission, False otherwise
     """
-    permission = db.query(Permission).filter(
-        Permission.code == permission_code,
-        Permission.inactive == False
-    ).first()
-    
-    if not permission:
-        return False
-    
-    role_permission = db.query(RolePermission).filter(
-        RolePermission.role_id == role_id,
-        RolePermission.permission_id == permission.id,
-        RolePermission.inactive == False
-    ).first()
-    
-    return role_permission is not None
+    return permission_code in get_role_permission_codes(db, role_id)
 
 
 def get_user_permissions(db: Session, role_id: int) -> List[str]:
@@ -43,16 +69,4 @@ def get_user_permissions(db: Session, role_id: int) -> List[str]:
     Returns:
         List of permission codes
     """
-    role_permissions = db.query(RolePermission).filter(
-        RolePermission.role_id == role_id,
-        RolePermission.inactive == False
-    ).all()
-    
-    permission_ids = [rp.permission_id for rp in role_permissions]
-    
-    permissions = db.query(Permission).filter(
-        Permission.id.in_(permission_ids),
-        Permission.inactive == False
-    ).all()
-    
-    return [p.code for p in permissions]
\ No newline at end of file
+    return sorted(get_role_permission_codes(db, role_id))
@@ -0,0 +1,121 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user_m import User
+from app.models.role_m import Role
+from app.models.vendor_m import Vendor
+
+
+class TokenRevocationCache:
+    """
+    In-memory record of users whose existing tokens can no longer be trusted
+    on their own (deactivated, role/organization changed, vendor status changed).
+
+    Tokens issued at or before the recorded time are sent back through the
+    DB-backed auth path. Entries expire with ACCESS_TOKEN_EXPIRE_MINUTES since
+    older tokens are rejected anyway. The cache is per process; other workers
+    only see a change through their own writes or token expiry.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stale_before: Dict[int, float] = {}
+        self._all_stale_before: float = 0.0
+
+    def mark_user(self, user_id: int):
+        with self._lock:
+            self._stale_before[user_id] = time.time()
+            self._prune()
+
+    def mark_all(self):
+        with self._lock:
+            self._all_stale_before = time.time()
+
+    def is_stale(self, user_id: int, issued_at: Optional[float]) -> bool:
+        if issued_at is None:
+            return True
+        with self._lock:
+            if issued_at <= self._all_stale_before:
+                return True
+            marked = self._stale_before.get(user_id)
+        return marked is not None and issued_at <= marked
+
+    def _prune(self):
+        cutoff = time.time() - settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        for user_id in [u for u, ts in self._stale_before.items() if ts < cutoff]:
+            del self._stale_before[user_id]
+
+
+token_revocation = TokenRevocationCache()
+
+
+# --------------------------------------------------
+# MARK USERS ON IDENTITY-RELEVANT WRITES
+# --------------------------------------------------
+# Staged per session and applied on commit, like the vendor match index.
+_PENDING_KEY = "token_revocation_pending"
+
+_USER_IDENTITY_FIELDS = ("inactive", "role_id", "organization_id", "username", "email")
+_VENDOR_IDENTITY_FIELDS = ("status", "inactive", "user_id")
+_ROLE_IDENTITY_FIELDS = ("code", "inactive")
+
+
+def _changed(target, fields) -> bool:
+    state = inspect(target)
+    return any(state.attrs[f].history.has_changes() for f in fields)
+
+
+def _stage(target, key):
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(key)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target):
+    if _changed(target, _USER_IDENTITY_FIELDS):
+        _stage(target, target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target):
+    _stage(target, target.id)
+
+
+@event.listens_for(Vendor, "after_update")
+def _vendor_updated(mapper, connection, target):
+    if _changed(target, _VENDOR_IDENTITY_FIELDS):
+        _stage(target, target.user_id)
+
+
+@event.listens_for(Role, "after_update")
+def _role_updated(mapper, connection, target):
+    if _changed(target, _ROLE_IDENTITY_FIELDS):
+        _stage(target, "*")
+
+
+@event.listens_for(Role, "after_delete")
+def _role_deleted(mapper, connection, target):
+    _stage(target, "*")
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    if "*" in pending:
+        token_revocation.mark_all()
+    for user_id in pending - {"*"}:
+        token_revocation.mark_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,26 @@
+"""
+Shared setup for benchmarks that need a populated database.
+
+Uses DATABASE_URL when set, otherwise a throwaway SQLite file so the
+benchmarks run without a MySQL server. Import this before any app module.
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if "DATABASE_URL" not in os.environ:
+    _db_file = os.path.join(tempfile.mkdtemp(prefix="evenation-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_file}"
+os.environ.setdefault("SECRET_KEY", "benchmark-only")
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+import app.models  # noqa: E402,F401  (registers every table)
+
+
+def fresh_session():
+    """Recreate all tables and return a new session"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return SessionLocal()
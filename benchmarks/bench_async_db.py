@@ -0,0 +1,75 @@
+"""
+Load benchmark: sync Session vs AsyncSession inside `async def` handlers.
+
+Mounts two endpoints on a throwaway FastAPI app and drives them through
+httpx's ASGI transport at a fixed concurrency. Each request runs one query
+with a simulated round trip (SELECT SLEEP on MySQL). The sync endpoint blocks
+the event loop, the async one does not.
+
+    python benchmarks/bench_async_db.py --requests 400 --concurrency 50 --latency 0.02
+
+Needs DATABASE_URL pointing at MySQL and the packages in benchmarks/requirements.txt.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_async_db
+
+app = FastAPI()
+LATENCY = {"seconds": 0.02}
+
+
+@app.get("/sync")
+async def sync_query(db: Session = Depends(get_db)):
+    db.execute(text("SELECT SLEEP(:s)"), {"s": LATENCY["seconds"]})
+    return {"ok": True}
+
+
+@app.get("/async")
+async def async_query(db: AsyncSession = Depends(get_async_db)):
+    await db.execute(text("SELECT SLEEP(:s)"), {"s": LATENCY["seconds"]})
+    return {"ok": True}
+
+
+async def drive(path: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    LATENCY["seconds"] = args.latency
+
+    print(f"requests={args.requests} concurrency={args.concurrency} latency={args.latency}s")
+    for label, path in (("sync Session ", "/sync"), ("AsyncSession ", "/async")):
+        elapsed = await drive(path, args.requests, args.concurrency)
+        print(f"{label}: {elapsed:7.2f} s  {args.requests / elapsed:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+"""
+Load test: chat WebSocket fan-out with thousands of concurrent sockets.
+
+Serves the chat router with uvicorn on a local port, opens --sockets
+WebSocket connections spread over chats (--per-chat sockets each, alternating
+consumer and vendor participants), then sends --rounds messages per chat and
+measures how long each message takes to reach every socket of its chat.
+
+    python benchmarks/bench_chat_ws.py --sockets 2000 --per-chat 4 --rounds 5
+
+Uses the throwaway SQLite database from _bench_db unless DATABASE_URL is set.
+Needs the packages in benchmarks/requirements.txt.
+"""
+import argparse
+import asyncio
+import json
+import resource
+import socket
+import statistics
+import time
+
+from _bench_db import fresh_session
+
+import uvicorn
+import websockets
+from fastapi import FastAPI
+
+from app.models.chat_m import Chat
+from app.models.role_m import Role
+from app.models.user_m import User
+from app.models.vendor_m import Vendor
+from app.routes import chat_route
+from app.utils.jwt_utils import create_access_token
+from app.utils.metrics_utils import metrics
+
+app = FastAPI()
+app.include_router(chat_route.router, prefix="/api")
+
+
+def seed(chats: int):
+    """One consumer and one vendor user per chat; returns (chat_id, consumer token, vendor token)"""
+    db = fresh_session()
+    db.execute(Role.__table__.insert(), [{"id": 1, "name": "User", "code": "USER"}])
+    db.execute(User.__table__.insert(), [
+        {"id": i, "role_id": 1, "username": f"u{i}", "email": f"u{i}@bench", "password_hash": "x", "inactive": False}
+        for i in range(1, 2 * chats + 1)
+    ])
+    db.execute(Vendor.__table__.insert(), [
+        {"id": c, "user_id": chats + c, "company_name": f"Vendor {c}", "offered_services": [], "status": "approved"}
+        for c in range(1, chats + 1)
+    ])
+    db.execute(Chat.__table__.insert(), [
+        {"id": c, "consumer_id": c, "vendor_id": c, "inactive": False}
+        for c in range(1, chats + 1)
+    ])
+    db.commit()
+    db.close()
+
+    token = lambda user_id: create_access_token({"sub": str(user_id)})
+    return [(c, token(c), token(chats + c)) for c in range(1, chats + 1)]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=2000)
+    parser.add_argument("--per-chat", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--in-flight", type=int, default=50, help="messages awaiting delivery at once")
+    args = parser.parse_args()
+
+    # Client and server ends both live in this process
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, 2 * args.sockets + 256)), hard))
+
+    chats = seed(max(1, args.sockets // args.per_chat))
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning", ws_max_queue=64))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    # --- connect ---
+    semaphore = asyncio.Semaphore(100)
+
+    async def connect(chat_id: int, token: str):
+        async with semaphore:
+            return chat_id, await websockets.connect(
+                f"ws://127.0.0.1:{port}/api/chat/{chat_id}/ws?token={token}", max_queue=None, open_timeout=60
+            )
+
+    start = time.perf_counter()
+    sockets = await asyncio.gather(*(
+        connect(chat_id, (consumer, vendor)[n % 2])
+        for chat_id, consumer, vendor in chats
+        for n in range(args.per_chat)
+    ))
+    connect_seconds = time.perf_counter() - start
+
+    # --- fan-out ---
+    latencies, received, save_errors = [], 0, 0
+    received_by = {ws: 0 for _, ws in sockets}
+    expected = len(chats) * args.rounds * args.per_chat
+
+    # The first socket of each chat sends; it waits for its own copy of a
+    # message before sending the next, with --in-flight messages outstanding
+    senders = {}
+    for chat_id, ws in sockets:
+        senders.setdefault(chat_id, ws)
+    echoes = {chat_id: asyncio.Queue() for chat_id in senders}
+    in_flight = asyncio.Semaphore(args.in_flight)
+
+    async def read(chat_id, ws):
+        nonlocal received, save_errors
+        while received_by[ws] < args.rounds:
+            frame = json.loads(await ws.recv())
+            if frame["type"] == "error":
+                # e.g. SQLite busy under load; the sender retries
+                save_errors += 1
+                echoes[chat_id].put_nowait(False)
+                continue
+            latencies.append(time.perf_counter() - float(frame["message"]["content"]))
+            received += 1
+            received_by[ws] += 1
+            if ws is senders[chat_id]:
+                echoes[chat_id].put_nowait(True)
+
+    async def send(chat_id, ws):
+        for _ in range(args.rounds):
+            saved = False
+            while not saved:
+                async with in_flight:
+                    await ws.send(json.dumps({"content": repr(time.perf_counter())}))
+                    saved = await echoes[chat_id].get()
+
+    readers = [asyncio.create_task(read(chat_id, ws)) for chat_id, ws in sockets]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(chat_id, ws) for chat_id, ws in senders.items()))
+    await asyncio.wait_for(asyncio.gather(*readers), timeout=120)
+    fanout_seconds = time.perf_counter() - start
+
+    await asyncio.gather(*(ws.close() for _, ws in sockets))
+    server.should_exit = True
+    await serving
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f"sockets: {len(sockets)} over {len(chats)} chats, connected in {connect_seconds:.2f}s")
+    print(f"messages: {len(chats) * args.rounds} sent, {received}/{expected} deliveries in {fanout_seconds:.2f}s "
+          f"({received / fanout_seconds:,.0f} deliveries/s), {save_errors} saves retried")
+    print(f"delivery latency ms: p50 {pct(0.5):.1f}  p95 {pct(0.95):.1f}  p99 {pct(0.99):.1f}  "
+          f"max {latencies[-1] * 1000:.1f}  mean {statistics.mean(latencies) * 1000:.1f}")
+
+    snapshot = metrics.snapshot()
+    print({k: v for k, v in snapshot["counters"].items() if k.startswith("chat_ws")})
+    print(snapshot["timers"].get("chat_ws.fanout"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Benchmark: AdminBidReviewService.get_events_for_review.
+
+Compares the previous page-then-COUNT-per-event loop with the query on
+the denormalized Event.submitted_bid_count over synthetic events and bids.
+
+    python benchmarks/bench_events_for_review.py --events 10000 --pages 20
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from _bench_db import fresh_session, engine
+
+from sqlalchemy import event as sa_event, func
+
+from app.models.event_m import Event, BiddingStatus, EventStatus
+from app.models.vendor_bid_m import VendorBid
+from app.services.admin_bid_review_service import AdminBidReviewService
+from app.services.event_bid_counter_service import EventBidCounterService
+
+
+def seed(db, event_count: int, bid_ratio: float):
+    now = datetime.utcnow()
+    db.execute(Event.__table__.insert(), [
+        {
+            "id": i,
+            "organization_id": 1,
+            "name": f"Event {i}",
+            "category_id": 1,
+            "event_type_id": 1,
+            "event_date": now + timedelta(days=30),
+            "location": "Mumbai",
+            "budget": 100000,
+            "required_services": [1, 2],
+            "status": EventStatus.PLANNING.name,
+            "bidding_status": random.choice([BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW, BiddingStatus.CLOSED]).name,
+            "inactive": False,
+        }
+        for i in range(1, event_count + 1)
+    ])
+
+    bids = []
+    for event_id in range(1, event_count + 1):
+        if random.random() < bid_ratio:
+            for vendor_id in range(1, random.randint(1, 8) + 1):
+                bids.append({
+                    "vendor_id": vendor_id,
+                    "event_id": event_id,
+                    "total_amount": random.randint(50000, 150000),
+                    "status": "submitted",
+                    "inactive": False,
+                })
+    db.execute(VendorBid.__table__.insert(), bids)
+    db.commit()
+
+    EventBidCounterService.reconcile(db)
+    return len(bids)
+
+
+def old_get_events_for_review(db, skip, limit):
+    events = db.query(Event).filter(
+        Event.bidding_status.in_([BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW]),
+        Event.inactive == False
+    ).offset(skip).limit(limit).all()
+
+    result = []
+    for event in events:
+        bid_count = db.query(func.count(VendorBid.id)).filter(
+            VendorBid.event_id == event.id,
+            VendorBid.status == "submitted",
+            VendorBid.inactive == False
+        ).scalar()
+        if bid_count > 0:
+            result.append((event.id, bid_count))
+    return result
+
+
+def run(label, fn, db, pages, limit):
+    queries = {"count": 0}
+
+    def count(*args):
+        queries["count"] += 1
+
+    sa_event.listen(engine, "before_cursor_execute", count)
+    rows = 0
+    start = time.perf_counter()
+    for page in range(pages):
+        rows += len(fn(db, page * limit, limit))
+        db.expire_all()
+    elapsed = time.perf_counter() - start
+    sa_event.remove(engine, "before_cursor_execute", count)
+
+    print(f"{label}: {elapsed * 1000:9.1f} ms  queries={queries['count']:6d}  rows returned={rows}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--bid-ratio", type=float, default=0.3)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    db = fresh_session()
+    bid_total = seed(db, args.events, args.bid_ratio)
+    print(f"events={args.events} bids={bid_total} pages={args.pages} limit={args.limit}")
+
+    run("per-event COUNT ", old_get_events_for_review, db, args.pages, args.limit)
+    run("counter column  ", lambda d, s, l: AdminBidReviewService.get_events_for_review(d, s, l), db, args.pages, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: admin revenue trends.
+
+Compares the previous implementation (load every confirmed VendorOrder
+in the range as ORM objects and bucket with strftime in Python) with
+AnalyticsService.revenue_series, which groups by date bucket in SQL.
+
+    python benchmarks/bench_revenue_trends.py --orders 200000
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from _bench_db import fresh_session
+
+from app.models.vendor_order_m import VendorOrder
+from app.services.analytics_service import AnalyticsService
+
+
+def seed(db, order_count: int):
+    now = datetime.utcnow()
+    db.execute(VendorOrder.__table__.insert(), [
+        {
+            "vendor_id": random.randint(1, 500),
+            "order_ref": f"ORD-{i}",
+            "amount": float(random.randint(5000, 500000)),
+            "status": "confirmed" if random.random() < 0.8 else "pending_payment",
+            "confirmed_at": now - timedelta(seconds=random.randint(0, 365 * 86400)),
+            "inactive": False,
+        }
+        for i in range(order_count)
+    ])
+    db.commit()
+
+
+def old_revenue_trends(db, start_date, label_format):
+    orders = db.query(VendorOrder).filter(
+        VendorOrder.status == 'confirmed',
+        VendorOrder.confirmed_at >= start_date
+    ).order_by(VendorOrder.confirmed_at).all()
+
+    data_map = defaultdict(float)
+    for o in orders:
+        if not o.confirmed_at:
+            continue
+        data_map[o.confirmed_at.strftime(label_format)] += float(o.amount or 0)
+    return data_map
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    db = fresh_session()
+    seed(db, args.orders)
+    print(f"orders={args.orders} (about 80% confirmed, spread over one year)")
+
+    now = datetime.utcnow()
+    for time_range, days, bucket, label_format in (
+        ("week", 7, "day", "%a"),
+        ("month", 30, "day", "%d %b"),
+        ("year", 365, "month", "%b"),
+    ):
+        start = now - timedelta(days=days)
+
+        old, old_time = timed(lambda: old_revenue_trends(db, start, label_format))
+        db.expunge_all()
+        new, new_time = timed(lambda: AnalyticsService.revenue_series(db, start, now, bucket))
+
+        old_total = sum(old.values())
+        new_total = sum(p["revenue"] for p in new)
+        assert abs(old_total - new_total) < 1e-6 * max(old_total, 1), "totals disagree"
+
+        print(
+            f"{time_range:5s}  python bucketing: {old_time * 1000:8.1f} ms   "
+            f"SQL GROUP BY: {new_time * 1000:7.1f} ms  ({old_time / new_time:5.1f}x, {len(new)} points)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: event-to-vendor matching.
+
+Compares the old full scan (issubset + service_areas check per vendor)
+with VendorMatchIndex set intersections over synthetic vendors.
+
+    python benchmarks/bench_vendor_matching.py --vendors 50000 --events 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vendor_match_index import VendorMatchIndex
+
+CITIES = [
+    ("Mumbai", "Maharashtra"), ("Pune", "Maharashtra"), ("Delhi", "Delhi"),
+    ("Bengaluru", "Karnataka"), ("Chennai", "Tamil Nadu"), ("Hyderabad", "Telangana"),
+    ("Kolkata", "West Bengal"), ("Jaipur", "Rajasthan"), ("Ahmedabad", "Gujarat"),
+    ("Kochi", "Kerala"),
+]
+
+
+def make_vendors(count, service_count):
+    vendors = []
+    for vendor_id in range(1, count + 1):
+        services = random.sample(range(1, service_count + 1), random.randint(1, 6))
+        if random.random() < 0.2:
+            areas = []
+        else:
+            areas = [c for c, _ in random.sample(CITIES, random.randint(1, 3))]
+        vendors.append((vendor_id, services, areas))
+    return vendors
+
+
+def make_events(count, service_count):
+    events = []
+    for _ in range(count):
+        city, state = random.choice(CITIES)
+        services = random.sample(range(1, service_count + 1), random.randint(1, 4))
+        events.append((services, city, state))
+    return events
+
+
+def scan_match(vendors, services, city, state):
+    required = set(services)
+    matched = set()
+    for vendor_id, offered, areas in vendors:
+        if required.issubset(set(offered or [])):
+            if areas and city not in areas and state not in areas:
+                continue
+            matched.add(vendor_id)
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vendors", type=int, default=50000)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--services", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    vendors = make_vendors(args.vendors, args.services)
+    events = make_events(args.events, args.services)
+
+    index = VendorMatchIndex()
+    start = time.perf_counter()
+    for vendor_id, services, areas in vendors:
+        index.add(vendor_id, services, areas)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scan_results = [scan_match(vendors, *e) for e in events]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_results = [index.match(*e) for e in events]
+    index_time = time.perf_counter() - start
+
+    assert scan_results == index_results, "index and scan disagree"
+
+    print(f"vendors={args.vendors} events={args.events} services={args.services}")
+    print(f"index build:  {build_time * 1000:9.1f} ms")
+    print(f"full scan:    {scan_time * 1000:9.1f} ms  ({scan_time / args.events * 1000:.3f} ms/event)")
+    print(f"index lookup: {index_time * 1000:9.1f} ms  ({index_time / args.events * 1000:.3f} ms/event)")
+    print(f"speedup:      {scan_time / index_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
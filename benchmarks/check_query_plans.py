@@ -0,0 +1,95 @@
+"""
+Run EXPLAIN on the hot service queries and flag full table scans.
+
+    python benchmarks/check_query_plans.py [--vendor-id 1] [--event-id 1] [--chat-id 1]
+
+Exits with status 1 when any query plan contains a full scan (type=ALL)
+on one of the checked tables. Needs DATABASE_URL pointing at MySQL.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, text
+
+from app.database import engine
+from app.models.event_m import Event, BiddingStatus
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_notification_m import VendorNotification
+from app.models.vendor_order_m import VendorOrder
+from app.models.chat_m import Message
+
+
+def hot_queries(vendor_id: int, event_id: int, chat_id: int):
+    since = datetime.utcnow() - timedelta(days=30)
+    return {
+        "open events feed": select(Event.id).where(
+            Event.bidding_status == BiddingStatus.OPEN.value,
+            Event.inactive == False
+        ),
+        "bids of event by status": select(func.count(VendorBid.id)).where(
+            VendorBid.event_id == event_id,
+            VendorBid.status == "submitted",
+            VendorBid.inactive == False
+        ),
+        "vendor already bid": select(VendorBid.id).where(
+            VendorBid.vendor_id == vendor_id,
+            VendorBid.event_id == event_id,
+            VendorBid.inactive == False
+        ),
+        "vendor notifications": select(VendorNotification.id).where(
+            VendorNotification.vendor_id == vendor_id
+        ).order_by(VendorNotification.created_at.desc()).limit(50),
+        "vendor unread count": select(func.count(VendorNotification.id)).where(
+            VendorNotification.vendor_id == vendor_id,
+            VendorNotification.is_read == False
+        ),
+        "vendor revenue": select(func.sum(VendorOrder.amount)).where(
+            VendorOrder.vendor_id == vendor_id,
+            VendorOrder.status == "confirmed",
+            VendorOrder.confirmed_at >= since
+        ),
+        "chat messages": select(Message.id).where(
+            Message.chat_id == chat_id
+        ).order_by(Message.id),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vendor-id", type=int, default=1)
+    parser.add_argument("--event-id", type=int, default=1)
+    parser.add_argument("--chat-id", type=int, default=1)
+    args = parser.parse_args()
+
+    flagged = []
+    with engine.connect() as conn:
+        for name, query in hot_queries(args.vendor_id, args.event_id, args.chat_id).items():
+            sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+            plan = conn.execute(text(f"EXPLAIN {sql}")).mappings().all()
+
+            print(f"\n== {name}")
+            for row in plan:
+                scan = row.get("type")
+                marker = "  <-- FULL SCAN" if scan == "ALL" else ""
+                print(
+                    f"  table={row.get('table')} type={scan} key={row.get('key')} "
+                    f"rows={row.get('rows')} extra={row.get('Extra')}{marker}"
+                )
+                if scan == "ALL":
+                    flagged.append((name, row.get("table")))
+
+    if flagged:
+        print("\nFull table scans:")
+        for name, table in flagged:
+            print(f"  {name}: {table}")
+        sys.exit(1)
+
+    print("\nNo full table scans in checked queries.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Test setup: a throwaway SQLite database, recreated for every test.
+
+DATABASE_URL must be set before any app module is imported.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="evenation-test-"), "test.db")
+os.environ.setdefault("SECRET_KEY", "test-only")
+
+import pytest  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+import app.models  # noqa: E402,F401  (registers every table)
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
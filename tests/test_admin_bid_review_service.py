@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.event_m import Event, BiddingStatus, EventStatus
+from app.models.vendor_bid_m import VendorBid
+from app.schemas.vendor_bid_schema import AdminAutoShortlistSchema
+from app.services.admin_bid_review_service import AdminBidReviewService
+
+ADMIN = SimpleNamespace(username="admin")
+
+
+def _seed(db, statuses):
+    """One event per bidding status, each with three submitted bids"""
+    db.execute(Event.__table__.insert(), [{
+        "id": event_id, "organization_id": 1, "name": f"Event {event_id}", "category_id": 1,
+        "event_type_id": 1, "event_date": datetime.utcnow() + timedelta(days=30),
+        "required_services": [1], "status": EventStatus.PLANNING.name,
+        "bidding_status": status.name, "inactive": False,
+    } for event_id, status in enumerate(statuses, start=1)])
+    db.execute(VendorBid.__table__.insert(), [{
+        "event_id": event_id, "vendor_id": vendor_id, "total_amount": 1000 * vendor_id,
+        "status": "submitted", "auto_score": 10 * vendor_id, "shortlisted": False, "inactive": False,
+    } for event_id in range(1, len(statuses) + 1) for vendor_id in (1, 2, 3)])
+    db.commit()
+
+
+def test_auto_shortlist_picks_top_scores_of_reviewable_events(db):
+    _seed(db, [BiddingStatus.OPEN, BiddingStatus.UNDER_REVIEW])
+
+    result = AdminBidReviewService.auto_shortlist(db, AdminAutoShortlistSchema(event_ids=[1, 2], top_k=2), ADMIN)
+
+    assert result["shortlistedBids"] == {1: [3, 2], 2: [6, 5]}
+    assert db.get(Event, 1).bidding_status == BiddingStatus.SHORTLISTED
+
+
+@pytest.mark.parametrize("status", [BiddingStatus.CLOSED, BiddingStatus.SHORTLISTED, BiddingStatus.AWARDED])
+def test_auto_shortlist_rejects_events_past_review(db, status):
+    _seed(db, [BiddingStatus.OPEN, status])
+
+    with pytest.raises(HTTPException) as exc:
+        AdminBidReviewService.auto_shortlist(db, AdminAutoShortlistSchema(event_ids=[1, 2], top_k=2), ADMIN)
+
+    assert exc.value.status_code == 400
+    assert db.get(Event, 2).bidding_status == status
+    assert db.query(VendorBid).filter(VendorBid.shortlisted == True).count() == 0
+
+
+def test_shortlist_bids_rejects_closed_event(db):
+    _seed(db, [BiddingStatus.CLOSED])
+
+    with pytest.raises(HTTPException) as exc:
+        AdminBidReviewService.shortlist_bids(db, 1, [1, 2], ADMIN)
+
+    assert exc.value.status_code == 400
+
+
+def test_shortlist_bids_replaces_an_existing_shortlist(db):
+    _seed(db, [BiddingStatus.OPEN])
+    AdminBidReviewService.shortlist_bids(db, 1, [1, 2], ADMIN)
+
+    AdminBidReviewService.shortlist_bids(db, 1, [3, 1], ADMIN)
+
+    db.expire_all()
+    ranks = {bid.id: (bid.status, bid.shortlisted_rank) for bid in db.query(VendorBid).all()}
+    assert ranks == {1: ("shortlisted", 2), 2: ("submitted", None), 3: ("shortlisted", 1)}
+    assert db.get(Event, 1).bidding_status == BiddingStatus.SHORTLISTED
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.dependencies import get_admin_user
+from app.models.vendor_order_m import VendorOrder
+from app.routes import admin_dashboard_api
+
+app = FastAPI()
+app.include_router(admin_dashboard_api.router)
+app.dependency_overrides[get_admin_user] = lambda: None
+
+
+def test_revenue_series_accepts_offset_aware_bounds(db):
+    db.execute(VendorOrder.__table__.insert(), [{
+        "id": 1, "vendor_id": 1, "event_id": 1, "bid_id": 1, "amount": 500,
+        "status": "confirmed", "confirmed_at": datetime(2026, 3, 2, 10),
+    }])
+    db.commit()
+
+    response = TestClient(app).get("/api/admin/analytics/revenue-series", params={
+        "bucket": "day",
+        "start_date": "2026-03-02T05:30:00+05:30",
+        "end_date": "2026-03-03T00:00:00Z",
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["start"].startswith("2026-03-02T00:00:00")
+    assert [(p["revenue"], p["orders"]) for p in body["points"]] == [(500.0, 1), (0.0, 0)]
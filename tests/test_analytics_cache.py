@@ -0,0 +1,40 @@
+from app.models.review_m import Review
+from app.models.vendor_m import Vendor
+from app.services.analytics_cache import AnalyticsCache, PLATFORM_SCOPE, vendor_scope
+from app.utils.cache_utils import LocalCacheBackend
+
+
+def _cache_both_scopes():
+    AnalyticsCache.set_backend(LocalCacheBackend(ttl_seconds=60, max_entries=100))
+    for scope in (PLATFORM_SCOPE, vendor_scope(1), vendor_scope(2)):
+        AnalyticsCache.get_or_load("stats", scope, lambda: "cached")
+
+
+def _is_cached(scope):
+    return AnalyticsCache.get_or_load("stats", scope, lambda: "reloaded") == "cached"
+
+
+def test_review_commit_invalidates_vendor_and_platform_scopes(db):
+    db.execute(Vendor.__table__.insert(), [{"id": 1, "user_id": 1, "company_name": "V", "offered_services": []}])
+    db.commit()
+    _cache_both_scopes()
+
+    db.add(Review(consumer_id=1, vendor_id=1, rating=5))
+    db.commit()
+
+    assert not _is_cached(vendor_scope(1))
+    assert not _is_cached(PLATFORM_SCOPE)
+    assert _is_cached(vendor_scope(2))
+
+
+def test_rolled_back_review_keeps_cache(db):
+    db.execute(Vendor.__table__.insert(), [{"id": 1, "user_id": 1, "company_name": "V", "offered_services": []}])
+    db.commit()
+    _cache_both_scopes()
+
+    db.add(Review(consumer_id=1, vendor_id=1, rating=5))
+    db.flush()
+    db.rollback()
+
+    assert _is_cached(PLATFORM_SCOPE)
+    assert _is_cached(vendor_scope(1))
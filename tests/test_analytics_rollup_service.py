@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.models.analytics_rollup_m import VendorDailyRollup, EventDailyRollup
+from app.models.event_m import Event, BiddingStatus, EventStatus
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_order_m import VendorOrder
+from app.services.admin_bid_review_service import AdminBidReviewService
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+def _vendor_rows(db):
+    return {
+        (r.vendor_id, r.day): (r.orders_confirmed, r.revenue, r.bids_submitted, r.bids_pending, r.bids_won)
+        for r in db.query(VendorDailyRollup).all()
+        if any((r.orders_confirmed, r.revenue, r.bids_submitted, r.bids_pending, r.bids_won))
+    }
+
+
+def _event_rows(db):
+    return {(r.day, r.category_id, r.status): r.events for r in db.query(EventDailyRollup).all() if r.events}
+
+
+def _assert_matches_rebuild(db):
+    incremental = (_vendor_rows(db), _event_rows(db))
+    AnalyticsRollupService.compact(db)
+    assert incremental == (_vendor_rows(db), _event_rows(db))
+
+
+def test_order_deltas_add_to_existing_totals(db):
+    # Another writer's committed contribution already in the row
+    db.add(VendorDailyRollup(vendor_id=1, day=NOW.date(), orders_confirmed=5, revenue=500.0,
+                             bids_submitted=0, bids_pending=0, bids_won=0))
+    db.commit()
+
+    db.add(VendorOrder(vendor_id=1, amount=100, status="confirmed", confirmed_at=NOW))
+    db.commit()
+
+    assert _vendor_rows(db)[(1, NOW.date())][:2] == (6, 600.0)
+
+
+def test_order_updates_and_deletes_match_rebuild(db):
+    orders = [
+        VendorOrder(vendor_id=v, amount=100 * v, status="confirmed", confirmed_at=NOW - timedelta(days=v))
+        for v in (1, 2, 3)
+    ]
+    db.add_all(orders)
+    db.commit()
+
+    orders[0].amount = 250
+    orders[1].confirmed_at = NOW - timedelta(days=10)
+    orders[2].status = "cancelled"
+    db.commit()
+    db.delete(orders[0])
+    db.commit()
+
+    _assert_matches_rebuild(db)
+
+
+def test_rolled_back_write_is_not_counted(db):
+    db.add(VendorOrder(vendor_id=1, amount=100, status="confirmed", confirmed_at=NOW))
+    db.flush()
+    db.rollback()
+
+    db.add(VendorOrder(vendor_id=1, amount=50, status="confirmed", confirmed_at=NOW))
+    db.commit()
+
+    assert _vendor_rows(db)[(1, NOW.date())][:2] == (1, 50.0)
+
+
+def test_event_status_change_moves_between_rows(db):
+    event = Event(organization_id=1, name="E", category_id=1, event_type_id=1, event_date=NOW,
+                  required_services=[], status=EventStatus.PLANNING)
+    db.add(event)
+    db.commit()
+
+    event.status = EventStatus.COMPLETED
+    db.commit()
+
+    assert _event_rows(db) == {(NOW.date(), 1, EventStatus.COMPLETED.value): 1}
+    _assert_matches_rebuild(db)
+
+
+def test_bulk_shortlist_is_tracked(db):
+    db.add(Event(id=1, organization_id=1, name="E", category_id=1, event_type_id=1,
+                 event_date=NOW + timedelta(days=30), required_services=[],
+                 status=EventStatus.PLANNING, bidding_status=BiddingStatus.OPEN))
+    db.commit()
+    db.add_all([
+        VendorBid(event_id=1, vendor_id=v, total_amount=1000, status="submitted",
+                  submitted_at=NOW - timedelta(days=v), auto_score=v)
+        for v in (1, 2, 3)
+    ])
+    db.commit()
+
+    AdminBidReviewService.shortlist_bids(db, 1, [3, 2], SimpleNamespace(username="admin"))
+
+    pending = {key: row[3] for key, row in _vendor_rows(db).items()}
+    assert pending == {(1, (NOW - timedelta(days=1)).date()): 1,
+                       (2, (NOW - timedelta(days=2)).date()): 0,
+                       (3, (NOW - timedelta(days=3)).date()): 0}
+    _assert_matches_rebuild(db)
@@ -0,0 +1,73 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.chat_m import Chat
+from app.models.role_m import Role
+from app.models.user_m import User
+from app.models.vendor_m import Vendor
+from app.routes import chat_route
+from app.utils.jwt_utils import create_access_token
+
+app = FastAPI()
+app.include_router(chat_route.router, prefix="/api")
+
+CONSUMER, VENDOR_USER, STRANGER = 1, 2, 3
+
+
+def _seed(db):
+    db.execute(Role.__table__.insert(), [{"id": 1, "name": "User", "code": "USER"}])
+    db.execute(User.__table__.insert(), [
+        {"id": i, "role_id": 1, "username": f"u{i}", "email": f"u{i}@test", "password_hash": "x", "inactive": False}
+        for i in (CONSUMER, VENDOR_USER, STRANGER)
+    ])
+    db.execute(Vendor.__table__.insert(), [
+        {"id": 1, "user_id": VENDOR_USER, "company_name": "Vendor", "offered_services": [], "status": "approved"}
+    ])
+    db.execute(Chat.__table__.insert(), [{"id": 1, "consumer_id": CONSUMER, "vendor_id": 1, "inactive": False}])
+    db.commit()
+
+
+def _auth(user_id):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_participants_can_send_and_read(db):
+    _seed(db)
+    client = TestClient(app)
+
+    assert client.post("/api/chat/1/message", json={"content": "hi"}, headers=_auth(CONSUMER)).status_code == 201
+
+    history = client.get("/api/chat/1/history", headers=_auth(VENDOR_USER))
+    assert history.status_code == 200
+    assert [m["content"] for m in history.json()["messages"]] == ["hi"]
+
+
+def test_non_participant_cannot_send_or_read(db):
+    _seed(db)
+    client = TestClient(app)
+
+    assert client.post("/api/chat/1/message", json={"content": "hi"}, headers=_auth(STRANGER)).status_code == 404
+    assert client.get("/api/chat/1/history", headers=_auth(STRANGER)).status_code == 404
+
+    db.expire_all()
+    chat = db.get(Chat, 1)
+    assert (chat.last_message_id, chat.vendor_last_read_id) == (0, 0)
+
+
+def test_inbox_lists_vendor_users_chats_on_both_sides(db):
+    _seed(db)
+    # The vendor's user also books another vendor as a consumer
+    db.execute(Vendor.__table__.insert(), [
+        {"id": 2, "user_id": STRANGER, "company_name": "Other", "offered_services": [], "status": "approved"}
+    ])
+    db.execute(Chat.__table__.insert(), [{"id": 2, "consumer_id": VENDOR_USER, "vendor_id": 2, "inactive": False}])
+    db.commit()
+    client = TestClient(app)
+
+    client.post("/api/chat/1/message", json={"content": "to vendor"}, headers=_auth(CONSUMER))
+    client.post("/api/chat/2/message", json={"content": "to consumer"}, headers=_auth(STRANGER))
+    client.post("/api/chat/2/message", json={"content": "reply"}, headers=_auth(VENDOR_USER))
+
+    inbox = client.get("/api/chat/inbox", headers=_auth(VENDOR_USER))
+    assert inbox.status_code == 200
+    assert [(item["chat"]["id"], item["unread_count"]) for item in inbox.json()["items"]] == [(2, 0), (1, 1)]
@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.role_m import Role
+from app.models.user_m import User
+from app.routes import metrics_route
+from app.utils.jwt_utils import create_access_token
+
+app = FastAPI()
+app.include_router(metrics_route.router, prefix="/api")
+
+
+def _seed(db):
+    db.execute(Role.__table__.insert(), [
+        {"id": 1, "name": "Admin", "code": "ADMIN"},
+        {"id": 2, "name": "User", "code": "USER"},
+    ])
+    db.execute(User.__table__.insert(), [
+        {"id": i, "role_id": i, "username": f"u{i}", "email": f"u{i}@test", "password_hash": "x", "inactive": False}
+        for i in (1, 2)
+    ])
+    db.commit()
+
+
+def _auth(user_id):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_metrics_require_admin(db):
+    _seed(db)
+    client = TestClient(app)
+
+    assert client.get("/api/metrics/").status_code == 401
+    assert client.get("/api/metrics/", headers=_auth(2)).status_code == 403
+
+    response = client.get("/api/metrics/", headers=_auth(1))
+    assert response.status_code == 200
+    assert "counters" in response.json()
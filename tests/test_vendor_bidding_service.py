@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.event_m import Event, BiddingStatus, EventStatus
+from app.models.vendor_bid_m import VendorBid
+from app.models.vendor_m import Vendor
+from app.schemas.vendor_bid_schema import VendorBidCreateSchema
+from app.services.vendor_bidding_service import VendorBiddingService
+
+
+def _seed(db, required_services=(1, 2)):
+    db.execute(Vendor.__table__.insert(), [{
+        "id": 1, "user_id": 1, "company_name": "Vendor", "offered_services": [1, 2, 3],
+        "status": "approved", "rating": 4.5, "completed_events": 3, "year_established": "2015",
+    }])
+    db.execute(Event.__table__.insert(), [{
+        "id": 1, "organization_id": 1, "name": "Launch", "category_id": 1, "event_type_id": 1,
+        "event_date": datetime.utcnow() + timedelta(days=30), "budget": 100000,
+        "required_services": list(required_services), "status": EventStatus.PLANNING.name,
+        "bidding_status": BiddingStatus.OPEN.name, "inactive": False,
+    }])
+    db.commit()
+
+
+def _bid(**overrides):
+    return VendorBidCreateSchema(**{"event_id": 1, "total_amount": Decimal("90000"), **overrides})
+
+
+def test_submit_bid_saves_bid_and_updates_event_counters(db):
+    _seed(db)
+
+    result = VendorBiddingService.submit_bid(db, 1, _bid())
+
+    bid = db.get(VendorBid, result["bid_id"])
+    assert result["status"] == "submitted"
+    assert (bid.event_id, bid.vendor_id, bid.status) == (1, 1, "submitted")
+
+    event = db.get(Event, 1)
+    db.refresh(event)
+    assert (event.bid_count, event.submitted_bid_count) == (1, 1)
+
+
+def test_submit_bid_rejects_second_bid(db):
+    _seed(db)
+    VendorBiddingService.submit_bid(db, 1, _bid())
+
+    with pytest.raises(HTTPException) as exc:
+        VendorBiddingService.submit_bid(db, 1, _bid())
+    assert exc.value.status_code == 400
+
+
+def test_submit_bid_requires_offered_services(db):
+    _seed(db, required_services=(1, 4))
+
+    with pytest.raises(HTTPException) as exc:
+        VendorBiddingService.submit_bid(db, 1, _bid())
+    assert exc.value.status_code == 400
+
+
+def test_get_available_events_matches_required_services(db):
+    _seed(db)
+    db.execute(Event.__table__.insert(), [{
+        "id": event_id, "organization_id": 1, "name": f"Event {event_id}", "category_id": 1,
+        "event_type_id": 1, "event_date": datetime.utcnow() + timedelta(days=30), "budget": 100000,
+        "required_services": services, "status": EventStatus.PLANNING.name,
+        "bidding_status": BiddingStatus.OPEN.name, "inactive": False,
+    } for event_id, services in [(2, [3]), (3, [1, 4]), (4, [2, 3, 1]), (5, [])]])
+    db.commit()
+
+    assert [e.id for e in VendorBiddingService.get_available_events(db, 1)] == [1, 2, 4, 5]
+
+    VendorBiddingService.submit_bid(db, 1, _bid())
+    assert [e.id for e in VendorBiddingService.get_available_events(db, 1, cursor=2)] == [4, 5]
+
+
+def test_get_available_events_for_vendor_without_services(db):
+    _seed(db)
+    db.execute(Event.__table__.insert(), [{
+        "id": 2, "organization_id": 1, "name": "Open brief", "category_id": 1,
+        "event_type_id": 1, "event_date": datetime.utcnow() + timedelta(days=30), "budget": 100000,
+        "required_services": [], "status": EventStatus.PLANNING.name,
+        "bidding_status": BiddingStatus.OPEN.name, "inactive": False,
+    }])
+    db.execute(Vendor.__table__.update().values(offered_services=[]))
+    db.commit()
+
+    assert [e.id for e in VendorBiddingService.get_available_events(db, 1)] == [2]
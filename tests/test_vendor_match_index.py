@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from app.services.vendor_match_index import VendorMatchIndex
+
+
+def _index():
+    index = VendorMatchIndex()
+    index.add(1, [1, 2], ["Mumbai"])
+    index.add(2, [1], ["Pune"])
+    index.add(3, [1, 2, 3], None)  # serves every area
+    return index
+
+
+def test_match_requires_all_services_in_area():
+    index = _index()
+
+    assert index.match([1, 2], city="Mumbai") == {1, 3}
+    assert index.match([1], city="Pune") == {2, 3}
+    assert index.match([4], city="Mumbai") == set()
+
+
+def test_match_without_required_services_returns_every_vendor_in_area():
+    index = _index()
+
+    assert index.match([], city="Mumbai") == {1, 3}
+    assert index.match([], city="Delhi", state="maharashtra") == {3}
+
+
+def test_serves_agrees_with_match():
+    index = _index()
+
+    for required, city, state in [([1, 2], "Mumbai", None), ([1], "pune", None), ([], "Delhi", "Maharashtra")]:
+        matched = index.match(required, city=city, state=state)
+        for vendor_id, (services, areas) in index._vendors.items():
+            assert VendorMatchIndex.serves(services, areas, required, city, state) == (vendor_id in matched)
+
+
+def test_notify_rechecks_index_candidates_against_the_db(db, monkeypatch):
+    from app.models.vendor_m import Vendor
+    from app.models.vendor_notification_m import VendorNotification
+    from app.services import consumer_event_service
+
+    # Vendor 2 moved to Pune on another worker; this index has not seen it yet
+    db.execute(Vendor.__table__.insert(), [
+        {"id": 1, "user_id": 1, "company_name": "A", "offered_services": [1], "service_areas": ["Mumbai"], "status": "approved"},
+        {"id": 2, "user_id": 2, "company_name": "B", "offered_services": [1], "service_areas": ["Pune"], "status": "approved"},
+    ])
+    index = VendorMatchIndex()
+    index.add(1, [1], ["Mumbai"])
+    index.add(2, [1], ["Mumbai"])
+    index.loaded_at = 0.0
+    monkeypatch.setattr(consumer_event_service, "vendor_match_index", index)
+
+    event = SimpleNamespace(
+        id=1, name="Launch", required_services=[1], city="MUMBAI", state=None,
+        budget=1000, bidding_deadline=None
+    )
+    matched = consumer_event_service.ConsumerEventService._notify_matched_vendors(db, event)
+
+    assert matched == 1
+    assert [n.vendor_id for n in db.query(VendorNotification).all()] == [1]
@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.role_m import Role
+from app.models.user_m import User
+from app.routes import vendor_notification_route
+from app.utils.jwt_utils import create_access_token
+
+app = FastAPI()
+app.include_router(vendor_notification_route.router, prefix="/api")
+
+
+def _seed(db):
+    db.execute(Role.__table__.insert(), [{"id": 1, "name": "User", "code": "USER"}])
+    db.execute(User.__table__.insert(), [
+        {"id": 1, "role_id": 1, "username": "u1", "email": "u1@test", "password_hash": "x", "inactive": False}
+    ])
+    db.commit()
+
+
+def test_stream_requires_a_token(db):
+    _seed(db)
+    client = TestClient(app)
+
+    assert client.get("/api/vendor/notifications/stream").status_code == 401
+    assert client.get("/api/vendor/notifications/stream", params={"token": "garbage"}).status_code == 401
+
+
+def test_stream_checks_permission_for_query_and_header_tokens(db):
+    _seed(db)
+    client = TestClient(app)
+    token = create_access_token({"sub": "1"})
+
+    by_query = client.get("/api/vendor/notifications/stream", params={"token": token})
+    by_header = client.get("/api/vendor/notifications/stream", headers={"Authorization": f"Bearer {token}"})
+
+    for response in (by_query, by_header):
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Missing required permission: vendor.profile.view"
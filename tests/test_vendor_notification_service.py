@@ -0,0 +1,37 @@
+from app.models.vendor_m import Vendor
+from app.models.vendor_notification_m import VendorNotification
+from app.services.vendor_notification_service import VendorNotificationService
+
+
+def _seed(db, unread, counter):
+    db.execute(Vendor.__table__.insert(), [{
+        "id": 1, "user_id": 1, "company_name": "Vendor", "offered_services": [1],
+        "status": "approved", "unread_notification_count": counter,
+    }])
+    db.execute(VendorNotification.__table__.insert(), [{
+        "vendor_id": 1, "notification_type": "new_event_match", "title": f"N{i}",
+        "message": "m", "is_read": False,
+    } for i in range(unread)])
+    db.commit()
+
+
+def _unread_rows(db):
+    return db.query(VendorNotification).filter(VendorNotification.is_read == False).count()
+
+
+def test_mark_all_as_read_moves_counter_by_rows_flipped(db):
+    _seed(db, unread=3, counter=3)
+
+    VendorNotificationService.mark_all_as_read(db, 1)
+
+    assert _unread_rows(db) == 0
+    assert VendorNotificationService.get_unread_count(db, 1) == 0
+
+
+def test_mark_all_as_read_does_not_trust_a_lagging_counter(db):
+    _seed(db, unread=2, counter=0)
+
+    VendorNotificationService.mark_all_as_read(db, 1)
+
+    assert _unread_rows(db) == 0
+    assert VendorNotificationService.get_unread_count(db, 1) == 0